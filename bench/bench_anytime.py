@@ -0,0 +1,84 @@
+# Benchmark: waktu keputusan per tick dengan pencarian penuh (CandidateIndex.select)
+# vs AnytimePlanner dengan deadline, seperti plan_deadline_ms di riveldo. Board besar
+# dengan sedikit diamond, jadi BFS penuh sering jauh. Dilaporkan latensi, deadline
+# miss, kedalaman rencana, dan seberapa sering target-nya sama dengan pencarian penuh.
+#
+#   python bench/bench_anytime.py [--size 300] [--diamonds 40] [--ticks 200] [--deadline 5]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.anytime import AnytimePlanner
+from mhscuti.board_state import BoardState
+from mhscuti.candidates import CandidateIndex
+from mhscuti.records import Position
+from mhscuti.routing import Router
+from mhscuti.scoring import GREEDY_VALUE
+from mhscuti.simulator import Game
+
+HORIZONS = (8, 16, 32, 64, 128, None)  # seperti BotClient.PLAN_HORIZONS di riveldo
+
+
+def refine(index):
+    def rounds(stop, grid, graph, start):
+        return index.refine(grid, start, HORIZONS, k=2, graph=graph, stop=stop)
+    return rounds
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--diamonds", type=int, default=40)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--deadline", type=float, default=5.0, help="ms")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    game = Game(seed=rnd.randrange(1 << 30), width=args.size, height=args.size,
+                walls=args.size * args.size // 10, diamonds=args.diamonds)
+    payloads = game.random_walk(args.ticks, rnd)
+    print(f"{args.size}x{args.size}, {args.diamonds} diamonds, {args.ticks} ticks, deadline {args.deadline:g} ms")
+
+    index = CandidateIndex(GREEDY_VALUE)
+    planner = AnytimePlanner(refine(index), args.deadline)
+    router = Router()
+    board = BoardState()
+    full_ms, anytime_ms = [], []
+    same = 0
+    for data in payloads:
+        board = BoardState(data, previous=board)
+        # Graph routing dibangun di luar pengukuran, seperti di update_board
+        graph = router.sync(board)
+        index.sync(board)
+        start = Position.of(board.first_bot()["position"])
+
+        t0 = time.perf_counter()
+        full = index.select(board.grid, start, k=2, graph=graph)
+        t1 = time.perf_counter()
+        answer = planner.plan(board.grid, graph, start)
+        t2 = time.perf_counter()
+        full_ms.append((t1 - t0) * 1000)
+        anytime_ms.append((t2 - t1) * 1000)
+        if answer.decision is not None and answer.decision.targets[:1] == full.targets[:1]:
+            same += 1
+
+    for name, times in (("full search", full_ms), ("anytime", anytime_ms)):
+        print(f"  {name:11s}: p50 {percentile(times, 0.5):7.3f} ms  p99 {percentile(times, 0.99):7.3f} ms  "
+              f"max {max(times):7.3f} ms")
+    print(f"  anytime    : {planner.summary()}")
+    print(f"  same best target as the full search on {same}/{len(payloads)} ticks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Micro-benchmark: pilih diamond terbaik per tick dengan daftar kandidat baru +
+# skor semua diamond + top-k (cara lama) vs CandidateIndex yang diperbarui dari
+# delta board. Board besar dengan banyak diamond, bot berjalan acak.
+#
+#   python bench/bench_candidates.py [--size 100] [--diamonds 2000] [--ticks 300]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.board_state import DIAMOND, BoardState
+from mhscuti.candidates import CandidateIndex
+from mhscuti.multi_target import MultiTargetBFS
+from mhscuti.records import Position
+from mhscuti.scoring import PRESETS
+from mhscuti.simulator import Game
+
+
+def rebuild_tick(board, preset, index):
+    # Seperti plan_next sebelumnya: list kandidat, bobot dan nilai semua diamond
+    position = Position.of(board.first_bot()["position"])
+    diamonds = board.records(DIAMOND)
+    weights = preset.weights([d.points for d in diamonds], [d.type for d in diamonds])
+    weight_of = weights.tolist()
+    max_weight = max(weight_of)
+    reach = MultiTargetBFS(
+        board.grid, position, [d.position for d in diamonds], k=1,
+        score=lambda i, dist: preset.value(weight_of[i], dist),
+        bound=lambda dist: preset.value(max_weight, dist))
+    values = [preset.value(weight, float("inf") if dist is None else dist)
+              for weight, dist in zip(weight_of, reach.distances)]
+    best = max(range(len(values)), key=values.__getitem__)
+    return diamonds[best], reach.path(best)
+
+
+def index_tick(board, preset, index):
+    index.sync(board)
+    selection = index.select(board.grid, Position.of(board.first_bot()["position"]), k=1)
+    return selection.targets[0], selection.path(0)
+
+
+def run(payloads, preset, tick):
+    # Board (dan grid-nya) dibangun di luar pengukuran, seperti di update_board
+    index = CandidateIndex(preset)
+    board = BoardState()
+    elapsed = 0.0
+    picks = []
+    for data in payloads:
+        board = BoardState(data, previous=board)
+        board.grid
+        start = time.perf_counter()
+        picks.append(tick(board, preset, index))
+        elapsed += time.perf_counter() - start
+    return elapsed / len(payloads) * 1000, picks, index
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--diamonds", type=int, default=2000)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    game = Game(seed=rnd.randrange(1 << 30), width=args.size, height=args.size,
+                walls=args.size * args.size // 10, diamonds=args.diamonds)
+    payloads = game.random_walk(args.ticks, rnd)
+    print(f"{args.size}x{args.size}, {args.diamonds} diamonds, {args.ticks} ticks")
+    for name, preset in PRESETS.items():
+        old_ms, expected, _ = run(payloads, preset, rebuild_tick)
+        new_ms, got, index = run(payloads, preset, index_tick)
+        assert got == expected, name
+        stats = index.stats()
+        print(f"  {name:18s}: rebuild {old_ms:7.3f} ms/tick  index {new_ms:7.3f} ms/tick  "
+              f"({old_ms / new_ms:5.1f}x, {stats['updates']} updates, {stats['rebuilds']} rebuilds)")
+
+
+if __name__ == "__main__":
+    main()
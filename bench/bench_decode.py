@@ -0,0 +1,86 @@
+# Micro-benchmark: decode body response move dengan json standar, library cepat
+# (kalau terpasang) dan SelectiveDecoder, untuk beberapa ukuran board.
+# Mengukur waktu per decode dan puncak alokasi (tracemalloc) per decode.
+#
+#   python bench/bench_decode.py [--sizes 15 30 60 100] [--ticks 100] [--radius 5] [--bots 4]
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.decoding import BACKEND, SelectiveDecoder, loads
+from mhscuti.simulator import Game
+
+
+def make_bodies(size, ticks, bots, rnd):
+    # Body response move (bytes, format compact seperti server asli) selama satu permainan;
+    # bot lain ikut bergerak acak, jadi objek yang berubah tidak hanya bot kita
+    game = Game(seed=rnd.randrange(1 << 30), width=size, height=size,
+                walls=size * size // 6, diamonds=size * 2)
+    payloads = game.random_walk(ticks, rnd, others=[f"other{i}" for i in range(bots - 1)])
+    return [json.dumps(payload, separators=(",", ":")).encode() for payload in payloads]
+
+
+def measure(decode, bodies):
+    start = time.perf_counter()
+    for body in bodies:
+        decode(body)
+    elapsed = (time.perf_counter() - start) / len(bodies) * 1000
+
+    tracemalloc.start()
+    peak = 0
+    for body in bodies[:10]:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        data = decode(body)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        del data
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 30, 60, 100])
+    parser.add_argument("--ticks", type=int, default=100)
+    parser.add_argument("--radius", type=int, default=5)
+    parser.add_argument("--bots", type=int, default=4, help="bot di board, termasuk bot kita")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    print(f"fast backend: {BACKEND}")
+    for size in args.sizes:
+        bodies = make_bodies(size, args.ticks, args.bots, rnd)
+        objects = len(json.loads(bodies[0])["gameObjects"])
+        kib = sum(map(len, bodies)) / len(bodies) / 1024
+
+        decoder = SelectiveDecoder(args.radius)
+        decoder.decode(bodies[0], full=True)
+        decoder.kept = decoder.skipped = 0
+        for body in bodies[1:]:
+            decoder.decode(body)
+        kept = decoder.kept / (len(bodies) - 1)
+        skipped = decoder.skipped / (len(bodies) - 1)
+        decoders = [("json", json.loads)]
+        if BACKEND != "json":
+            decoders.append((BACKEND, loads))
+        decoders.append((f"selective r={args.radius}", decoder.decode))
+
+        print(f"{size}x{size}, {objects} objects, {kib:.0f} KiB/body, "
+              f"selective decodes {kept:.1f} and skips {skipped:.1f} objects per tick")
+        base = None
+        for name, decode in decoders:
+            ms, peak = measure(decode, bodies)
+            base = base or ms
+            print(f"  {name:14s}: {ms:7.3f} ms/decode ({base / ms:4.1f}x)  peak {peak:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
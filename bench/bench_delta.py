@@ -0,0 +1,86 @@
+# Micro-benchmark: bangun ulang BoardState penuh per response vs decode delta
+# terhadap snapshot sebelumnya, di board besar dengan sedikit perubahan per tick.
+#
+#   python bench/bench_delta.py [--size 100] [--ticks 200]
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.board_state import BoardState
+
+
+def make_ticks(size, ticks, rnd):
+    # Payload JSON per tick: bot-bot bergerak satu langkah, kadang satu diamond
+    # diambil dan diganti di tempat lain (seperti board sungguhan)
+    free = [(x, y) for x in range(size) for y in range(size)]
+    rnd.shuffle(free)
+    walls = free[:size * size // 6]
+    diamonds = {cell: rnd.choice((1, 2)) for cell in free[len(walls):len(walls) + size * 2]}
+    bots = [list(cell) for cell in free[len(walls) + size * 2:len(walls) + size * 2 + 8]]
+    ids = {}
+
+    def obj_id(key):
+        return ids.setdefault(key, len(ids) + 1)
+
+    payloads = []
+    for tick in range(ticks):
+        for bot in bots:
+            bot[0] = min(size - 1, max(0, bot[0] + rnd.choice((-1, 1))))
+        if rnd.random() < 0.3:
+            cell = rnd.choice(list(diamonds))
+            del diamonds[cell]
+            diamonds[rnd.choice(free[len(walls):])] = rnd.choice((1, 2))
+        objects = []
+        for i, (x, y) in enumerate(bots):
+            objects.append({"id": f"bot{i}", "type": "BotGameObject", "position": {"x": x, "y": y},
+                            "properties": {"name": f"bot{i}", "diamonds": 0, "millisecondsLeft": 60000 - tick * 100}})
+        for cell, points in diamonds.items():
+            objects.append({"id": obj_id(("d", cell, points)), "type": "DiamondGameObject",
+                            "position": {"x": cell[0], "y": cell[1]}, "properties": {"points": points}})
+        for cell in walls:
+            objects.append({"id": obj_id(("w", cell)), "type": "WallGameObject",
+                            "position": {"x": cell[0], "y": cell[1]}, "properties": {}})
+        payloads.append(json.dumps({"id": 1, "width": size, "height": size, "gameObjects": objects}))
+    return payloads
+
+
+def run(payloads, incremental):
+    # Waktu index + grid + layout_key per tick (yang dipakai semua client tiap response)
+    decoded = [json.loads(p) for p in payloads]
+    board = BoardState()
+    changes = 0
+    start = time.perf_counter()
+    for data in decoded:
+        board = BoardState(data, previous=board if incremental else None)
+        board.grid
+        board.layout_key
+        if board.delta is not None:
+            changes += len(board.delta)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(decoded) * 1000, changes / len(decoded)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    payloads = make_ticks(args.size, args.ticks, random.Random(args.seed))
+    objects = len(json.loads(payloads[0])["gameObjects"])
+    full_ms, _ = run(payloads, incremental=False)
+    delta_ms, changes = run(payloads, incremental=True)
+    print(f"{args.size}x{args.size}, {objects} objects, {changes:.1f} changes/tick")
+    print(f"  full rebuild : {full_ms:7.3f} ms/tick")
+    print(f"  delta decode : {delta_ms:7.3f} ms/tick  ({full_ms / delta_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Benchmark: seberapa sering target pilihan BatchEngine (jarak Manhattan) sama
+# dengan CandidateIndex.select di client (BFS lewat routing graph, teleport ikut)
+# pada board yang sama. Game di engine dijalankan dengan strateginya sendiri,
+# lalu di beberapa tick tiap game diubah jadi payload dan dibandingkan.
+#
+#   python bench/bench_engine.py [--games 200] [--steps 300] [--every 25] [--walls 0 20]
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from mhscuti.board_state import BASE, BUTTON, DIAMOND, TELEPORT, BoardState
+from mhscuti.candidates import CandidateIndex
+from mhscuti.engine import STRATEGIES, BatchEngine
+from mhscuti.records import Position
+from mhscuti.routing import RoutingGraph
+
+
+def payload(engine, g, b=0):
+    # Game g dalam bentuk response server, bot b di urutan pertama
+    width = engine.width
+
+    def pos(cell):
+        return {"x": int(cell % width), "y": int(cell // width)}
+
+    base = engine.base[g, b]
+    objects = [
+        {"id": "bot", "type": "BotGameObject", "position": pos(engine.pos[g, b]),
+         "properties": {"diamonds": int(engine.carry[g, b]), "inventorySize": engine.inventory_size,
+                        "name": "bench", "base": pos(base)}},
+        {"id": "base", "type": BASE, "position": pos(base), "properties": {"name": "bench", "ownerId": "bot"}},
+    ]
+    for cell in np.flatnonzero(engine.diamonds[g]):
+        objects.append({"id": f"d{cell}", "type": DIAMOND, "position": pos(cell),
+                        "properties": {"points": int(engine.diamonds[g, cell])}})
+    for cell in np.flatnonzero(engine.tp_exit[g] >= 0):
+        pair = min(cell, engine.tp_exit[g, cell])
+        objects.append({"id": f"t{cell}", "type": TELEPORT, "position": pos(cell),
+                        "properties": {"pairId": int(pair)}})
+    if engine.button[g] >= 0:
+        objects.append({"id": "button", "type": BUTTON, "position": pos(engine.button[g]), "properties": {}})
+    for cell in np.flatnonzero(engine.walls[g]):
+        objects.append({"id": f"w{cell}", "type": "WallGameObject", "position": pos(cell), "properties": {}})
+    return {"width": width, "height": engine.height, "gameObjects": objects}
+
+
+def client_target(board, strategy, carry, inventory_size):
+    # Pilihan client: diamond yang muat (+ base/tombol/teleport untuk greedy_value)
+    index = CandidateIndex(strategy.preset)
+    index.sync(board)
+    extra = []
+    if strategy.extras:
+        records = list(board.records(TELEPORT))
+        total = len(board.records(DIAMOND))
+        high = sum(1 for d in board.records(DIAMOND) if d.points > 1)
+        if board.button is not None and (total < 10 or high < 3):
+            records += list(board.records(BUTTON))
+        if carry > 0:
+            records += list(board.records(BASE))
+        weights = strategy.preset.weights([r.points for r in records], [r.type for r in records],
+                                          inventory=carry, inventory_size=inventory_size,
+                                          has_red_button=True).tolist()
+        extra = [(r, w) for r, w in zip(records, weights) if w > 0]
+    free = inventory_size - carry
+    start = Position.of(board.first_bot()["position"])
+    graph = RoutingGraph(board.grid, board.teleport_pairs)
+    selection = index.select(board.grid, start, k=1, graph=graph, extra=extra,
+                             where=lambda d: d.points <= free)
+    return selection.targets[0].position if selection.targets else None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("strategies", nargs="*", default=list(STRATEGIES))
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--every", type=int, default=25, help="bandingkan tiap N tick")
+    parser.add_argument("--walls", type=int, nargs="+", default=[0, 20])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for walls in args.walls:
+        print(f"15x15, {walls} walls, {args.games} games, compared every {args.every} of {args.steps} ticks")
+        for name in args.strategies:
+            strategy = STRATEGIES[name]
+            engine = BatchEngine(games=args.games, walls=walls, seed=args.seed)
+            same = compared = 0
+            for step in range(args.steps):
+                if step % args.every == 0:
+                    targets = strategy.target(engine, 0)
+                    for g in range(engine.games):
+                        carry = int(engine.carry[g, 0])
+                        if carry >= engine.inventory_size:
+                            continue   # penuh: keduanya pulang ke base
+                        board = BoardState(payload(engine, g))
+                        mine = client_target(board, strategy, carry, engine.inventory_size)
+                        cell = targets[g]
+                        theirs = None if cell < 0 else Position(int(cell % engine.width), int(cell // engine.width))
+                        compared += 1
+                        same += mine == theirs
+                engine.step(strategy(engine, 0)[:, None])
+            print(f"  {name:18s}: same target as CandidateIndex.select on {same}/{compared} "
+                  f"({same / max(compared, 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# Micro-benchmark: A* integer-encoded (mhscuti.pathfinding) vs A* lama
+# yang memakai key string "x,y" dari riveldo/randy. Keduanya menganggap teleport
+# lantai biasa; untuk board teleport, find_path dengan RoutingGraph (teleport
+# dipakai) diukur terpisah.
+#
+#   python bench/bench_pathfinding.py [--size 50] [--repeat 20]
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.board_state import BoardState
+from mhscuti.pathfinding import find_path
+from mhscuti.routing import RoutingGraph
+
+
+def legacy_a_star(grid, start, goal):
+    # Salinan a_star_path lama (key string, cek open_set linear),
+    # dengan walkability sudah O(1) lewat grid
+    def manhattan(p1, p2):
+        return abs(p1['x'] - p2['x']) + abs(p1['y'] - p2['y'])
+
+    def walkable(pos):
+        return not grid.is_wall(pos['x'], pos['y'])
+
+    open_set = []
+    g_score = {f"{start['x']},{start['y']}": 0}
+    f_score = {f"{start['x']},{start['y']}": manhattan(start, goal)}
+    heapq.heappush(open_set, (f_score[f"{start['x']},{start['y']}"], f"{start['x']},{start['y']}"))
+    came_from = {}
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        x, y = map(int, current.split(','))
+        if x == goal['x'] and y == goal['y']:
+            path = []
+            while current in came_from:
+                prev = came_from[current]
+                prev_x, prev_y = map(int, prev.split(','))
+                if prev_x < x:
+                    path.append("EAST")
+                elif prev_x > x:
+                    path.append("WEST")
+                elif prev_y < y:
+                    path.append("SOUTH")
+                elif prev_y > y:
+                    path.append("NORTH")
+                current = prev
+                x, y = prev_x, prev_y
+            path.reverse()
+            return path
+        neighbors = [
+            ("EAST", {'x': x + 1, 'y': y}),
+            ("WEST", {'x': x - 1, 'y': y}),
+            ("SOUTH", {'x': x, 'y': y + 1}),
+            ("NORTH", {'x': x, 'y': y - 1})
+        ]
+        neighbors = [n for n in neighbors if walkable(n[1])]
+        for _, neighbor in neighbors:
+            neighbor_str = f"{neighbor['x']},{neighbor['y']}"
+            tentative_g_score = g_score[f"{x},{y}"] + 1
+            if neighbor_str not in g_score or tentative_g_score < g_score[neighbor_str]:
+                came_from[neighbor_str] = f"{x},{y}"
+                g_score[neighbor_str] = tentative_g_score
+                f_score[neighbor_str] = tentative_g_score + manhattan(neighbor, goal)
+                if not any(neighbor_str == item[1] for item in open_set):
+                    heapq.heappush(open_set, (f_score[neighbor_str], neighbor_str))
+    return []
+
+
+def _obj(obj_id, obj_type, x, y, **props):
+    return {"id": obj_id, "type": obj_type, "position": {"x": x, "y": y}, "properties": props}
+
+
+def open_board(size, rnd):
+    objects = []
+    for i in range(size * size // 10):
+        x, y = rnd.randrange(size), rnd.randrange(size)
+        if (x, y) not in ((0, 0), (size - 1, size - 1)):
+            objects.append(_obj(i, "DiamondGameObject", x, y, points=rnd.choice((1, 2))))
+    return {"width": size, "height": size, "gameObjects": objects}
+
+
+def mazy_board(size, rnd):
+    # Labirin recursive backtracker: sel ganjil adalah lorong, sisanya tembok
+    open_cells = {(1, 1)}
+    stack = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy, dx, dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 < x + dx < size - 1 and 0 < y + dy < size - 1 and (x + dx, y + dy) not in open_cells]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny, dx, dy = rnd.choice(options)
+        open_cells.add((x + dx // 2, y + dy // 2))
+        open_cells.add((nx, ny))
+        stack.append((nx, ny))
+    objects = [_obj(y * size + x, "WallGameObject", x, y)
+               for y in range(size) for x in range(size) if (x, y) not in open_cells]
+    return {"width": size, "height": size, "gameObjects": objects}
+
+
+def teleport_board(size, rnd):
+    board = open_board(size, rnd)
+    objects = board["gameObjects"]
+    for pair in range(size):
+        for _ in range(2):
+            x, y = rnd.randrange(size), rnd.randrange(size)
+            objects.append(_obj(f"t{len(objects)}", "TeleportGameObject", x, y, pairId=f"p{pair}"))
+    return board
+
+
+def _time(fn, grid, queries, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for start, goal in queries:
+            fn(grid, start, goal)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=51)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    print(f"{'board':<10}{'legacy ms':>12}{'new ms':>10}{'speedup':>10}")
+    for name, make in (("open", open_board), ("mazy", mazy_board), ("teleport", teleport_board)):
+        board = BoardState(make(args.size, rnd))
+        grid = board.grid
+        free = [(x, y) for y in range(grid.height) for x in range(grid.width) if not grid.is_wall(x, y)]
+        queries = []
+        for _ in range(args.queries):
+            (sx, sy), (gx, gy) = rnd.sample(free, 2)
+            queries.append(({"x": sx, "y": sy}, {"x": gx, "y": gy}))
+
+        for start, goal in queries:
+            new = find_path(grid, start, goal) or []
+            assert len(new) == len(legacy_a_star(grid, start, goal)), (start, goal)
+
+        legacy_ms = _time(legacy_a_star, grid, queries, args.repeat)
+        new_ms = _time(find_path, grid, queries, args.repeat)
+        print(f"{name:<10}{legacy_ms:>12.3f}{new_ms:>10.3f}{legacy_ms / new_ms:>9.1f}x")
+
+        if board.teleport_pairs:
+            graph = RoutingGraph(grid, board.teleport_pairs)
+            routed = [find_path(grid, start, goal, graph) for start, goal in queries]
+            walked = sum(len(find_path(grid, start, goal) or []) for start, goal in queries)
+            steps = sum(len(path or []) for path in routed)
+            graph_ms = _time(lambda g, s, t: find_path(g, s, t, graph), grid, queries, args.repeat)
+            print(f"  with RoutingGraph: {graph_ms:.3f} ms, {steps} steps instead of {walked} over "
+                  f"{len(queries)} queries (teleporters used)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Benchmark: poin diamond yang terambil di jalan, path horisontal-lalu-vertikal
+# (generate_path_to lama) vs pickup_path (DP atas semua path monoton terpendek),
+# untuk pasangan start/tujuan acak di board simulasi. Panjang path-nya sama.
+#
+#   python bench/bench_pickup.py [--size 25] [--diamonds 100] [--pairs 2000] [--free 5]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.board_state import BoardState
+from mhscuti.grid import FLAG_TELEPORT, FLAG_WALL
+from mhscuti.pickup import collected, pickup_path
+from mhscuti.simulator import Game
+
+
+def straight_path(start, goal):
+    # Seperti generate_path_to sebelumnya: semua langkah horisontal, lalu vertikal
+    dx, dy = goal["x"] - start["x"], goal["y"] - start["y"]
+    return ["EAST" if dx > 0 else "WEST"] * abs(dx) + ["SOUTH" if dy > 0 else "NORTH"] * abs(dy)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=25)
+    parser.add_argument("--diamonds", type=int, default=100)
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--free", type=int, default=5, help="sisa slot inventory")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    game = Game(seed=args.seed, width=args.size, height=args.size, walls=args.size, diamonds=args.diamonds)
+    game.register("bench", "bench")
+    game.join("bench", 1)
+    bot = game.bots["bench"]
+    board = BoardState(game.boards[1].to_payload(first_bot=bot))
+    grid = board.grid
+    base = {"x": bot.base[0], "y": bot.base[1]}
+    carried = bot.inventory_size - args.free
+    open_cells = [(x, y) for y in range(grid.height) for x in range(grid.width)
+                  if not grid.flags(x, y) & (FLAG_WALL | FLAG_TELEPORT)]
+
+    old_points = new_points = improved = compared = old_blocked = new_blocked = 0
+    elapsed = 0.0
+    for _ in range(args.pairs):
+        (sx, sy), (gx, gy) = rnd.sample(open_cells, 2)
+        start, goal = {"x": sx, "y": sy}, {"x": gx, "y": gy}
+        t0 = time.perf_counter()
+        path = pickup_path(board, start, goal, carried, bot.inventory_size, base)
+        elapsed += time.perf_counter() - t0
+
+        # None: path menabrak dinding atau menginjak teleport/bot sebelum tujuan
+        old = collected(board, start, straight_path(start, goal), carried, bot.inventory_size, base)
+        new = collected(board, start, path, carried, bot.inventory_size, base) if path is not None else None
+        old_blocked += old is None
+        new_blocked += new is None
+        if old is not None and new is not None:
+            # Poin dibandingkan pada pasangan yang kedua path-nya terbuka
+            compared += 1
+            old_points += old
+            new_points += new
+            improved += new > old
+
+    print(f"{args.size}x{args.size}, {args.diamonds} diamonds, {args.pairs} pairs, {args.free} free slots")
+    print(f"  blocked (wall/teleport/bot on the way): horizontal first {old_blocked}, pickup_path {new_blocked}")
+    print(f"  on the {compared} pairs both can walk: horizontal first {old_points / max(compared, 1):.3f} points/path, "
+          f"pickup_path {new_points / max(compared, 1):.3f} points/path (more on {improved})")
+    print(f"  pickup_path: {elapsed / args.pairs * 1000:.3f} ms/path")
+
+
+if __name__ == "__main__":
+    main()
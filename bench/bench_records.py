@@ -0,0 +1,86 @@
+# Micro-benchmark: alokasi per tick untuk daftar diamond dan posisi bot, cara lama
+# (dict baru per diamond tiap panggilan + copy.deepcopy posisi) vs record immutable
+# yang dibangun sekali per snapshot BoardState.
+#
+#   python bench/bench_records.py [--size 60] [--ticks 300] [--calls 3]
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.board_state import DIAMOND, BoardState
+from mhscuti.records import Position
+from mhscuti.simulator import Game
+
+
+def dict_tick(board, calls):
+    # Seperti get_diamonds + deepcopy sebelumnya, beberapa kali per tick
+    for _ in range(calls):
+        position = copy.deepcopy(board.first_bot()["position"])
+        diamonds = [{"id": obj["id"], "position": obj["position"],
+                     "points": obj.get("properties", {}).get("points", 0)} for obj in board.diamonds]
+        sum(d["points"] for d in diamonds)
+    return position
+
+
+def record_tick(board, calls):
+    for _ in range(calls):
+        position = Position.of(board.first_bot()["position"])
+        diamonds = board.records(DIAMOND)
+        sum(board.columns(DIAMOND).points)
+        len(diamonds)
+    return position
+
+
+def run(payloads, tick, calls):
+    # Board dibangun per tick seperti di client (record ikut dipakai ulang
+    # dari snapshot sebelumnya); hanya tick yang diukur
+    board = BoardState()
+    elapsed = 0.0
+    for data in payloads:
+        board = BoardState(data, previous=board)
+        start = time.perf_counter()
+        tick(board, calls)
+        elapsed += time.perf_counter() - start
+
+    # Memori sementara per tick: dict/copy yang langsung jadi sampah untuk GC
+    board = BoardState()
+    temporary = 0
+    tracemalloc.start()
+    for data in payloads:
+        board = BoardState(data, previous=board)
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        tick(board, calls)
+        temporary += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return elapsed / len(payloads) * 1000, temporary / len(payloads) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=60)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--calls", type=int, default=3, help="get_diamonds calls per tick")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    game = Game(seed=rnd.randrange(1 << 30), width=args.size, height=args.size,
+                walls=args.size * args.size // 10, diamonds=args.size * 2)
+    payloads = game.random_walk(args.ticks, rnd)
+    print(f"{args.size}x{args.size}, {len(payloads[0]['gameObjects'])} objects, "
+          f"{args.ticks} ticks, {args.calls} calls/tick")
+    for name, tick in (("dict + deepcopy", dict_tick), ("records", record_tick)):
+        ms, temporary = run(payloads, tick, args.calls)
+        print(f"  {name:16s}: {ms:7.3f} ms/tick  {temporary:7.1f} KiB allocated/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Micro-benchmark: diamond terdekat / dalam radius dengan menghitung jarak
+# Manhattan ke semua objek + sort (cara lama) vs index bucket board.spatial,
+# termasuk biaya memperbarui index dari delta tiap tick.
+#
+#   python bench/bench_spatial.py [--size 200] [--diamonds 5000] [--ticks 200]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.board_state import DIAMOND, BoardState
+from mhscuti.records import Position
+from mhscuti.simulator import Game
+
+
+def scan_tick(board, position, k, radius):
+    distance = lambda d: abs(d.position.x - position.x) + abs(d.position.y - position.y)
+    diamonds = sorted(board.records(DIAMOND), key=distance)
+    nearest = [(distance(d), d) for d in diamonds[:k]]
+    within = [(distance(d), d) for d in diamonds if distance(d) <= radius]
+    return nearest, within
+
+
+def spatial_tick(board, position, k, radius):
+    spatial = board.spatial
+    return spatial.nearest(position, k, (DIAMOND,)), spatial.within(position, radius, (DIAMOND,))
+
+
+def run(payloads, tick, k, radius):
+    # Snapshot pertama (build penuh index) tidak diukur; setelahnya index ikut
+    # diperbarui dari delta saat snapshot baru dibangun, dan itu ikut diukur
+    board = BoardState(payloads[0])
+    tick(board, Position.of(board.first_bot()["position"]), k, radius)
+    build = query = 0.0
+    results = []
+    for data in payloads[1:]:
+        start = time.perf_counter()
+        board = BoardState(data, previous=board)
+        middle = time.perf_counter()
+        position = Position.of(board.first_bot()["position"])
+        nearest, within = tick(board, position, k, radius)
+        end = time.perf_counter()
+        build += middle - start
+        query += end - middle
+        results.append(([d for d, _ in nearest], sorted((d, r.position) for d, r in within)))
+    ticks = len(payloads) - 1
+    return build / ticks * 1000, query / ticks * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--diamonds", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--radius", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    game = Game(seed=rnd.randrange(1 << 30), width=args.size, height=args.size,
+                walls=args.size * args.size // 10, diamonds=args.diamonds)
+    payloads = game.random_walk(args.ticks, rnd)
+    print(f"{args.size}x{args.size}, {args.diamonds} diamonds, {args.ticks} ticks, "
+          f"k={args.k}, radius={args.radius}")
+    scan_build, scan_ms, expected = run(payloads, scan_tick, args.k, args.radius)
+    spatial_build, spatial_ms, got = run(payloads, spatial_tick, args.k, args.radius)
+    assert got == expected
+    print(f"  scan + sort: query {scan_ms:7.3f} ms/tick  (board {scan_build:6.3f} ms/tick)")
+    print(f"  spatial    : query {spatial_ms:7.3f} ms/tick  (board + index update {spatial_build:6.3f} ms/tick)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Benchmark: bot main.py di game simulasi (waktu virtual) dengan satu diamond
+# terbaik per langkah vs trip TourPlanner (beberapa diamond + pulang ke base).
+# Dilaporkan skor, poin per langkah dan waktu rencana trip.
+#
+#   python bench/bench_tour.py [--size 15 25] [--seeds 10] [--budget 5]
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import BotClient
+from mhscuti.clock import VirtualClock
+from mhscuti.server import LocalTransport
+from mhscuti.simulator import Game
+
+
+def play(size, seed, budget):
+    clock = VirtualClock()
+    game = Game(seed=seed, session_seconds=60, min_delay_ms=100, width=size, height=size,
+                walls=size, diamonds=size, clock=clock.now)
+    game.register("bench")
+    bot = BotClient("http://bench/api/bots/bench", transport=LocalTransport(game), clock=clock,
+                    pipelined=False, tour_budget_ms=budget)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        bot.join(1)
+        bot.collect_all_diamonds()
+    elapsed = time.perf_counter() - start
+    stats = bot.tour.stats() if bot.tour is not None else {"planned": 0, "cut_short": 0}
+    return game.bots["bench"].score, bot.pacer.moves, elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, nargs="+", default=[15, 25])
+    parser.add_argument("--seeds", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=5.0, help="tour_budget_ms")
+    args = parser.parse_args()
+
+    for size in args.size:
+        print(f"{size}x{size}, {args.seeds} games of 60 s")
+        for name, budget in (("greedy", None), ("tour", args.budget)):
+            score = moves = planned = cut = 0
+            elapsed = 0.0
+            for seed in range(1, args.seeds + 1):
+                s, m, e, stats = play(size, seed, budget)
+                score, moves, elapsed = score + s, moves + m, elapsed + e
+                planned, cut = planned + stats["planned"], cut + stats["cut_short"]
+            line = (f"  {name:6s}: score {score / args.seeds:6.1f}  "
+                    f"{score / max(moves, 1):.3f} points/move")
+            if planned:
+                line += f"  {planned} tours, {cut} cut short, {elapsed / args.seeds:.2f} s/game wall"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Benchmark overhead per move: requests.post per call (cara lama),
+# HttpTransport (requests.Session keep-alive) dan RawHttpTransport,
+# terhadap server lokal yang selalu membalas board yang sama.
+#
+#   python bench/bench_transport.py [--moves 500] [--objects 200]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mhscuti.fast_transport import RawHttpTransport
+from mhscuti.transport import HttpTransport
+
+DIRECTIONS = ("NORTH", "EAST", "SOUTH", "WEST")
+
+
+def make_handler(body):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            # Header + body dalam satu write supaya tidak kena delay Nagle/ACK
+            self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def board_payload(objects):
+    game_objects = [{"id": i, "type": "DiamondGameObject", "position": {"x": i % 15, "y": i // 15 % 15},
+                     "properties": {"points": 1}} for i in range(objects)]
+    return json.dumps({"id": 1, "width": 15, "height": 15, "gameObjects": game_objects}).encode()
+
+
+def per_move(post, url, moves):
+    for direction in DIRECTIONS:
+        post(url, {"direction": direction}).json()  # warm-up
+    t0 = time.perf_counter()
+    for i in range(moves):
+        response = post(url, {"direction": DIRECTIONS[i % 4]})
+        response.json()
+    return (time.perf_counter() - t0) / moves * 1e6
+
+
+def import_time(module):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    return float(out.stdout) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--moves", type=int, default=500)
+    parser.add_argument("--objects", type=int, default=200)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(board_payload(args.objects)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/bots/bench/move"
+
+    import requests
+    headers = {"accept": "application/json", "Content-Type": "application/json"}
+    session = HttpTransport()
+    raw = RawHttpTransport()
+    results = [
+        ("requests.post", per_move(lambda u, p: requests.post(u, json=p, headers=headers), url, args.moves)),
+        ("HttpTransport", per_move(session.post, url, args.moves)),
+        ("RawHttpTransport", per_move(raw.post, url, args.moves)),
+    ]
+    server.shutdown()
+
+    print(f"{args.moves} moves, response {args.objects} objects")
+    for name, us in results:
+        print(f"{name:<18}{us:>10.1f} us/move")
+    print(f"import requests              {import_time('requests'):>8.1f} ms")
+    print(f"import mhscuti.fast_transport {import_time('mhscuti.fast_transport'):>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
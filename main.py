@@ -4,20 +4,72 @@
 # Kelompok: MhsCuti
 # Strategi Algoritma: RB (Imam Ekowicaksono, S.Si., M.Si.)
 
-import requests
-import time
-import copy
+
+from mhscuti.board_state import BASE, DIAMOND, BoardState
+from mhscuti.candidates import CandidateIndex
+from mhscuti.clock import RealClock
+from mhscuti.decoding import make_decoder
+from mhscuti.distance_field import LandmarkFields
+from mhscuti.pacing import MovePacer
+from mhscuti.pickup import collected, pickup_path
+from mhscuti.pipeline import PlanPipeline
+from mhscuti.records import GameObject, Position
+from mhscuti.replanner import ARRIVED, REPAIRED, TARGET_GONE, UNREACHABLE, PathMonitor
+from mhscuti.routing import Router
+from mhscuti.scoring import PRESETS
+from mhscuti.tour import TourPlanner
+from mhscuti.transport import make_transport
 
 class BotClient:
-    def __init__(self, base_url):
-        # Inisialisasi URL base API dan header HTTP
+    def __init__(self, base_url, transport=None, fast_transport=False, clock=None, move_delay=0.2,
+                 pipelined=True, selective_radius=None, score_preset="score_per_distance", candidate_radius=None,
+                 tour_budget_ms=5.0, pickup_paths=True):
+        # Inisialisasi URL base API, header HTTP, dan transport HTTP keep-alive.
+        # fast_transport=True memakai transport socket minimal tanpa requests.
+        # clock bisa diganti VirtualClock supaya jeda antar langkah tidak benar-benar tidur.
         self.base_url = base_url
+        self.transport = transport or make_transport(fast_transport)
+        self.clock = clock or RealClock()
+        self.minimum_server_delay = None       # Detik, dari minimumDelayBetweenMoves board
+        # Pacer mengirim langkah sedekat mungkin dengan cooldown server (memperhitungkan RTT);
+        # move_delay dipakai selama jeda dari server belum diketahui.
+        self.pacer = MovePacer(fallback_delay=move_delay, clock=self.clock)
+        # Decoder response: orjson/ujson kalau terpasang. selective_radius=N hanya
+        # men-decode ulang objek yang berubah: semua diamond, dan objek lain kalau dalam
+        # N langkah dari bot; bot lain, teleport dan button yang jauh dilewati.
+        self.decoder = make_decoder(selective_radius)
+        # Rumus skor diamond (mhscuti.scoring.PRESETS), default "score_per_distance"
+        self.score_preset = PRESETS[score_preset]
+        # Diamond beserta bobot preset-nya, diperbarui dari delta tiap response
+        self.candidates = CandidateIndex(self.score_preset)
+        # candidate_radius=N: untuk board sangat besar, hanya diamond dalam N langkah
+        # Manhattan dari bot yang dinilai (lihat nearby_diamonds)
+        self.candidate_radius = candidate_radius
+        # Target dipilih sebagai trip beberapa diamond + pulang ke base (TourPlanner,
+        # maksimal tour_budget_ms per rencana); None: satu diamond terbaik per langkah
+        self.tour = TourPlanner(budget_ms=tour_budget_ms) if tour_budget_ms is not None else None
+        self.base_pos = None
+        self.inventory_limit = 5
+        self.carried = 0              # Isi inventory menurut response terakhir
+        self.trip_moves = 0           # Langkah sejak deposit terakhir (trip TourPlanner)
+        # Path ke tujuan diganti dengan path monoton yang sama panjang kalau path itu
+        # mengambil lebih banyak poin diamond di jalan (lihat pickup_along)
+        self.pickup_paths = pickup_paths
+        # pipelined=False: rencana dihitung inline tanpa thread planner (untuk debugging)
+        self.pipelined = pipelined
+        self.planner = None
+        self.speculation = None
         self.headers = {
             "accept": "application/json",
             "Content-Type": "application/json"
         }
         self.bot_position = None      # Posisi bot saat ini di board (x,y)
         self.game_objects = []        # Semua objek di board terbaru dari server
+        self.board = BoardState()     # Index gameObjects, dibangun sekali per response
+        self.board_width = None       # Ukuran board dari response join
+        self.board_height = None
+        self.landmarks = LandmarkFields()  # Distance field BFS ke base/teleport/button
+        self.router = Router()             # Routing graph dengan teleport, per layout board
         self.my_name = None           # Nama bot kita, untuk identifikasi
         self.is_playing = True        # Flag apakah bot masih aktif di board
 
@@ -28,30 +80,58 @@ class BotClient:
         # """
         url = f"{self.base_url}/join"
         payload = {"preferredBoardId": preferred_board_id}
-        response = requests.post(url, json=payload, headers=self.headers)
+        try:
+            response = self.transport.post(url, payload)
+        except Exception as e:
+            # Timeout / koneksi putus: join gagal
+            print(f"Join failed: {e}")
+            return False
         print(f"Join response: {response.status_code}")
         try:
-            data = response.json()
+            data = self.decoder.decode_response(response, full=True)
         except Exception:
             print(response.text)
             return False
 
-        # Simpan gameObjects dan cari posisi bot kita
-        self.game_objects = data.get("gameObjects", [])
+        # Simpan ukuran board, jeda minimum antar langkah, gameObjects, dan cari posisi bot kita
+        self.board_width = data.get("width")
+        self.board_height = data.get("height")
+        if data.get("minimumDelayBetweenMoves") is not None:
+            self.minimum_server_delay = data["minimumDelayBetweenMoves"] / 1000
+            self.pacer.set_min_delay(self.minimum_server_delay)
+        self.update_board(data)
         self.find_bot()
+
+        # Base, teleport dan button tidak berpindah: hitung distance field sekali di awal
+        base_pos, _ = self.get_my_base_and_inventory()
+        landmarks = [base_pos] + [obj["position"] for obj in self.board.teleports]
+        if self.board.button is not None:
+            landmarks.append(self.board.button["position"])
+        self.landmarks.prepare(landmarks)
         return True
 
+    def update_board(self, data):
+        # """
+        # Bangun BoardState dari response join/move. Semua accessor di bawah
+        # membaca index ini. Snapshot baru di-diff dengan yang lama per id objek,
+        # jadi index dan grid hanya diperbarui untuk objek yang berubah.
+        # """
+        self.board = BoardState(data, self.board_width, self.board_height, previous=self.board)
+        self.game_objects = self.board.objects
+        self.candidates.sync(self.board)
+        self.landmarks.sync(self.board, self.router.sync(self.board))
+
     def find_bot(self):
         # """
         # Cari objek BotGameObject yang sesuai dengan bot kita di gameObjects,
         # lalu update posisi bot dan nama bot.
         # """
-        for obj in self.game_objects:
-            if obj.get("type") == "BotGameObject":
-                self.bot_position = obj.get("position")
-                self.my_name = obj.get("properties", {}).get("name")
-                print(f"Bot found at position: {self.bot_position} with name: {self.my_name}")
-                return
+        obj = self.board.first_bot()
+        if obj is not None:
+            self.bot_position = Position.of(obj.get("position"))
+            self.my_name = obj.get("properties", {}).get("name")
+            print(f"Bot found at position: {self.bot_position} with name: {self.my_name}")
+            return
         print("Bot not found in game objects.")
         self.bot_position = None
         self.my_name = None
@@ -63,11 +143,10 @@ class BotClient:
         # """
         base_pos = None
         inventory_count = 0
-        for obj in self.game_objects:
-            if obj['type'] == 'BotGameObject' and obj.get('properties', {}).get('name') == self.my_name:
-                base_pos = obj['properties']['base']
-                inventory_count = obj['properties'].get('diamonds', 0)
-                break
+        obj = self.board.bot_by_name(self.my_name)
+        if obj is not None:
+            base_pos = Position.of(obj['properties']['base'])
+            inventory_count = obj['properties'].get('diamonds', 0)
         return base_pos, inventory_count
 
     def get_inventory_limit(self):
@@ -75,40 +154,25 @@ class BotClient:
         # Ambil kapasitas maksimal inventory bot dari properties bot kita.
         # Default 5 jika tidak ditemukan.
         # """
-        for obj in self.game_objects:
-            if obj['type'] == 'BotGameObject' and obj.get('properties', {}).get('name') == self.my_name:
-                return obj['properties'].get('inventorySize', 5)
+        obj = self.board.bot_by_name(self.my_name)
+        if obj is not None:
+            return obj['properties'].get('inventorySize', 5)
         return 5
 
-    def get_diamonds(self):
+    def get_diamonds(self, board=None):
         # """
-        # Kumpulkan semua objek diamond (DiamondGameObject) di board,
-        # dengan posisi dan poinnya.
+        # Semua diamond (DiamondGameObject) di board (default board terbaru) sebagai
+        # record GameObject immutable (.position, .points). Dibangun sekali per
+        # snapshot oleh BoardState, jadi tidak ada dict baru per pemanggilan.
         # """
-        diamonds = []
-        for obj in self.game_objects:
-            if obj.get("type") == "DiamondGameObject":
-                diamonds.append({
-                    "id": obj["id"],
-                    "position": obj["position"],
-                    "points": obj.get("properties", {}).get("points", 0)
-                })
-        return diamonds
+        return (board or self.board).records(DIAMOND)
 
     def get_teleport_pairs(self):
         # """
         # Temukan semua teleporter yang ada di board dan kelompokkan berdasarkan pairId.
         # Setiap pairId berisi dua posisi teleport yang saling terhubung.
         # """
-        pairs = {}
-        for obj in self.game_objects:
-            if obj.get("type") == "TeleportGameObject":
-                pid = obj.get("properties", {}).get("pairId")
-                if pid:
-                    if pid not in pairs:
-                        pairs[pid] = []
-                    pairs[pid].append(obj["position"])
-        return pairs
+        return self.board.teleport_pairs
 
     @staticmethod
     def manhattan_distance(p1, p2):
@@ -118,12 +182,29 @@ class BotClient:
         # """
         return abs(p1['x'] - p2['x']) + abs(p1['y'] - p2['y'])
 
-    def generate_path_to(self, start, target):
+    def path_to_landmark(self, start, landmark, board=None, carried=None):
+        # """
+        # Path ke landmark statis dibaca dari distance field (tanpa search ulang),
+        # fallback ke generate_path_to kalau field tidak tersedia.
+        # """
+        path = self.landmarks.path(start, landmark)
+        if path is None:
+            return self.generate_path_to(start, landmark, board, carried)
+        return path
+
+    def generate_path_to(self, start, target, board=None, carried=None):
         # """
         # Generate list langkah arah ("NORTH", "SOUTH", "EAST", "WEST")
         # dari posisi start ke posisi target berdasarkan perbedaan koordinat.
-        # Path dibuat langkah horisontal dulu, lalu vertikal.
+        # Dengan pickup_paths, dari semua path monoton dipilih yang mengambil poin
+        # diamond terbanyak (lihat pickup_along). Kalau tidak ada yang terbuka, path
+        # dibuat langkah horisontal dulu, lalu vertikal. board dan carried: snapshot
+        # dari thread planner (default board dan inventory terakhir).
         # """
+        path = self.pickup_along(start, target, board=board, carried=carried)
+        if path is not None:
+            return path
+
         directions = []
         x, y = start['x'], start['y']
         tx, ty = target['x'], target['y']
@@ -146,26 +227,57 @@ class BotClient:
 
         return directions
 
-    def move(self, direction):
+    def pickup_along(self, start, target, directions=None, board=None, carried=None):
+        # """
+        # Path terpendek monoton (panjang = jarak Manhattan) dari start ke target yang
+        # mengambil poin diamond terbanyak di sisa inventory (melewati base di tengah
+        # jalan menyetor inventory, jadi slot kosong lagi), tanpa menginjak
+        # teleport atau bot lain. Kalau directions diberikan, path itu hanya diganti
+        # bila panjangnya sama dengan jarak Manhattan (path lewat teleport yang lebih
+        # pendek dibiarkan) dan path baru mengambil poin lebih banyak. None kalau
+        # tidak ada path seperti itu. board dan carried seperti di generate_path_to.
+        # """
+        if not self.pickup_paths or start is None:
+            return None
+        if directions is not None and len(directions) != self.manhattan_distance(start, target):
+            return None
+        board = board or self.board
+        carried = self.carried if carried is None else carried
+        capacity, base = self.inventory_limit, self.base_pos
+        path = pickup_path(board, start, target, carried, capacity, base)
+        if path is None or directions is None:
+            return path
+        before = collected(board, start, directions, carried, capacity, base)
+        if before is not None and collected(board, start, path, carried, capacity, base) <= before:
+            return None
+        return path
+
+    def move(self, direction, retries=2):
         # """
         # Kirim request move ke server untuk arah tertentu.
         # Jika response status 403 berarti bot sudah keluar board, set flag is_playing ke False.
+        # Jika 429 (terlalu cepat), pacer menambah margin lalu langkah dicoba lagi.
         # Update gameObjects dan posisi bot dari response jika move berhasil.
         # """
         url = f"{self.base_url}/move"
         payload = {"direction": direction}
+        self.pacer.wait()
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = self.transport.post(url, payload)
+            self.pacer.record(response.status_code)
             print(f"Move {direction} response: {response.status_code}")
+            if response.status_code == 429 and retries > 0:
+                return self.move(direction, retries - 1)
             if response.status_code == 403:
                 print("Bot is no longer playing on the board. Stopping moves.")
                 self.is_playing = False
                 return False
 
-            data = response.json()
-            # print(json.dumps(data, indent=4))  # Disable print detail besar
-            self.game_objects = data.get("gameObjects", [])
+            data = self.decoder.decode_response(response)
+            self.update_board(data)
             self.find_bot()
+            before, self.carried = self.carried, self.get_my_base_and_inventory()[1]
+            self.trip_moves = 0 if before > 0 and self.carried == 0 else self.trip_moves + 1
             print(f"Bot current position: {self.bot_position}")
             return True
         except Exception as e:
@@ -173,54 +285,65 @@ class BotClient:
             self.is_playing = False
             return False
 
-    def follow_path(self, directions):
+    def follow_path(self, directions, on_last_step=None, goal=None, goal_type=None):
         # """
         # Ikuti list langkah arah yang diberikan, berhenti jika move gagal
-        # atau bot sudah tidak aktif.
+        # atau bot sudah tidak aktif. on_last_step dipanggil tepat sebelum
+        # langkah terakhir dikirim (untuk memulai perencanaan berikutnya).
+        # Jika goal diberikan, setiap state setelah move dicek terhadap asumsi
+        # plan: target (goal_type) masih ada, posisi sesuai, dan tidak ada
+        # penghalang baru. Sisa rute diperbaiki dengan D* Lite, dan berhenti
+        # kalau target sudah diambil bot lain.
         # """
-        for dir in directions:
+        if goal is not None:
+            # Path sama panjang yang mengambil lebih banyak diamond di jalan
+            better = self.pickup_along(self.bot_position, goal, directions)
+            if better is not None:
+                directions = better
+        monitor = None
+        if goal is not None and self.router.graph is not None and self.bot_position is not None:
+            monitor = PathMonitor(self.router.graph, self.bot_position, goal, directions, goal_type)
+        pending = list(directions)
+        while True:
+            if monitor is not None:
+                pending = monitor.remaining
+            if not pending:
+                break
             if not self.is_playing:
                 print("Bot is no longer playing, stopping follow_path.")
                 break
-            success = self.move(dir)
+            if on_last_step is not None and len(pending) == 1:
+                on_last_step()
+            success = self.move(pending[0])
             if not success:
                 print("Move failed, stopping.")
                 break
-            time.sleep(0.2)
-
-    def use_teleport_if_beneficial(self, current_pos, target_pos):
-        # """
-        # Cek apakah lewat teleport membuat jarak perjalanan jadi lebih pendek.
-        # Jika iya, kembalikan path ke teleport dan posisi setelah teleport.
-        # Jika tidak, kembalikan path langsung ke target dan posisi target.
-        # """
-        pairs = self.get_teleport_pairs()
-        direct_path = self.generate_path_to(current_pos, target_pos)
-        direct_dist = len(direct_path)
-
-        for pair_id, positions in pairs.items():
-            if len(positions) != 2:
+            if monitor is None:
+                pending = pending[1:]
                 continue
 
-            pos_a, pos_b = positions[0], positions[1]
-
-            dist_to_a = self.manhattan_distance(current_pos, pos_a)
-            dist_from_b_to_target = self.manhattan_distance(pos_b, target_pos)
-            total_dist_via_teleport_1 = dist_to_a + 1 + dist_from_b_to_target
-
-            dist_to_b = self.manhattan_distance(current_pos, pos_b)
-            dist_from_a_to_target = self.manhattan_distance(pos_a, target_pos)
-            total_dist_via_teleport_2 = dist_to_b + 1 + dist_from_a_to_target
-
-            if total_dist_via_teleport_1 < direct_dist:
-                path_to_teleport = self.generate_path_to(current_pos, pos_a)
-                return path_to_teleport, pos_b
-
-            if total_dist_via_teleport_2 < direct_dist:
-                path_to_teleport = self.generate_path_to(current_pos, pos_b)
-                return path_to_teleport, pos_a
+            status = monitor.advance(self.board, self.bot_position)
+            if status == TARGET_GONE:
+                print(f"Target at {goal} is gone, choosing a new one.")
+                break
+            if status == UNREACHABLE:
+                print(f"Target at {goal} is no longer reachable.")
+                break
+            if status == REPAIRED:
+                print(f"Off plan at {self.bot_position}, repaired route: {len(monitor.remaining)} steps left")
+            if status == ARRIVED:
+                break
 
-        return direct_path, target_pos
+    def route_to(self, current_pos, target_pos):
+        # """
+        # Path terpendek ke target lewat routing graph. Setiap pasangan teleport
+        # adalah edge di graph, jadi semua pasangan (dan rantai beberapa teleport)
+        # ikut dipertimbangkan. Fallback ke generate_path_to kalau tidak terjangkau.
+        # """
+        path = self.router.path(current_pos, target_pos)
+        if path is None:
+            return self.generate_path_to(current_pos, target_pos)
+        return path
 
       # """
         # Loop utama pengambilan diamond:
@@ -234,9 +357,120 @@ class BotClient:
 
 
 
+    def nearby_diamonds(self, board, position, exclude=None):
+        # """
+        # Id diamond dalam candidate_radius dari position, dari index bucket
+        # board.spatial (tanpa menghitung jarak ke semua diamond). Kalau tidak ada,
+        # beberapa diamond terdekat di luar radius. None: radius tidak dipakai.
+        # """
+        if self.candidate_radius is None:
+            return None
+        keep = lambda d: d.position != exclude
+        nearby = (board.spatial.within(position, self.candidate_radius, (DIAMOND,), keep)
+                  or board.spatial.nearest(position, 8, (DIAMOND,), keep))
+        return [d.id for _, d in nearby]
+
+    def plan_next(self, board, graph, current_pos, exclude=None, carried=0, spent=0):
+        # """
+        # Pilih diamond berikutnya dan path-nya dari snapshot board. Bisa jalan di
+        # thread planner, jadi hanya membaca argumen (board tidak pernah diubah)
+        # dan index kandidat, yang punya lock sendiri.
+        # exclude: posisi diamond yang diprediksi sudah terambil langkah terakhir,
+        # carried: isi inventory saat itu (diamond merah = 2 slot; yang tidak muat
+        # di sisa slot tidak dipilih). Return (target, path), atau (None, None)
+        # kalau tidak ada diamond. Dengan TourPlanner target bisa juga base, dan
+        # spent (langkah sejak deposit terakhir) ikut dihitung dalam poin per langkah.
+        # """
+        if self.tour is not None:
+            return self.plan_tour(board, graph, current_pos, exclude, carried, spent)
+        free = self.inventory_limit - carried
+        # Diamond diambil dari index kandidat, yang diperbarui dari delta board di
+        # update_board (bobot preset sudah tersimpan per diamond, jadi tidak ada
+        # list baru atau skor ulang semua diamond per tick). Satu BFS dari posisi
+        # bot menilai diamond per cell yang dijangkau dan berhenti begitu yang
+        # terbaik menurut preset sudah pasti; seri dimenangkan urutan board.
+        # Di thread planner index bisa sudah selangkah lebih baru dari board;
+        # rencana seperti itu ditolak take_speculation kalau diamond-nya berbeda.
+        selection = self.candidates.select(board.grid, current_pos, k=1, graph=graph, exclude=exclude,
+                                           only=self.nearby_diamonds(board, current_pos, exclude),
+                                           where=lambda d: d.points <= free)
+        if not selection:
+            return None, None
+        target = selection.targets[0]
+        # Path dari BFS yang sama; teleport sudah menjadi edge di routing graph
+        path = selection.path(0)
+        if path is None and graph is not None:
+            path = graph.path(current_pos, target.position)
+        if path is None:
+            path = self.generate_path_to(current_pos, target.position, board, carried)
+        return target, path
+
+    def plan_tour(self, board, graph, current_pos, exclude, carried, spent):
+        # """
+        # Seperti plan_next, tapi target dipilih sebagai bagian dari satu trip:
+        # beberapa diamond yang muat di sisa inventory lalu pulang ke base, dinilai
+        # poin per langkah (TourPlanner). Kandidatnya diamond terbaik menurut preset
+        # dari index kandidat; jarak ke base dibaca dari distance field base.
+        # Return diamond pertama trip dan path-nya, atau base kalau pulang sekarang
+        # lebih menguntungkan.
+        # """
+        free = self.inventory_limit - carried
+        base_pos = self.base_pos
+        selection = self.candidates.select(board.grid, current_pos, k=self.tour.candidates, graph=graph,
+                                           exclude=exclude,
+                                           only=self.nearby_diamonds(board, current_pos, exclude),
+                                           where=lambda d: d.points <= free)
+        tour = self.tour.plan(board.grid, graph, current_pos, selection.targets, selection.distances,
+                              lambda pos: self.landmarks.distance(pos, base_pos), free, carried, spent)
+        if tour is None:
+            return None, None
+        if not tour.stops:
+            return GameObject("base", BASE, base_pos, {}), self.path_to_landmark(current_pos, base_pos,
+                                                                                 board, carried)
+        target = tour.stops[0]
+        path = selection.path(selection.targets.index(target))
+        if path is None and graph is not None:
+            path = graph.path(current_pos, target.position)
+        if path is None:
+            path = self.generate_path_to(current_pos, target.position, board, carried)
+        return target, path
+
+    def speculate(self, predicted_pos, exclude=None, carried=0, spent=0):
+        # """
+        # Dipanggil sebelum langkah terakhir path dikirim: planner mulai menghitung
+        # keputusan berikutnya dari board sekarang dengan posisi bot yang diprediksi,
+        # selagi thread ini menunggu cooldown dan response server.
+        # """
+        board, graph = self.board, self.router.graph
+        board.grid  # bangun grid di thread ini, planner cukup membaca
+        if self.candidate_radius is not None:
+            board.spatial
+        expected_cells = board.diamond_cells
+        if exclude is not None:
+            expected_cells = expected_cells - {(exclude['x'], exclude['y'])}
+        ticket = self.planner.submit(board, graph, predicted_pos, exclude, carried, spent)
+        self.speculation = (ticket, predicted_pos, graph, expected_cells, carried)
+
+    def take_speculation(self, current_pos, carried=0):
+        # """
+        # Ambil rencana dari planner kalau prediksinya terbukti: posisi bot, routing
+        # graph, sebaran diamond dan isi inventory sama dengan yang diasumsikan. Kalau tidak,
+        # rencana basi dibuang dan return None.
+        # """
+        spec, self.speculation = self.speculation, None
+        if spec is None:
+            return None
+        ticket, predicted_pos, graph, expected_cells, expected_carried = spec
+        if (current_pos != predicted_pos or graph is not self.router.graph
+                or self.board.diamond_cells != expected_cells or carried != expected_carried):
+            self.planner.discard(ticket)
+            return None
+        return self.planner.take(ticket)
+
     def collect_all_diamonds(self):
         base_pos, inventory_count = self.get_my_base_and_inventory()
         inventory_limit = self.get_inventory_limit()
+        self.base_pos, self.inventory_limit = base_pos, inventory_limit
 
         if base_pos is None:
             print("Base position not found. Cannot proceed.")
@@ -244,11 +478,15 @@ class BotClient:
 
         print(f"Base position: {base_pos}, Inventory limit: {inventory_limit}")
 
-        current_pos = copy.deepcopy(self.bot_position)
+        current_pos = self.bot_position
+
+        # Planner thread: keputusan berikutnya dihitung selagi langkah terakhir
+        # sebuah path masih dikirim dan menunggu cooldown
+        self.planner = PlanPipeline(self.plan_next, threaded=self.pipelined)
+        self.speculation = None
 
         while self.is_playing:
-            diamonds = self.get_diamonds()
-            if not diamonds:
+            if not self.board.diamonds:
                 print("No diamonds left on the board.")
                 break
 
@@ -256,57 +494,78 @@ class BotClient:
                 print("Current position is None. Bot might have been removed from board.")
                 break
 
-            for d in diamonds:
-                d['distance'] = self.manhattan_distance(current_pos, d['position'])
-                d['score_per_distance'] = d['points'] / max(d['distance'], 1)  # hindari pembagian 0
-
-            diamonds.sort(key=lambda d: -d['score_per_distance'])
+            # Isi inventory dibaca dari board: diamond merah memakai 2 slot, dan diamond
+            # yang terinjak di tengah jalan (atau hilang karena di-tackle) ikut terhitung
+            inventory_count = self.get_my_base_and_inventory()[1]
 
             # Jika inventory penuh, kembali ke base untuk deposit
             if inventory_count >= inventory_limit:
                 print(f"Inventory full. Bot at {current_pos}. Returning to base at {base_pos}.")
-                path_to_base = self.generate_path_to(current_pos, base_pos)
-                self.follow_path(path_to_base)
-                inventory_count = 0
-                current_pos = copy.deepcopy(self.bot_position)
+                path_to_base = self.path_to_landmark(current_pos, base_pos)
+                self.follow_path(path_to_base, on_last_step=lambda: self.speculate(base_pos), goal=base_pos)
+                current_pos = self.bot_position
                 continue
 
-            target = diamonds[0]
-            print(f"Bot at {current_pos}, moving to diamond at {target['position']} with points {target['points']}")
-
-            # Cek teleport untuk efisiensi perjalanan
-            path_to_target, pos_after_teleport = self.use_teleport_if_beneficial(current_pos, target['position'])
-
-            self.follow_path(path_to_target)
-            current_pos = copy.deepcopy(self.bot_position)
-
-            if not self.is_playing:
-                print("Stopping as bot is no longer playing.")
+            # Pakai rencana dari planner thread kalau prediksinya benar, kalau tidak hitung di sini
+            plan = self.take_speculation(current_pos, inventory_count)
+            if plan is None:
+                plan = self.plan_next(self.board, self.router.graph, current_pos,
+                                      carried=inventory_count, spent=self.trip_moves)
+            target, path_to_target = plan
+            if target is None:
+                if inventory_count > 0:
+                    # Sisa diamond tidak muat di inventory: deposit dulu
+                    print(f"No diamond fits the inventory. Returning to base at {base_pos}.")
+                    path_to_base = self.path_to_landmark(current_pos, base_pos)
+                    self.follow_path(path_to_base, on_last_step=lambda: self.speculate(base_pos), goal=base_pos)
+                    current_pos = self.bot_position
+                    continue
+                print("No diamonds left on the board.")
                 break
-
-            # Jika teleport digunakan, update posisi bot sesuai teleport tujuan
-            if pos_after_teleport != target['position']:
-                print(f"Teleporting to {pos_after_teleport}")
-                current_pos = pos_after_teleport
-
-            # Jika belum sampai target, lanjutkan berjalan
-            if current_pos != target['position']:
-                path_after_teleport = self.generate_path_to(current_pos, target['position'])
-                self.follow_path(path_after_teleport)
-                current_pos = copy.deepcopy(self.bot_position)
-
-            inventory_count += 1
+            if target.type == BASE:
+                # TourPlanner: pulang sekarang memberi poin per langkah terbaik
+                print(f"Bot at {current_pos}, returning to base at {base_pos} with {inventory_count} diamonds.")
+                self.follow_path(path_to_target, on_last_step=lambda: self.speculate(base_pos), goal=base_pos)
+                current_pos = self.bot_position
+                continue
+            print(f"Bot at {current_pos}, moving to diamond at {target.position} with points {target.points}")
+
+            # Kalau diamond ini bukan yang terakhir sebelum inventory penuh,
+            # diamond berikutnya direncanakan sambil langkah terakhir dikirim.
+            # Isi inventory dibaca saat itu: diamond di jalan mungkin ikut terambil
+            on_last_step = None
+            if inventory_count + target.points < inventory_limit:
+                on_last_step = lambda: self.speculate(target.position, exclude=target.position,
+                                                      carried=self.carried + target.points,
+                                                      spent=self.trip_moves + 1)
+            self.follow_path(path_to_target, on_last_step=on_last_step,
+                             goal=target.position, goal_type=DIAMOND)
+            current_pos = self.bot_position
 
             if not self.is_playing:
                 print("Stopping as bot is no longer playing.")
                 break
 
+            # Tidak sampai target: diamond sudah diambil bot lain atau tidak terjangkau.
+            # Teleport dan salah posisi sudah diperbaiki di follow_path, jadi pilih target baru.
+            if current_pos != target.position:
+                continue
+
         # Setelah diamond habis, deposit sisa inventory jika ada
-        if self.is_playing and inventory_count > 0 and current_pos != base_pos:
+        inventory_count = self.get_my_base_and_inventory()[1]
+        if self.is_playing and inventory_count > 0 and current_pos is not None and current_pos != base_pos:
             print(f"No more diamonds. Bot at {current_pos}, returning to base at {base_pos} to deposit inventory.")
-            path_to_base = self.generate_path_to(current_pos, base_pos)
-            self.follow_path(path_to_base)
-            inventory_count = 0
+            path_to_base = self.path_to_landmark(current_pos, base_pos)
+            self.follow_path(path_to_base, goal=base_pos)
+
+        self.planner.close()
+        planner_stats = self.planner.stats()
+        print(f"Pacing: {self.pacer.summary()}")
+        print(f"Planner: {planner_stats['used']} plans used, {planner_stats['stale']} stale, "
+              f"{planner_stats['blocked_ms']:.0f} ms waited on planner")
+        if self.tour is not None:
+            tour_stats = self.tour.stats()
+            print(f"Tours: {tour_stats['planned']} planned, {tour_stats['cut_short']} cut short by the time budget")
 
 if __name__ == "__main__":
     base_url = "http://localhost:3000/api/bots/d41b9e9a-97ee-480c-9670-5ccec6edf1b7"
@@ -0,0 +1 @@
+# Modul bersama untuk semua bot MhsCuti (main.py, oda, riveldo, randy).
@@ -0,0 +1,101 @@
+import time
+from collections import Counter, namedtuple
+
+Answer = namedtuple("Answer", "decision depth final stale")
+Answer.__doc__ = """Result of AnytimePlanner.plan.
+
+decision is the last one refine yielded (None: nothing to do), depth
+how many refinements it took, final whether refine ran to the end before
+the deadline (cut short otherwise). stale is True when nothing finished in time and decision
+is the cached one from an earlier call; the caller has to check it still
+applies.
+"""
+
+
+class AnytimePlanner:
+    """Runs a refining planner against a hard per-call deadline.
+
+    refine(stop, *args) is a generator that yields successively better
+    decisions, e.g. target rankings over a search horizon that widens each
+    round. plan() keeps the latest decision yielded and returns it once
+    refine is done or deadline_ms has passed, whichever comes first. stop()
+    turns True a reserve (RESERVE of the deadline) early, so a long round
+    cuts its own work short (CandidateIndex.refine checks it every few
+    hundred cells) and plan() still returns before the deadline. Only a
+    return after the deadline counts as a miss; a refine stopped before
+    its end is counted as cut short.
+
+    The latest completed decision is cached: when not even the first round
+    finishes in time, plan() returns the cached one marked stale rather
+    than waiting for the planner.
+    """
+
+    RESERVE = 0.1
+
+    def __init__(self, refine, deadline_ms=5.0, clock=time.perf_counter):
+        self.refine = refine
+        self.deadline_ms = deadline_ms
+        self.clock = clock
+        self.latest = None      # keputusan terakhir yang selesai (cache)
+
+        self.calls = 0
+        self.misses = 0         # plan() kembali setelah deadline
+        self.cut_short = 0      # refine dihentikan sebelum selesai
+        self.fallbacks = 0      # tidak ada keputusan baru: pakai cache
+        self.depths = Counter()
+        self.late = 0.0         # detik terlama melewati deadline
+        self.spent = 0.0
+
+    def plan(self, *args):
+        start = self.clock()
+        deadline = start + self.deadline_ms / 1000.0
+        cutoff = start + self.deadline_ms * (1 - self.RESERVE) / 1000.0
+        stop = lambda: self.clock() >= cutoff
+        self.calls += 1
+
+        decision, depth, final = None, 0, False
+        rounds = self.refine(stop, *args)
+        try:
+            for decision in rounds:
+                depth += 1
+                if stop():
+                    break
+            else:
+                # refine may also have returned early because stop() said so
+                final = not stop()
+        finally:
+            rounds.close()
+
+        end = self.clock()
+        self.spent += end - start
+        self.late = max(self.late, end - deadline)
+        self.depths[depth] += 1
+        if end > deadline:
+            self.misses += 1
+        if not final:
+            self.cut_short += 1
+        if depth == 0 and not final:
+            self.fallbacks += 1
+            return Answer(self.latest, 0, False, True)
+        self.latest = decision
+        return Answer(decision, depth, final, False)
+
+    def stats(self):
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "misses": self.misses,
+            "cut_short": self.cut_short,
+            "fallbacks": self.fallbacks,
+            "mean_depth": sum(d * n for d, n in self.depths.items()) / calls,
+            "depths": dict(sorted(self.depths.items())),
+            "mean_ms": self.spent / calls * 1000,
+            "late_ms": max(self.late, 0.0) * 1000,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (f"{s['calls']} plans, {s['misses']} deadline misses, {s['cut_short']} cut short "
+                f"({s['fallbacks']} used the cached plan), "
+                f"depth {s['mean_depth']:.1f} avg {s['depths']}, {s['mean_ms']:.2f} ms avg, "
+                f"worst {s['late_ms']:.2f} ms past the {self.deadline_ms:g} ms deadline")
@@ -0,0 +1,304 @@
+from itertools import count
+
+from mhscuti.delta import diff_objects
+from mhscuti.records import GameObject, columns
+
+BOT = "BotGameObject"
+BASE = "BaseGameObject"
+DIAMOND = "DiamondGameObject"
+TELEPORT = "TeleportGameObject"
+BUTTON = "DiamondButtonGameObject"
+WALL = "WallGameObject"
+
+_serials = count()
+
+
+def _index_of(items, obj):
+    for i, item in enumerate(items):
+        if item is obj:
+            return i
+    return -1
+
+
+class BoardState:
+    """Snapshot of one join/move response, indexed once for O(1) lookups.
+
+    Given the previous snapshot, the new one is diffed against it by object
+    id (see mhscuti.delta) and only the changed objects are re-indexed;
+    delta holds what changed, or None after a full build. The previous
+    snapshot is never modified, so it stays valid for whoever still holds it.
+    serial numbers every snapshot; base_serial is the serial of the snapshot
+    delta is relative to, so incremental consumers can tell whether they saw it.
+    """
+
+    def __init__(self, data=None, width=None, height=None, previous=None):
+        # width/height: ukuran dari response join, dipakai kalau payload ini
+        # tidak membawa ukuran board sendiri
+        data = data or {}
+        self.data = data
+        self.objects = data.get("gameObjects") or []
+        self.board_id = data.get("id")
+        self.width = data.get("width") or width
+        self.height = data.get("height") or height
+        self.delta = None
+        self.serial = next(_serials)
+        self.base_serial = None
+        self._grid = None
+        self._spatial = None
+        self._layout_key = None
+        self._records = {}      # type -> tuple GameObject, dibangun saat dipakai
+        self._columns = {}      # type -> Columns (struct-of-arrays)
+        self._record_index = {}  # type -> {id: (objek, GameObject)}, dipakai ulang antar snapshot
+
+        if (previous is not None and previous.board_id == self.board_id
+                and previous.width == self.width and previous.height == self.height
+                and len(previous.by_id) == len(previous.objects)):
+            self.delta = diff_objects(previous.by_id, self.objects, BOT, previous.of_type(BOT))
+            if self.delta is not None:
+                self.base_serial = previous.serial
+                self._apply(previous, self.delta)
+                return
+        self._build()
+
+    def _build(self):
+        self.by_type = {}
+        self.by_id = {}
+        self.by_owner = {}      # ownerId / nama pemilik -> BaseGameObject
+        self.by_position = {}   # (x, y) -> list objek di tile itu
+        self.bots_by_name = {}
+        self.teleport_pairs = {}
+        self.diamond_counts = (0, 0)
+
+        total = 0
+        high_value = 0
+        for obj in self.objects:
+            obj_type = obj.get("type")
+            props = obj.get("properties") or {}
+
+            self.by_type.setdefault(obj_type, []).append(obj)
+            if "id" in obj:
+                self.by_id[obj["id"]] = obj
+
+            pos = obj.get("position")
+            if pos:
+                self.by_position.setdefault((pos["x"], pos["y"]), []).append(obj)
+
+            if obj_type == BOT:
+                name = props.get("name")
+                if name is not None and name not in self.bots_by_name:
+                    self.bots_by_name[name] = obj
+            elif obj_type == BASE:
+                owner = props.get("ownerId", props.get("name"))
+                if owner is not None and owner not in self.by_owner:
+                    self.by_owner[owner] = obj
+            elif obj_type == DIAMOND:
+                total += 1
+                if props.get("points", 1) > 1:
+                    high_value += 1
+            elif obj_type == TELEPORT:
+                pid = props.get("pairId")
+                if pid:
+                    self.teleport_pairs.setdefault(pid, []).append(pos)
+
+        self.diamond_counts = (total, high_value)
+
+    def _apply(self, previous, delta):
+        # Salin index lama (dict copy di level C), lalu ubah hanya bagian yang
+        # disentuh delta. List per type/posisi disalin dulu sebelum diubah.
+        by_type = self.by_type = dict(previous.by_type)
+        by_id = self.by_id = dict(previous.by_id)
+        by_position = self.by_position = dict(previous.by_position)
+        copied_types, copied_cells = set(), set()
+        total, high_value = previous.diamond_counts
+
+        def type_list(obj_type):
+            if obj_type not in copied_types:
+                copied_types.add(obj_type)
+                by_type[obj_type] = list(by_type.get(obj_type, ()))
+            return by_type[obj_type]
+
+        def cell_list(pos):
+            key = (pos["x"], pos["y"])
+            if key not in copied_cells:
+                copied_cells.add(key)
+                by_position[key] = list(by_position.get(key, ()))
+            return by_position[key]
+
+        def diamond_value(obj):
+            if obj.get("type") != DIAMOND:
+                return 0, 0
+            return 1, 1 if (obj.get("properties") or {}).get("points", 1) > 1 else 0
+
+        for obj in delta.removed:
+            items = type_list(obj.get("type"))
+            del items[_index_of(items, obj)]
+            del by_id[obj["id"]]
+            if obj.get("position"):
+                items = cell_list(obj["position"])
+                del items[_index_of(items, obj)]
+            count, red = diamond_value(obj)
+            total, high_value = total - count, high_value - red
+
+        for old, new in delta.moved + delta.changed:
+            items = type_list(new.get("type"))
+            items[_index_of(items, old)] = new
+            by_id[new["id"]] = new
+            if old.get("position"):
+                items = cell_list(old["position"])
+                del items[_index_of(items, old)]
+            if new.get("position"):
+                cell_list(new["position"]).append(new)
+            count, red = diamond_value(new)
+            high_value += red - diamond_value(old)[1]
+
+        for obj in delta.added:
+            type_list(obj.get("type")).append(obj)
+            by_id[obj["id"]] = obj
+            if obj.get("position"):
+                cell_list(obj["position"]).append(obj)
+            count, red = diamond_value(obj)
+            total, high_value = total + count, high_value + red
+
+        for key in copied_cells:
+            if not by_position[key]:
+                del by_position[key]
+        # Urutan bot mengikuti snapshot baru: bot kita biasanya yang pertama
+        if delta.ordered:
+            by_type[BOT] = delta.ordered
+        else:
+            by_type.pop(BOT, None)
+        for obj_type in copied_types:
+            if not by_type.get(obj_type, True):
+                del by_type[obj_type]
+        self.diamond_counts = (total, high_value)
+
+        touched = delta.types()
+        self.bots_by_name = previous.bots_by_name
+        if BOT in touched:
+            self.bots_by_name = {}
+            for obj in self.of_type(BOT):
+                name = (obj.get("properties") or {}).get("name")
+                if name is not None and name not in self.bots_by_name:
+                    self.bots_by_name[name] = obj
+        self.by_owner = previous.by_owner
+        if BASE in touched:
+            self.by_owner = {}
+            for obj in self.of_type(BASE):
+                props = obj.get("properties") or {}
+                owner = props.get("ownerId", props.get("name"))
+                if owner is not None and owner not in self.by_owner:
+                    self.by_owner[owner] = obj
+        self.teleport_pairs = previous.teleport_pairs
+        if TELEPORT in touched:
+            self.teleport_pairs = {}
+            for obj in self.of_type(TELEPORT):
+                pid = (obj.get("properties") or {}).get("pairId")
+                if pid:
+                    self.teleport_pairs.setdefault(pid, []).append(obj.get("position"))
+
+        # Record type yang tidak berubah dipakai apa adanya (bot tidak, urutannya
+        # bisa berubah); type lain dibangun ulang saat dipakai, dengan record
+        # lama untuk objek yang sama
+        self._record_index = previous._record_index
+        for obj_type, records in previous._records.items():
+            if obj_type not in touched and obj_type != BOT:
+                self._records[obj_type] = records
+                if obj_type in previous._columns:
+                    self._columns[obj_type] = previous._columns[obj_type]
+
+        if previous._grid is not None:
+            self._grid = previous._grid.updated(self, delta.cells(), WALL in touched)
+        if previous._spatial is not None:
+            self._spatial = previous._spatial.updated(delta)
+        if WALL not in touched and TELEPORT not in touched:
+            self._layout_key = previous._layout_key
+
+    @property
+    def grid(self):
+        # Dibangun sekali per snapshot, saat pertama kali dipakai
+        if self._grid is None:
+            from mhscuti.grid import OccupancyGrid
+            self._grid = OccupancyGrid.from_board(self)
+        return self._grid
+
+    @property
+    def spatial(self):
+        # Index bucket untuk query Manhattan (terdekat / dalam radius) ke diamond,
+        # teleport, base dan bot; dibangun saat pertama kali dipakai
+        if self._spatial is None:
+            from mhscuti.spatial import SpatialIndex
+            self._spatial = SpatialIndex.from_board(self)
+        return self._spatial
+
+    @property
+    def layout_key(self):
+        # Bagian board yang statis: ukuran, tembok, dan posisi teleport
+        if self._layout_key is None:
+            walls = frozenset((o["position"]["x"], o["position"]["y"])
+                              for o in self.of_type(WALL) if o.get("position"))
+            teleports = frozenset((o["position"]["x"], o["position"]["y"],
+                                   (o.get("properties") or {}).get("pairId"))
+                                  for o in self.of_type(TELEPORT) if o.get("position"))
+            self._layout_key = (self.width, self.height, walls, teleports)
+        return self._layout_key
+
+    def of_type(self, obj_type):
+        return self.by_type.get(obj_type, ())
+
+    def records(self, obj_type):
+        """Immutable GameObject records of obj_type, built once per snapshot."""
+        records = self._records.get(obj_type)
+        if records is None:
+            old = self._record_index.get(obj_type, {})
+            index = {}
+            items = []
+            for obj in self.of_type(obj_type):
+                hit = old.get(obj.get("id"))
+                record = hit[1] if hit is not None and hit[0] is obj else GameObject.of(obj)
+                index[record.id] = (obj, record)
+                items.append(record)
+            records = self._records[obj_type] = tuple(items)
+            self._record_index = dict(self._record_index)
+            self._record_index[obj_type] = index
+        return records
+
+    def columns(self, obj_type):
+        """records(obj_type) as a struct of int arrays (see mhscuti.records)."""
+        cols = self._columns.get(obj_type)
+        if cols is None:
+            cols = self._columns[obj_type] = columns(self.records(obj_type), self.width)
+        return cols
+
+    def get(self, obj_id):
+        return self.by_id.get(obj_id)
+
+    def at(self, x, y):
+        return self.by_position.get((x, y), ())
+
+    def first_bot(self):
+        bots = self.by_type.get(BOT)
+        return bots[0] if bots else None
+
+    def bot_by_name(self, name):
+        return self.bots_by_name.get(name)
+
+    def base_of(self, owner):
+        return self.by_owner.get(owner)
+
+    @property
+    def diamonds(self):
+        return self.by_type.get(DIAMOND, ())
+
+    @property
+    def diamond_cells(self):
+        # Posisi semua diamond, untuk membandingkan dua snapshot
+        return frozenset((o["position"]["x"], o["position"]["y"]) for o in self.diamonds)
+
+    @property
+    def teleports(self):
+        return self.by_type.get(TELEPORT, ())
+
+    @property
+    def button(self):
+        buttons = self.by_type.get(BUTTON)
+        return buttons[0] if buttons else None
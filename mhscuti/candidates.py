@@ -0,0 +1,365 @@
+import heapq
+import threading
+
+from mhscuti.board_state import DIAMOND
+from mhscuti.pathfinding import DIRECTIONS, STOP_EVERY, neighbor_table
+from mhscuti.records import GameObject
+
+_INF = float("inf")
+
+
+class Selection:
+    """Result of CandidateIndex.select: the k best targets, best first.
+
+    values and distances are indexed like targets; distance is None for a
+    target that only made the list unreached (value at distance inf).
+    depth is how far the BFS scored; truncated means max_depth or stop cut
+    it off, so the ranking only covers targets within depth. A target on a
+    teleporter is reached where stepping on it lands (exits, see
+    RoutingGraph), and its path ends with that step.
+    """
+
+    def __init__(self, targets=(), values=(), distances=(), parent=None, source=None, width=0, exits=None):
+        self.targets = list(targets)
+        self.values = list(values)
+        self.distances = list(distances)
+        self.expanded = 0
+        self.depth = 0
+        self.truncated = False
+        self._parent = parent or {}
+        self._source = source
+        self._width = width
+        self._exits = exits or {}
+
+    def __len__(self):
+        return len(self.targets)
+
+    def path(self, i):
+        """Direction list to targets[i], or None if the BFS didn't reach it."""
+        if self.distances[i] is None:
+            return None
+        pos = self.targets[i].position
+        node = pos["y"] * self._width + pos["x"]
+        node = self._exits.get(node, node)
+        path = []
+        while node != self._source:
+            node, code = self._parent[node]
+            path.append(DIRECTIONS[code])
+        path.reverse()
+        return path
+
+
+class CandidateIndex:
+    """Targets of one type kept across ticks and updated from board deltas.
+
+    Every entry stores its record, its cell and its preset weight (the part
+    of the score that doesn't depend on our position), so sync() only looks
+    at the objects in board.delta: O(changes · log n) per tick. Entries are
+    bucketed per cell, which is what the selection BFS looks up as it
+    expands, and a max-heap of weights with lazy invalidation (stale items
+    are dropped once they reach the top) gives the bound that lets the BFS
+    stop early. The distance part is only computed for the entries that
+    BFS reaches, so moving never rescans the whole index.
+
+    The preset's weight for obj_type must not depend on per-tick context.
+    sync() may run on the main thread while select() runs on a planner
+    thread; both take the same lock.
+    """
+
+    def __init__(self, preset, obj_type=DIAMOND):
+        self.preset = preset
+        self.obj_type = obj_type
+        self.rebuilds = 0
+        self.updates = 0
+        self._lock = threading.Lock()
+        self._serial = None
+        self._width = None
+        self._entries = {}   # id -> (record, weight, cell, order)
+        self._cells = {}     # cell -> list id di cell itu
+        self._heap = []      # (-weight, order, id); item basi dibuang saat di puncak
+        self._next_order = 0  # urutan seperti board.records(obj_type), untuk seri
+
+    def __len__(self):
+        return len(self._entries)
+
+    def sync(self, board):
+        """Bring the index up to board; incremental when it saw board's base."""
+        with self._lock:
+            if board.serial == self._serial:
+                return
+            if board.base_serial is None or board.base_serial != self._serial or board.width != self._width:
+                self._rebuild(board)
+            else:
+                self._apply(board.delta)
+            self._serial = board.serial
+
+    def _weigh(self, records):
+        return self.preset.weights([r.points for r in records], [r.type for r in records]).tolist()
+
+    def _insert(self, record, weight, order):
+        pos = record.position
+        cell = pos[1] * self._width + pos[0]
+        self._entries[record.id] = (record, weight, cell, order)
+        self._cells.setdefault(cell, []).append(record.id)
+        return (-weight, order, record.id)
+
+    def _remove(self, obj_id):
+        entry = self._entries.pop(obj_id, None)
+        if entry is None:
+            return None
+        bucket = self._cells[entry[2]]
+        bucket.remove(obj_id)
+        if not bucket:
+            del self._cells[entry[2]]
+        return entry[3]
+
+    def _rebuild(self, board):
+        records = [r for r in board.records(self.obj_type) if r.position is not None]
+        self._width = board.width
+        self._entries, self._cells = {}, {}
+        self._heap = [self._insert(record, weight, order)
+                      for order, (record, weight) in enumerate(zip(records, self._weigh(records)))]
+        heapq.heapify(self._heap)
+        self._next_order = len(records)
+        self.rebuilds += 1
+
+    def _apply(self, delta):
+        obj_type = self.obj_type
+        pending = []   # (objek baru, urutan)
+        for obj in delta.removed:
+            if obj.get("type") == obj_type:
+                self._remove(obj["id"])
+                self.updates += 1
+        for old, new in delta.moved + delta.changed:
+            if new.get("type") == obj_type:
+                # Objek yang sama tetap di tempatnya dalam urutan board
+                order = self._remove(old["id"])
+                pending.append((new, self._next_order if order is None else order))
+                if order is None:
+                    self._next_order += 1
+        for obj in delta.added:
+            if obj.get("type") == obj_type:
+                pending.append((obj, self._next_order))
+                self._next_order += 1
+        if pending:
+            records = [GameObject.of(obj) for obj, _ in pending]
+            for record, weight, (_, order) in zip(records, self._weigh(records), pending):
+                if record.position is not None:
+                    heapq.heappush(self._heap, self._insert(record, weight, order))
+            self.updates += len(pending)
+        # Item basi menumpuk kalau puncaknya jarang berubah; bangun ulang sesekali
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(-weight, order, obj_id)
+                          for obj_id, (_, weight, _, order) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def max_weight(self):
+        """Largest weight in the index, or None when it's empty."""
+        heap, entries = self._heap, self._entries
+        while heap:
+            weight, order, obj_id = heap[0]
+            entry = entries.get(obj_id)
+            if entry is not None and entry[3] == order and entry[1] == -weight:
+                return -weight
+            heapq.heappop(heap)
+        return None
+
+    def select(self, grid, start, k=1, graph=None, exclude=None, extra=(), indexed=True, only=None,
+               where=None, max_depth=None, stop=None):
+        """The k best targets by preset value from start, as a Selection.
+
+        One BFS from start scores the entries it reaches, bucket by bucket,
+        and stops once the k best can't be beaten by anything further away.
+        exclude is a position to skip (a diamond about to be taken). extra
+        holds (record, weight) pairs scored alongside the index, ranked after
+        it on ties; indexed=False scores only those, and only limits the index
+        to the given ids (e.g. the diamonds near us). where(record) filters
+        indexed entries, e.g. to the diamonds that still fit the inventory.
+        Targets not reached get
+        the value at distance inf, like MultiTargetBFS callers did, and are
+        only looked at when that value could still make the top k.
+
+        max_depth stops the BFS after that many steps and stop() is checked
+        every STOP_EVERY cells; either way the Selection is truncated and
+        ranks only what was reached.
+        """
+        with self._lock:
+            for selection in self._search(grid, start, k, graph, exclude, extra, indexed, only, where,
+                                          None, max_depth, stop):
+                pass
+            return selection
+
+    def refine(self, grid, start, horizons, k=1, graph=None, exclude=None, extra=(), indexed=True,
+               only=None, where=None, stop=None):
+        """Anytime select(): yields successively deeper Selections.
+
+        A truncated Selection is yielded each time the BFS has scored every
+        cell up to a depth in horizons (ascending; None is skipped), then
+        the full one. The
+        BFS resumes where it was, so a round only pays for the cells beyond
+        the previous one. When stop() cuts it off, what was reached is
+        yielded if it has a target and got deeper than the last round.
+        Rounds without any reached target are skipped. The lock is held
+        until the generator is exhausted or closed (see AnytimePlanner).
+        """
+        with self._lock:
+            yield from self._search(grid, start, k, graph, exclude, extra, indexed, only, where,
+                                    horizons, None, stop)
+
+    def _search(self, grid, start, k, graph, exclude, extra, indexed, only, where, horizons, max_depth, stop):
+        value_of = self.preset.value
+        width = grid.width
+        entries = self._entries if indexed else {}
+        cells = self._cells if indexed else {}
+        allowed = None
+        if only is not None and entries:
+            allowed = {obj_id for obj_id in only if obj_id in entries}
+
+        # Target tambahan (base, tombol, teleport) berubah tiap tick: sedikit,
+        # jadi cukup dipetakan per panggilan
+        # Teleport dicapai di sel pendaratannya (lihat RoutingGraph); kalau itu sel
+        # kita sendiri, teleport-nya baru saja dipakai dan tidak dihitung
+        exits = graph.exits if graph is not None else {}
+        here = start["y"] * width + start["x"]
+        extras = []
+        extra_cells = {}
+        order = self._next_order
+        for record, weight in extra:
+            pos = record.position
+            extras.append((record, weight, order))
+            if grid.in_bounds(pos["x"], pos["y"]):
+                cell = pos["y"] * width + pos["x"]
+                landing = exits.get(cell, cell)
+                if landing == cell or landing != here:
+                    extra_cells.setdefault(landing, []).append(len(extras) - 1)
+            order += 1
+
+        weights = [w for _, w, _ in extras]
+        if entries:
+            weights.append(self.max_weight())
+        if not weights:
+            yield Selection()
+            return
+        max_weight = max(weights)
+
+        candidates = entries if allowed is None else allowed
+        remaining = len(candidates) + sum(len(v) for v in extra_cells.values())
+        if exclude is not None and entries:
+            ids = cells.get(exclude["y"] * width + exclude["x"], ())
+            remaining -= sum(1 for obj_id in ids
+                             if obj_id in candidates and entries[obj_id][0].position == exclude)
+
+        settled = {}   # order -> (value, order, record, depth)
+        best_k = []
+        parent = {}
+        source = None
+        expanded = 0
+        depth = 0      # level yang sedang dinilai; level < depth sudah lengkap
+
+        def snapshot(truncated):
+            pool = list(settled.values())
+            # Yang belum terjangkau hanya perlu dilihat kalau nilainya di jarak inf
+            # masih bisa masuk k besar (BFS habis sebelum k target, atau nilai seri);
+            # hasil BFS yang dipotong hanya memuat yang terjangkau
+            if remaining > 0 and not truncated and (len(best_k) < k or best_k[0] <= value_of(max_weight, _INF)):
+                for obj_id in candidates:
+                    record, weight, _, order = entries[obj_id]
+                    if (order not in settled and not (exclude is not None and record.position == exclude)
+                            and (where is None or where(record))):
+                        pool.append((value_of(weight, _INF), order, record, None))
+                for record, weight, order in extras:
+                    if order not in settled:
+                        pool.append((value_of(weight, _INF), order, record, None))
+
+            top = heapq.nsmallest(k, pool, key=lambda item: (-item[0], item[1]))
+            selection = Selection([item[2] for item in top], [item[0] for item in top],
+                                  [item[3] for item in top], parent, source, width, exits)
+            selection.expanded = expanded
+            selection.depth = max(depth - 1, 0)
+            selection.truncated = truncated
+            return selection
+
+        truncated = False
+        yielded = -1   # kedalaman Selection terakhir yang di-yield refine()
+        checkpoints = [h for h in horizons or () if h is not None]
+        sx, sy = start["x"], start["y"]
+        if grid.in_bounds(sx, sy) and remaining > 0:
+            source = sy * width + sx
+            table = graph.table if graph is not None else neighbor_table(grid)
+            seen = bytearray(width * grid.height)
+            seen[source] = 1
+            frontier = [source]
+            countdown = STOP_EVERY
+
+            def settle(record, weight, order):
+                value = value_of(weight, depth)
+                settled[order] = (value, order, record, depth)
+                if len(best_k) < k:
+                    heapq.heappush(best_k, value)
+                elif value > best_k[0]:
+                    heapq.heapreplace(best_k, value)
+
+            while frontier and remaining and not truncated:
+                for node in frontier:
+                    ids = cells.get(node)
+                    if ids:
+                        for obj_id in ids:
+                            record, weight, _, order = entries[obj_id]
+                            if allowed is not None and obj_id not in allowed:
+                                continue
+                            if exclude is not None and record.position == exclude:
+                                continue
+                            remaining -= 1
+                            if where is None or where(record):
+                                settle(record, weight, order)
+                    hits = extra_cells.get(node)
+                    if hits:
+                        for i in hits:
+                            settle(*extras[i])
+                            remaining -= 1
+                    if stop is not None:
+                        countdown -= 1
+                        if not countdown:
+                            countdown = STOP_EVERY
+                            if stop():
+                                truncated = True
+                                break
+                if truncated:
+                    break
+                expanded += len(frontier)
+
+                depth += 1
+                if len(best_k) >= k and best_k[0] >= value_of(max_weight, depth):
+                    break
+                if max_depth is not None and depth > max_depth:
+                    truncated = True
+                    break
+                if checkpoints and depth > checkpoints[0]:
+                    while checkpoints and depth > checkpoints[0]:
+                        checkpoints.pop(0)
+                    if best_k:
+                        yielded = depth - 1
+                        yield snapshot(True)
+
+                next_frontier = []
+                for node in frontier:
+                    for neighbor, code in table[node]:
+                        if not seen[neighbor]:
+                            seen[neighbor] = 1
+                            parent[neighbor] = (node, code)
+                            next_frontier.append(neighbor)
+                    if stop is not None:
+                        countdown -= 1
+                        if not countdown:
+                            countdown = STOP_EVERY
+                            if stop():
+                                truncated = True
+                                break
+                frontier = next_frontier
+
+        if horizons is None or not truncated or (best_k and depth - 1 > yielded):
+            yield snapshot(truncated)
+
+    def stats(self):
+        return {"entries": len(self._entries), "heap": len(self._heap),
+                "rebuilds": self.rebuilds, "updates": self.updates}
@@ -0,0 +1,34 @@
+import time
+
+
+class RealClock:
+    """Wall-clock time for live play."""
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock:
+    """Simulated time: sleep() advances the clock instantly instead of blocking.
+
+    Share one instance between a client and the simulator (pass
+    clock.now as the simulator's clock) and a whole game replays in
+    milliseconds.
+    """
+
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def now(self):
+        return self.time
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.time += seconds
+
+    def advance(self, seconds):
+        self.sleep(seconds)
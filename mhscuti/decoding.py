@@ -0,0 +1,196 @@
+import json
+import re
+from itertools import compress
+from operator import not_
+
+try:
+    import orjson as _fast
+    BACKEND = "orjson"
+except ImportError:
+    try:
+        import ujson as _fast
+        BACKEND = "ujson"
+    except ImportError:
+        _fast = None
+        BACKEND = "json"
+
+_scan = json.JSONDecoder().raw_decode
+
+BOT = "BotGameObject"
+ALWAYS = ("DiamondGameObject",)
+
+
+def loads(body):
+    """json.loads with the fastest library installed (orjson, ujson, json)."""
+    if _fast is not None:
+        return _fast.loads(body)
+    return json.loads(body)
+
+
+def _object_pattern(order, colon, comma):
+    # Regex untuk awal satu game object: id, type dan posisi saja, tanpa properties
+    parts = {
+        "id": r'"id"' + colon + r'("[^"]*"|-?\d+)',
+        "type": r'"type"' + colon + r'"(\w+)"',
+        "position": (r'"position"' + colon + r'\{"x"' + colon + r'(-?\d+)' + comma
+                     + r'"y"' + colon + r'(-?\d+)\}'),
+    }
+    return re.compile(r'\{' + comma.join(parts[key] for key in order))
+
+
+# (pattern, prefix sebelum id, nomor group type/x/y)
+_LAYOUTS = []
+for _colon, _comma in ((":", ","), (": ", ", ")):
+    _LAYOUTS.append((_object_pattern(("id", "position", "type"), _colon, _comma),
+                     '{"id"' + _colon, (4, 2, 3)))
+    _LAYOUTS.append((_object_pattern(("id", "type", "position"), _colon, _comma),
+                     '{"id"' + _colon, (2, 3, 4)))
+
+
+class JsonDecoder:
+    """Decodes join/move responses into the full payload dict."""
+
+    selective = False
+
+    def __init__(self):
+        self.decoded = 0
+        self.fallbacks = 0
+
+    def decode(self, body, full=False):
+        self.decoded += 1
+        return loads(body)
+
+    def decode_response(self, response, full=False):
+        """Payload of a transport response; full=True always decodes everything."""
+        if getattr(response, "decoded", False):
+            # LocalResponse: payload sudah berupa dict, tidak perlu lewat JSON
+            self.decoded += 1
+            return response.json()
+        body = getattr(response, "content", None)
+        if body is None:
+            body = response.text
+        return self.decode(body, full)
+
+    def stats(self):
+        return {"backend": BACKEND, "decoded": self.decoded, "fallbacks": self.fallbacks}
+
+
+class SelectiveDecoder(JsonDecoder):
+    """Decodes only the game objects that changed and that the bot looks at.
+
+    gameObjects is split into one raw text per object with a single C
+    level str.split. A text seen in the previous response maps straight
+    to the dict decoded back then, so unchanged objects (walls, bases,
+    most diamonds) cost a dict lookup and no parsing. Changed objects are
+    decoded in one batch, but only diamonds (the always types) and
+    objects within radius steps (Manhattan) of our bot, the first bot
+    listed, which is at distance 0. Other bots, teleporters and the
+    button that moved further away are left out until they come into
+    range. Decode the join response with full=True so the whole layout
+    is known from the start; after a fallback the next body is decoded
+    in full again for the same reason.
+
+    Bodies the split doesn't understand (other key order or separators,
+    error payloads) are decoded in full, so the result is never wrong,
+    only slower.
+    """
+
+    selective = True
+
+    def __init__(self, radius=5, always=ALWAYS):
+        super().__init__()
+        self.radius = radius
+        self.always = frozenset(always)
+        self.kept = 0
+        self.reused = 0
+        self.skipped = 0
+        self._cache = {}    # teks mentah satu objek -> dict hasil decode
+
+    def decode(self, body, full=False):
+        self.decoded += 1
+        if isinstance(body, (bytes, bytearray)):
+            body = body.decode("utf-8")
+        try:
+            data = self._select(body, None if full or not self._cache else self.radius)
+        except ValueError:
+            data = None
+        if data is None:
+            self.fallbacks += 1
+            self._cache = {}
+            data = loads(body)
+        return data
+
+    def _select(self, text, radius):
+        key = text.find('"gameObjects"')
+        open_ = text.find("[", key) if key >= 0 else -1
+        first = text.find("{", open_) if open_ >= 0 else -1
+        if first < 0:
+            return None
+        for pattern, prefix, groups in _LAYOUTS:
+            if pattern.match(text, first):
+                break
+        else:
+            return None
+        ti, xi, yi = groups
+
+        # Satu potongan teks per objek, tanpa prefix '{"id":'; potongan terakhir
+        # juga berisi penutup array dan sisa payload
+        chunks = text[first + len(prefix):].split(prefix)
+        tail = prefix + chunks[-1]
+        _, end = _scan(tail)
+        rest = tail[end:].lstrip()
+        if not rest.startswith("]"):
+            return None
+        chunks[-1] = tail[len(prefix):end]
+
+        center = None
+        if radius is not None:
+            marker = text.find('"' + BOT + '"', first)
+            if marker >= 0:
+                match = pattern.match(text, text.rfind(prefix, first, marker))
+                if match is None:
+                    return None
+                center = int(match.group(xi)), int(match.group(yi))
+
+        objects = list(map(self._cache.get, chunks))
+        wanted = []
+        for i in compress(range(len(chunks)), map(not_, objects)):
+            if center is not None:
+                match = pattern.match(prefix + chunks[i])
+                if match is None:
+                    return None
+                if (match.group(ti) not in self.always
+                        and abs(int(match.group(xi)) - center[0])
+                        + abs(int(match.group(yi)) - center[1]) > radius):
+                    self.skipped += 1
+                    continue
+            wanted.append(i)
+
+        if wanted:
+            texts = [prefix + chunks[i].rstrip(", \t\r\n") for i in wanted]
+            decoded = loads("[" + ",".join(texts) + "]")
+            if len(decoded) != len(wanted):
+                return None
+            for i, obj in zip(wanted, decoded):
+                objects[i] = obj
+        self.kept += len(wanted)
+        self.reused += len(chunks) - len(wanted)
+
+        data = loads(text[:open_ + 1] + rest)
+        if not isinstance(data, dict):
+            return None
+        self._cache = dict(zip(chunks, objects))
+        data["gameObjects"] = list(filter(None, objects))
+        return data
+
+    def stats(self):
+        stats = super().stats()
+        stats.update(kept=self.kept, reused=self.reused, skipped=self.skipped)
+        return stats
+
+
+def make_decoder(selective_radius=None):
+    """Full decoder, or a SelectiveDecoder when a radius is given."""
+    if selective_radius is None:
+        return JsonDecoder()
+    return SelectiveDecoder(selective_radius)
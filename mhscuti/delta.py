@@ -0,0 +1,121 @@
+from itertools import compress
+from operator import itemgetter, ne
+
+_object_id = itemgetter("id")
+_first = itemgetter(0)
+
+
+class Delta:
+    """What changed between two gameObjects snapshots, matched by object id."""
+
+    def __init__(self):
+        self.added = []      # objek baru
+        self.removed = []    # objek snapshot lama yang hilang
+        self.moved = []      # (lama, baru): posisi berubah
+        self.changed = []    # (lama, baru): posisi sama, isi lain berubah
+        self.unchanged = 0
+        self.ordered = []    # objek ordered_type, urut seperti di snapshot baru
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.moved) + len(self.changed)
+
+    def events(self):
+        """("added" | "removed", obj) and ("moved" | "changed", old, new) tuples."""
+        for obj in self.added:
+            yield "added", obj
+        for obj in self.removed:
+            yield "removed", obj
+        for old, new in self.moved:
+            yield "moved", old, new
+        for old, new in self.changed:
+            yield "changed", old, new
+
+    def old_objects(self):
+        yield from self.removed
+        for old, _ in self.moved:
+            yield old
+        for old, _ in self.changed:
+            yield old
+
+    def new_objects(self):
+        yield from self.added
+        for _, new in self.moved:
+            yield new
+        for _, new in self.changed:
+            yield new
+
+    def types(self):
+        """Object types touched by this delta."""
+        touched = {obj.get("type") for obj in self.old_objects()}
+        touched.update(obj.get("type") for obj in self.new_objects())
+        return touched
+
+    def cells(self):
+        """(x, y) cells whose contents changed, old and new positions alike."""
+        cells = set()
+        for obj in self.old_objects():
+            pos = obj.get("position")
+            if pos:
+                cells.add((pos["x"], pos["y"]))
+        for obj in self.new_objects():
+            pos = obj.get("position")
+            if pos:
+                cells.add((pos["x"], pos["y"]))
+        return cells
+
+
+def diff_objects(previous, objects, ordered_type=None, ordered=()):
+    """Diff objects against previous (id -> object of the last snapshot).
+
+    Finding the unchanged objects is done with C-level map/compress over
+    the id list, so the Python-level work is proportional to the number
+    of changes; everything downstream only has to look at the returned
+    Delta. Returns None when the snapshot can't be matched by id (missing
+    or duplicate ids, or an id that changed type), and the caller should
+    rebuild from scratch.
+
+    Objects of ordered_type are also collected in snapshot order (the
+    unchanged ones as their previous instance) into delta.ordered, for
+    callers whose lookups depend on order, such as "our bot is listed
+    first". ordered is the previous snapshot's objects of that type.
+    """
+    try:
+        ids = list(map(_object_id, objects))
+    except (KeyError, TypeError):
+        return None
+    id_set = set(ids)
+    if len(id_set) != len(ids) or None in id_set:
+        return None
+    olds = list(map(previous.get, ids))
+
+    delta = Delta()
+    added, moved, changed = delta.added, delta.moved, delta.changed
+    for i in compress(range(len(ids)), map(ne, olds, objects)):
+        old, obj = olds[i], objects[i]
+        if old is None:
+            added.append(obj)
+        elif old.get("type") != obj.get("type"):
+            return None
+        elif old.get("position") != obj.get("position"):
+            moved.append((old, obj))
+        else:
+            changed.append((old, obj))
+
+    matched = len(ids) - len(added)
+    delta.unchanged = matched - len(moved) - len(changed)
+    if matched != len(previous):
+        delta.removed = [obj for oid, obj in previous.items() if oid not in id_set]
+
+    if ordered_type is not None:
+        index = dict(zip(ids, range(len(ids))))
+        items = []
+        for old in ordered:
+            i = index.get(old.get("id"))
+            if i is not None:
+                items.append((i, old if old == objects[i] else objects[i]))
+        for obj in added:
+            if obj.get("type") == ordered_type:
+                items.append((index[obj["id"]], obj))
+        items.sort(key=_first)
+        delta.ordered = [obj for _, obj in items]
+    return delta
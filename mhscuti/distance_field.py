@@ -0,0 +1,132 @@
+from array import array
+from collections import deque
+
+from mhscuti.pathfinding import DIRECTIONS, neighbor_table
+
+NO_STEP = 255
+
+
+class DistanceField:
+    """BFS distance and next step toward one landmark, for every cell.
+
+    Both are flat arrays indexed by y * width + x, so "how far is the base"
+    and "which way to the base" are single array reads. With a RoutingGraph
+    the field also routes through teleporters, and a teleporter landmark
+    is rooted at its landing cell: the field leads onto the teleporter.
+    """
+
+    def __init__(self, grid, target, graph=None):
+        self.width = grid.width
+        self.height = grid.height
+        self.target = (target["x"], target["y"])
+        size = grid.width * grid.height
+        self.dist = array("i", [-1]) * size
+        self.step = bytearray([NO_STEP]) * size
+        self.next = array("i", [-1]) * size   # sel tempat bot mendarat setelah step
+
+        tx, ty = self.target
+        if not grid.in_bounds(tx, ty):
+            return
+        source = ty * self.width + tx
+        if graph is not None:
+            source = graph.landing(target)
+        self.dist[source] = 0
+        queue = deque([source])
+        dist, step, nxt = self.dist, self.step, self.next
+
+        if graph is not None:
+            # BFS mundur: reverse_table berisi (sel asal, arah) yang mendarat di node
+            table = graph.reverse_table
+            while queue:
+                node = queue.popleft()
+                next_dist = dist[node] + 1
+                for origin, code in table[node]:
+                    if dist[origin] == -1:
+                        dist[origin] = next_dist
+                        step[origin] = code
+                        nxt[origin] = node
+                        queue.append(origin)
+            return
+
+        table = neighbor_table(grid)
+        while queue:
+            node = queue.popleft()
+            next_dist = dist[node] + 1
+            for neighbor, code in table[node]:
+                if dist[neighbor] == -1:
+                    dist[neighbor] = next_dist
+                    # Grid tidak berarah: dari tetangga, arah balik menuju node
+                    step[neighbor] = code ^ 1
+                    nxt[neighbor] = node
+                    queue.append(neighbor)
+
+    def _index(self, pos):
+        x, y = pos["x"], pos["y"]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    def distance(self, pos):
+        """Walking distance to the landmark, or None if unreachable."""
+        idx = self._index(pos)
+        if idx is None or self.dist[idx] < 0:
+            return None
+        return self.dist[idx]
+
+    def next_step(self, pos):
+        idx = self._index(pos)
+        if idx is None or self.step[idx] == NO_STEP:
+            return None
+        return DIRECTIONS[self.step[idx]]
+
+    def path_from(self, pos):
+        """Direction list to the landmark, or None if unreachable."""
+        idx = self._index(pos)
+        if idx is None or self.dist[idx] < 0:
+            return None
+        path = []
+        while self.dist[idx] > 0:
+            path.append(DIRECTIONS[self.step[idx]])
+            idx = self.next[idx]
+        return path
+
+
+class LandmarkFields:
+    """Distance fields per landmark position, kept while the layout is unchanged."""
+
+    def __init__(self):
+        self._fields = {}
+        self._layout = None
+        self._grid = None
+        self._graph = None
+
+    def sync(self, board, graph=None):
+        if board.layout_key != self._layout:
+            self._layout = board.layout_key
+            self._fields = {}
+        self._grid = board.grid
+        self._graph = graph
+
+    def prepare(self, positions):
+        for pos in positions:
+            if pos:
+                self.get(pos)
+
+    def get(self, pos):
+        key = (pos["x"], pos["y"])
+        field = self._fields.get(key)
+        if field is None and self._grid is not None:
+            field = DistanceField(self._grid, pos, self._graph)
+            self._fields[key] = field
+        return field
+
+    def has(self, pos):
+        return (pos["x"], pos["y"]) in self._fields
+
+    def distance(self, start, landmark):
+        field = self.get(landmark)
+        return field.distance(start) if field else None
+
+    def path(self, start, landmark):
+        field = self.get(landmark)
+        return field.path_from(start) if field else None
@@ -0,0 +1,307 @@
+# Engine game headless dengan NumPy: ribuan game independen dijalankan
+# bersamaan (lockstep) untuk mengevaluasi strategi tanpa HTTP.
+#
+#   python -m mhscuti.engine --games 10000 --steps 300
+
+import argparse
+import time
+
+import numpy as np
+
+from mhscuti.board_state import BASE, BUTTON, DIAMOND, TELEPORT
+from mhscuti.scoring import PRESETS
+
+# Urutan arah sama dengan mhscuti.pathfinding.DIRECTIONS
+DIRECTIONS = ("NORTH", "SOUTH", "EAST", "WEST")
+DX = np.array([0, 0, 1, -1])
+DY = np.array([-1, 1, 0, 0])
+STAY = -1
+
+
+class BatchEngine:
+    """Many independent games stepped together as NumPy arrays.
+
+    Follows the same rules as mhscuti.simulator.SimBoard: 1/2-point
+    diamonds that take that many inventory slots, deposit on your own base,
+    teleporter pairs, the diamond button, walls, tackles, and board refill
+    once fewer than a fifth of the diamonds remain. Illegal moves (off the
+    board, into a wall) leave the bot in place, as a rejected move would.
+    Cells are flat indices y * width + x; every per-game array has the game
+    as its first axis.
+    """
+
+    def __init__(self, games=1000, bots=1, width=15, height=15, diamonds=12, red_ratio=0.2,
+                 walls=0, teleport_pairs=1, button=True, inventory_size=5, seed=None):
+        self.games = games
+        self.bots = bots
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.diamond_target = diamonds
+        self.red_ratio = red_ratio
+        self.inventory_size = inventory_size
+        self.rng = np.random.default_rng(seed)
+        self.steps = 0
+
+        n = self.cells
+        self.cell_x = np.arange(n) % width
+        self.cell_y = np.arange(n) // width
+        self._rows = np.arange(games)
+
+        self.walls = np.zeros((games, n), dtype=bool)
+        self.diamonds = np.zeros((games, n), dtype=np.int8)
+        self.tp_exit = np.full((games, n), -1, dtype=np.int64)
+        self.button = np.full(games, -1, dtype=np.int64)
+        self.base = np.zeros((games, bots), dtype=np.int64)
+        self.pos = np.zeros((games, bots), dtype=np.int64)
+        self.carry = np.zeros((games, bots), dtype=np.int64)
+        self.score = np.zeros((games, bots), dtype=np.int64)
+
+        # Layout statis: sel berbeda per game dari satu permutasi acak
+        needed = walls + 2 * teleport_pairs + (1 if button else 0) + bots
+        if needed + diamonds > n:
+            raise ValueError("board too small for the requested objects")
+        order = np.argsort(self.rng.random((games, n)), axis=1)
+        col = 0
+        if walls:
+            np.put_along_axis(self.walls, order[:, col:col + walls], True, axis=1)
+            col += walls
+        for _ in range(teleport_pairs):
+            a, b = order[:, col], order[:, col + 1]
+            self.tp_exit[self._rows, a] = b
+            self.tp_exit[self._rows, b] = a
+            col += 2
+        if button:
+            self.button = order[:, col].copy()
+            col += 1
+        self.base[:] = order[:, col:col + bots]
+        self.pos[:] = self.base
+        self._spawn_diamonds(self._rows)
+
+    # -- board maintenance ----------------------------------------------
+
+    def _occupied(self, rows):
+        occupied = self.walls[rows] | (self.tp_exit[rows] >= 0)
+        sub = np.arange(len(rows))
+        has_button = self.button[rows] >= 0
+        occupied[sub[has_button], self.button[rows][has_button]] = True
+        for b in range(self.bots):
+            occupied[sub, self.base[rows, b]] = True
+            occupied[sub, self.pos[rows, b]] = True
+        return occupied
+
+    def _spawn_diamonds(self, rows):
+        if len(rows) == 0:
+            return
+        count = self.diamond_target
+        keys = self.rng.random((len(rows), self.cells))
+        keys[self._occupied(rows)] = 2.0
+        chosen = np.argpartition(keys, count - 1, axis=1)[:, :count]
+        free = np.take_along_axis(keys, chosen, axis=1) < 2.0
+        points = np.where(self.rng.random(chosen.shape) < self.red_ratio, 2, 1) * free
+        fresh = np.zeros((len(rows), self.cells), dtype=np.int8)
+        np.put_along_axis(fresh, chosen, points.astype(np.int8), axis=1)
+        self.diamonds[rows] = fresh
+
+    def _move_button(self, rows):
+        keys = self.rng.random((len(rows), self.cells))
+        keys[self._occupied(rows) | (self.diamonds[rows] > 0)] = 2.0
+        self.button[rows] = np.argmin(keys, axis=1)
+
+    # -- stepping --------------------------------------------------------
+
+    def step(self, actions):
+        """Apply one move per bot; actions is (games, bots) of direction codes or STAY."""
+        rows, width, height = self._rows, self.width, self.height
+        actions = np.asarray(actions).reshape(self.games, self.bots)
+        for b in range(self.bots):
+            act = actions[:, b]
+            moving = act >= 0
+            code = np.where(moving, act, 0)
+            here = self.pos[:, b]
+            nx = here % width + DX[code]
+            ny = here // width + DY[code]
+            legal = moving & (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+            target = np.where(legal, ny * width + nx, here)
+            legal &= ~self.walls[rows, target]
+            target = np.where(legal, target, here)
+
+            for other in range(self.bots):
+                if other == b:
+                    continue
+                hit = legal & (target == self.pos[:, other])
+                if hit.any():
+                    space = self.inventory_size - self.carry[:, b]
+                    taken = np.minimum(self.carry[:, other], space) * hit
+                    self.carry[:, b] += taken
+                    self.carry[:, other] = np.where(hit, 0, self.carry[:, other])
+                    self.pos[:, other] = np.where(hit, self.base[:, other], self.pos[:, other])
+
+            exit_cell = self.tp_exit[rows, target]
+            target = np.where(legal & (exit_cell >= 0), exit_cell, target)
+            self.pos[:, b] = target
+
+            points = self.diamonds[rows, target].astype(np.int64)
+            pick = legal & (points > 0) & (self.carry[:, b] + points <= self.inventory_size)
+            self.carry[:, b] += points * pick
+            self.diamonds[rows[pick], target[pick]] = 0
+
+            home = legal & (target == self.base[:, b])
+            self.score[:, b] += self.carry[:, b] * home
+            self.carry[:, b] *= ~home
+
+            press = legal & (target == self.button)
+            if press.any():
+                pressed = rows[press]
+                self.button[pressed] = -1
+                self._spawn_diamonds(pressed)
+                self._move_button(pressed)
+            low = (np.count_nonzero(self.diamonds, axis=1) * 5 < self.diamond_target) & ~press
+            if low.any():
+                self._spawn_diamonds(rows[low])
+        self.steps += 1
+
+    def run(self, policies, steps):
+        """Step every game `steps` times; policies[b](engine, b) -> (games,) actions."""
+        actions = np.empty((self.games, self.bots), dtype=np.int64)
+        for _ in range(steps):
+            for b, policy in enumerate(policies):
+                actions[:, b] = policy(self, b)
+            self.step(actions)
+        return self.score
+
+    # -- helpers for policies -------------------------------------------
+
+    def distances(self, b):
+        """(games, cells) Manhattan distance from bot b to every cell."""
+        here = self.pos[:, b]
+        return (np.abs(self.cell_x[None, :] - (here % self.width)[:, None])
+                + np.abs(self.cell_y[None, :] - (here // self.width)[:, None]))
+
+    def step_toward(self, b, target):
+        """Direction code per game toward target cells, horizontal first like
+        BotClient.generate_path_to; vertical when the horizontal step is walled."""
+        here = self.pos[:, b]
+        x, y = here % self.width, here // self.width
+        tx, ty = target % self.width, target // self.width
+        horizontal = np.where(tx > x, 2, 3)
+        vertical = np.where(ty > y, 1, 0)
+        action = np.where(tx != x, horizontal, np.where(ty != y, vertical, STAY))
+
+        blocked_x = (tx != x) & self.walls[self._rows, np.clip(here + np.where(tx > x, 1, -1), 0, self.cells - 1)]
+        action = np.where(blocked_x & (ty != y), vertical, action)
+        return np.where(target < 0, STAY, action)
+
+
+# -- strategies ----------------------------------------------------------
+# Pemilihan target client, divektorkan: bobot dan nilai dari preset
+# mhscuti.scoring yang sama dengan CandidateIndex di client. Diamond yang
+# tidak muat lagi di inventory diabaikan supaya bot tidak diam di atasnya.
+
+class PresetStrategy:
+    """Target choice of the client scoring with preset, for every game at once.
+
+    Weights and values come from preset (see mhscuti.scoring), so the
+    numbers are the clients' own; what differs is the distance. The
+    engine uses Manhattan distance and step_toward, with no BFS: walls
+    are not walked around and teleporters are neither routed through
+    nor cheaper. riveldo's return home after five diamonds is left out.
+    bench/bench_engine.py measures how often target() agrees with
+    CandidateIndex.select on the same boards.
+
+    With extras the base, button and teleporters are weighed alongside
+    the diamonds like riveldo's target list (greedy_value); otherwise the
+    bot only heads to base when full or out of targets, like main.py.
+    """
+
+    def __init__(self, preset, extras=False):
+        self.preset = preset
+        self.extras = extras
+        # Bobot diamond 0, 1 dan 2 poin; bobot 0 poin tidak pernah dipakai
+        self._diamond = preset.weights([0, 1, 2], [DIAMOND] * 3)
+
+    def __call__(self, engine, b):
+        return engine.step_toward(b, self.target(engine, b))
+
+    def target(self, engine, b):
+        """(games,) target cell per game, -1 for none."""
+        space = engine.inventory_size - engine.carry[:, b]
+        points = engine.diamonds.astype(np.int64)
+        fits = (points > 0) & (points <= space[:, None])
+        dist = engine.distances(b)
+        value = np.where(fits, self.preset.values(np.take(self._diamond, points), dist), -np.inf)
+        if self.extras:
+            self._add_extras(engine, b, value, dist)
+
+        rows = engine._rows
+        best = np.argmax(value, axis=1)
+        has_target = np.isfinite(value[rows, best])
+        target = np.where(has_target, best, -1)
+        full = engine.carry[:, b] >= engine.inventory_size
+        return np.where(full | (~has_target & (engine.carry[:, b] > 0)), engine.base[:, b], target)
+
+    def _add_extras(self, engine, b, value, dist):
+        preset, rows, inv = self.preset, engine._rows, engine.carry[:, b]
+
+        def weight(kind, **context):
+            return preset.weights([0], [kind], **context)[0]
+
+        teleport = engine.tp_exit >= 0
+        value[teleport] = np.maximum(value[teleport], preset.values(weight(TELEPORT), dist[teleport]))
+
+        # Tombol hanya jadi target kalau diamond tinggal sedikit (seperti riveldo)
+        total = np.count_nonzero(engine.diamonds, axis=1)
+        high = np.count_nonzero(engine.diamonds > 1, axis=1)
+        want = (engine.button >= 0) & ((total < 10) | (high < 3))
+        cells = engine.button[want]
+        value[rows[want], cells] = np.maximum(
+            value[rows[want], cells],
+            preset.values(weight(BUTTON, has_red_button=True), dist[rows[want], cells]))
+
+        # Bobot base bergantung pada isi inventory: satu bobot per isi yang mungkin
+        base_weight = np.array([weight(BASE, inventory=n, inventory_size=engine.inventory_size)
+                                for n in range(engine.inventory_size + 1)])
+        carrying = inv > 0
+        cells = engine.base[carrying, b]
+        value[rows[carrying], cells] = np.maximum(
+            value[rows[carrying], cells],
+            preset.values(base_weight[inv[carrying]], dist[rows[carrying], cells]))
+
+
+STRATEGIES = {
+    "score_per_distance": PresetStrategy(PRESETS["score_per_distance"]),   # main.py
+    "points_first": PresetStrategy(PRESETS["points_first"]),               # oda
+    "greedy_value": PresetStrategy(PRESETS["greedy_value"], extras=True),  # riveldo/randy
+}
+
+
+def evaluate(strategies, games=10000, steps=300, seed=None, **options):
+    """Play `games` games with one bot per strategy; returns (games, bots) scores."""
+    policies = [STRATEGIES[s] if isinstance(s, str) else s for s in strategies]
+    engine = BatchEngine(games=games, bots=len(policies), seed=seed, **options)
+    return engine.run(policies, steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate bot strategies on the batch engine")
+    parser.add_argument("strategies", nargs="*", default=list(STRATEGIES))
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--walls", type=int, default=0)
+    parser.add_argument("--versus", action="store_true", help="all strategies on the same boards")
+    args = parser.parse_args()
+
+    groups = [args.strategies] if args.versus else [[s] for s in args.strategies]
+    for group in groups:
+        t0 = time.perf_counter()
+        scores = evaluate(group, games=args.games, steps=args.steps, seed=args.seed, walls=args.walls)
+        elapsed = time.perf_counter() - t0
+        for b, name in enumerate(group):
+            print(f"{name:<20} mean {scores[:, b].mean():7.2f}  std {scores[:, b].std():6.2f}")
+        print(f"  {args.games} games x {args.steps} steps in {elapsed:.2f}s "
+              f"({args.games / elapsed:,.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
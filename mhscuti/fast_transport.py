@@ -0,0 +1,145 @@
+import json
+import socket
+from urllib.parse import urlsplit
+
+
+class RawResponse:
+    """Just enough of requests.Response for the bot clients."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", "replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class RawHttpTransport:
+    """Minimal HTTP/1.1 keep-alive transport on the standard library only.
+
+    Request bytes are encoded once per (method, url, payload) and reused, so
+    the four move bodies cost a dict lookup and one sendall per step. The
+    response body is only JSON-decoded when .json() is called. It does not
+    import requests, which also keeps bot start-up fast.
+    """
+
+    def __init__(self, timeout=5.0, headers=None, max_cached=64):
+        self.timeout = timeout
+        self.max_cached = max_cached
+        self._extra_headers = "".join(f"{k}: {v}\r\n" for k, v in (headers or {}).items())
+        self._connections = {}
+        self._encoded = {}
+
+    def get(self, url, timeout=None):
+        return self._send("GET", url, None, timeout)
+
+    def post(self, url, payload, timeout=None):
+        return self._send("POST", url, payload, timeout)
+
+    def close(self):
+        for sock, _ in self._connections.values():
+            sock.close()
+        self._connections.clear()
+
+    def _encode(self, method, url, payload):
+        key = (method, url, tuple(sorted(payload.items())) if payload else None)
+        cached = self._encoded.get(key)
+        if cached is not None:
+            return cached
+
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        head = (f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {parts.netloc}\r\n"
+                "accept: application/json\r\n"
+                "Connection: keep-alive\r\n"
+                f"{self._extra_headers}")
+        body = b""
+        if payload is not None:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        encoded = ((scheme, parts.hostname, port), head.encode("latin-1") + b"\r\n" + body)
+        if len(self._encoded) < self.max_cached:
+            self._encoded[key] = encoded
+        return encoded
+
+    def _connect(self, address, timeout):
+        scheme, host, port = address
+        sock = socket.create_connection((host, port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if scheme == "https":
+            import ssl
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+        conn = (sock, sock.makefile("rb"))
+        self._connections[address] = conn
+        return conn
+
+    def _send(self, method, url, payload, timeout):
+        address, request = self._encode(method, url, payload)
+        timeout = timeout or self.timeout
+        reused = address in self._connections
+        conn = self._connections.get(address) or self._connect(address, timeout)
+        try:
+            return self._exchange(address, conn, request, timeout)
+        except ConnectionError:
+            self._drop(address)
+            if not reused:
+                raise
+            # Koneksi keep-alive lama sudah ditutup server: coba sekali lagi
+            return self._exchange(address, self._connect(address, timeout), request, timeout)
+        except (OSError, ValueError):
+            self._drop(address)
+            raise
+
+    def _exchange(self, address, conn, request, timeout):
+        sock, reader = conn
+        sock.settimeout(timeout)
+        sock.sendall(request)
+
+        status_line = reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split(None, 2)[1])
+        headers = {}
+        while True:
+            line = reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(reader.readline().split(b";")[0], 16)
+                if size == 0:
+                    reader.readline()
+                    break
+                chunks.append(reader.read(size))
+                reader.readline()
+            content = b"".join(chunks)
+        elif "content-length" in headers:
+            content = reader.read(int(headers["content-length"]))
+        else:
+            content = reader.read()
+            headers["connection"] = "close"
+
+        if headers.get("connection", "").lower() == "close":
+            self._drop(address)
+        return RawResponse(status, headers, content)
+
+    def _drop(self, address):
+        conn = self._connections.pop(address, None)
+        if conn is not None:
+            conn[0].close()
@@ -0,0 +1,102 @@
+from mhscuti.board_state import BASE, BOT, DIAMOND, TELEPORT, WALL
+
+# Flag per cell, bisa digabung (mis. base yang sedang ditempati bot)
+FLAG_WALL = 1
+FLAG_DIAMOND = 2
+FLAG_RED = 4          # diamond merah (points > 1), selalu bersama FLAG_DIAMOND
+FLAG_TELEPORT = 8
+FLAG_BASE = 16
+FLAG_BOT = 32
+
+_TYPE_FLAGS = {
+    WALL: FLAG_WALL,
+    DIAMOND: FLAG_DIAMOND,
+    TELEPORT: FLAG_TELEPORT,
+    BASE: FLAG_BASE,
+    BOT: FLAG_BOT,
+}
+
+
+def object_flags(obj):
+    flag = _TYPE_FLAGS.get(obj.get("type"), 0)
+    if flag == FLAG_DIAMOND and obj.get("properties", {}).get("points", 1) > 1:
+        flag |= FLAG_RED
+    return flag
+
+
+class OccupancyGrid:
+    """Flat bytearray of cell flags, one byte per tile (index = y * width + x)."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+
+    @classmethod
+    def from_board(cls, board):
+        width, height = board.width, board.height
+        if not width or not height:
+            # Payload lama tanpa ukuran board: pakai jangkauan objek terjauh
+            width = 1 + max((x for x, _ in board.by_position), default=0)
+            height = 1 + max((y for _, y in board.by_position), default=0)
+
+        grid = cls(width, height)
+        cells = grid.cells
+        for obj_type, flag in _TYPE_FLAGS.items():
+            for obj in board.of_type(obj_type):
+                pos = obj.get("position")
+                if not pos:
+                    continue
+                x, y = pos["x"], pos["y"]
+                if 0 <= x < width and 0 <= y < height:
+                    cell = flag
+                    if flag == FLAG_DIAMOND and obj.get("properties", {}).get("points", 1) > 1:
+                        cell |= FLAG_RED
+                    cells[y * width + x] |= cell
+        return grid
+
+    def updated(self, board, cells, layout_changed):
+        """Copy of this grid with only the given (x, y) cells recomputed from board.
+
+        Neighbour and component tables carry over when no wall changed.
+        """
+        grid = OccupancyGrid(self.width, self.height)
+        grid.cells = bytearray(self.cells)
+        for x, y in cells:
+            if self.in_bounds(x, y):
+                flag = 0
+                for obj in board.at(x, y):
+                    flag |= object_flags(obj)
+                grid.cells[y * self.width + x] = flag
+        if not layout_changed:
+            grid.share_tables(self)
+        return grid
+
+    def share_tables(self, other):
+        """Reuse the walls-only tables (neighbour table, components) other
+        has built; other must have the same walls."""
+        for attr in ("_neighbors", "_components"):
+            table = getattr(other, attr, None)
+            if table is not None:
+                setattr(self, attr, table)
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def flags(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return 0
+
+    def is_wall(self, x, y):
+        return bool(self.flags(x, y) & FLAG_WALL)
+
+    def is_diamond(self, x, y):
+        return bool(self.flags(x, y) & FLAG_DIAMOND)
+
+    def is_teleport(self, x, y):
+        return bool(self.flags(x, y) & FLAG_TELEPORT)
+
+    def has_bot(self, x, y):
+        # Termasuk bot kita sendiri; pemanggil yang membedakan lawan
+        return bool(self.flags(x, y) & FLAG_BOT)
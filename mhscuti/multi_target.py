@@ -0,0 +1,129 @@
+import heapq
+from collections import deque
+
+from mhscuti.pathfinding import DIRECTIONS, STOP_EVERY, neighbor_table
+
+
+class MultiTargetBFS:
+    """One breadth-first expansion from start that settles many targets at once.
+
+    targets is a list of {'x', 'y'} positions. After construction every
+    settled target has its exact walking distance, first move and full path.
+    With k, score(i, dist) and bound(dist), the search stops as soon as the
+    k best settled targets already beat the best score any target at the
+    current BFS depth could still reach. Pass a RoutingGraph as graph to
+    route through teleporters. stop() is checked every STOP_EVERY cells;
+    when it says so the search ends with truncated set, and targets not
+    settled by then are left unreached.
+    """
+
+    def __init__(self, grid, start, targets, k=None, score=None, bound=None, graph=None, stop=None):
+        self.targets = targets
+        self.distances = [None] * len(targets)
+        self.scores = [None] * len(targets)
+        self.settled = []
+        self.expanded = 0
+        self.truncated = False
+
+        width = grid.width
+        self.width = width
+        size = width * grid.height
+        self._parent = [-1] * size
+        self._parent_dir = bytearray(size)
+        self._first = bytearray([255]) * size
+
+        sx, sy = start["x"], start["y"]
+        if not grid.in_bounds(sx, sy):
+            return
+        self._source = sy * width + sx
+
+        waiting = {}
+        for i, pos in enumerate(targets):
+            x, y = pos["x"], pos["y"]
+            if grid.in_bounds(x, y):
+                waiting.setdefault(y * width + x, []).append(i)
+        if not waiting:
+            return
+
+        table = graph.table if graph is not None else neighbor_table(grid)
+        parent, parent_dir, first = self._parent, self._parent_dir, self._first
+        seen = bytearray(size)
+        seen[self._source] = 1
+        frontier = [self._source]
+        best_k = []   # min-heap skor k target terbaik yang sudah pasti
+        depth = 0
+        remaining = sum(len(v) for v in waiting.values())
+        countdown = STOP_EVERY
+
+        while frontier and remaining:
+            for node in frontier:
+                hits = waiting.pop(node, None)
+                if hits:
+                    for i in hits:
+                        self.distances[i] = depth
+                        self.settled.append(i)
+                        remaining -= 1
+                        if score is not None:
+                            value = score(i, depth)
+                            self.scores[i] = value
+                            if k:
+                                if len(best_k) < k:
+                                    heapq.heappush(best_k, value)
+                                elif value > best_k[0]:
+                                    heapq.heapreplace(best_k, value)
+            self.expanded += len(frontier)
+
+            depth += 1
+            if k and bound is not None and len(best_k) >= k and best_k[0] >= bound(depth):
+                break
+
+            next_frontier = []
+            for node in frontier:
+                node_first = first[node]
+                for neighbor, code in table[node]:
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        parent[neighbor] = node
+                        parent_dir[neighbor] = code
+                        first[neighbor] = code if node == self._source else node_first
+                        next_frontier.append(neighbor)
+                if stop is not None:
+                    countdown -= 1
+                    if not countdown:
+                        countdown = STOP_EVERY
+                        if stop():
+                            # Level berikutnya belum lengkap: jangan dinilai
+                            self.truncated = True
+                            break
+            if self.truncated:
+                break
+            frontier = next_frontier
+
+    def _cell(self, i):
+        pos = self.targets[i]
+        return pos["y"] * self.width + pos["x"]
+
+    def distance(self, i):
+        return self.distances[i]
+
+    def first_move(self, i):
+        if self.distances[i] is None or self.distances[i] == 0:
+            return None
+        return DIRECTIONS[self._first[self._cell(i)]]
+
+    def path(self, i):
+        """Direction list to target i, or None if it was not settled."""
+        if self.distances[i] is None:
+            return None
+        path = []
+        node = self._cell(i)
+        while node != self._source:
+            path.append(DIRECTIONS[self._parent_dir[node]])
+            node = self._parent[node]
+        path.reverse()
+        return path
+
+    def ranking(self, k=None):
+        """Settled target indices, best score first."""
+        ranked = sorted(self.settled, key=lambda i: self.scores[i], reverse=True)
+        return ranked[:k] if k else ranked
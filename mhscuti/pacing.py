@@ -0,0 +1,109 @@
+from mhscuti.clock import RealClock
+
+
+class MovePacer:
+    """Sends each move at the earliest moment the server will accept it.
+
+    The server checks the cooldown against when a move *arrives*, which
+    is roughly send time + RTT/2. The pacer keeps a smoothed RTT and its
+    mean deviation (Jacobson style) and schedules the next send at
+
+        arrival of last accepted move + min_delay - srtt/2 + safety
+
+    where safety is a small fixed margin plus the RTT deviation. A 429
+    widens the margin a little; accepted moves shrink it back.
+
+    Usage: wait() before posting, record(status_code) after the reply.
+    """
+
+    def __init__(self, min_delay=None, fallback_delay=0.2, clock=None,
+                 alpha=0.125, beta=0.25, margin=0.002, backoff=0.005, max_backoff=0.05):
+        self.clock = clock or RealClock()
+        self.min_delay = min_delay              # seconds, from minimumDelayBetweenMoves
+        self.fallback_delay = fallback_delay    # used until the board tells us the delay
+        self.alpha = alpha
+        self.beta = beta
+        self.margin = margin
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.srtt = None
+        self.rttvar = 0.0
+        self.extra = 0.0          # margin added after rejected moves
+        self._anchor = None       # estimated server arrival of the last accepted move
+        self._sent_at = None
+
+        self.moves = 0
+        self.rejected = 0
+        self.waited = 0.0
+        self.started_at = None
+        self.finished_at = None
+
+    def set_min_delay(self, seconds):
+        self.min_delay = seconds
+
+    @property
+    def interval(self):
+        return self.min_delay if self.min_delay is not None else self.fallback_delay
+
+    def next_send_time(self):
+        if self._anchor is None:
+            return self.clock.now()
+        half_rtt = (self.srtt or 0.0) / 2
+        return self._anchor + self.interval - half_rtt + self.margin + self.rttvar + self.extra
+
+    def wait(self):
+        """Sleep until the next move may be sent; returns the send time."""
+        delay = self.next_send_time() - self.clock.now()
+        if delay > 0:
+            self.waited += delay
+            self.clock.sleep(delay)
+        self._sent_at = self.clock.now()
+        if self.started_at is None:
+            self.started_at = self._sent_at
+        return self._sent_at
+
+    def record(self, status_code):
+        """Feed back the reply to the move sent after the last wait()."""
+        now = self.clock.now()
+        self.finished_at = now
+        if self._sent_at is None:
+            return
+        rtt = now - self._sent_at
+        if self.srtt is None:
+            self.srtt, self.rttvar = rtt, rtt / 2
+        else:
+            err = rtt - self.srtt
+            self.srtt += self.alpha * err
+            self.rttvar += self.beta * (abs(err) - self.rttvar)
+
+        if status_code == 429:
+            self.rejected += 1
+            self.extra = min(self.extra + self.backoff, self.max_backoff)
+        elif status_code is not None and status_code < 400:
+            self.moves += 1
+            self.extra *= 0.9
+            self._anchor = self._sent_at + rtt / 2
+        self._sent_at = None
+
+    def report(self):
+        elapsed = (self.finished_at - self.started_at) if self.started_at is not None else 0.0
+        achieved = self.moves * 60 / elapsed if elapsed > 0 else 0.0
+        theoretical = 60 / self.interval if self.interval > 0 else 0.0
+        return {
+            "moves": self.moves,
+            "rejected": self.rejected,
+            "elapsed": elapsed,
+            "moves_per_minute": achieved,
+            "theoretical_per_minute": theoretical,
+            "efficiency": achieved / theoretical if theoretical else 0.0,
+            "rtt_ms": (self.srtt or 0.0) * 1000,
+            "rtt_dev_ms": self.rttvar * 1000,
+            "waited": self.waited,
+        }
+
+    def summary(self):
+        r = self.report()
+        return (f"{r['moves']} moves ({r['rejected']} rejected) in {r['elapsed']:.1f}s: "
+                f"{r['moves_per_minute']:.0f}/min of {r['theoretical_per_minute']:.0f}/min possible "
+                f"({r['efficiency']:.0%}), rtt {r['rtt_ms']:.1f}±{r['rtt_dev_ms']:.1f} ms")
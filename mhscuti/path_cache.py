@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+
+class PathCache:
+    """Bounded LRU of paths keyed by (start, goal, static-layout epoch).
+
+    The epoch changes whenever the wall or teleport layout changes, which
+    drops every cached path at once. A snapshot whose grid was built from
+    scratch with the same layout also gets the previous grid's walls-only
+    tables (OccupancyGrid.share_tables, as OccupancyGrid.updated does), so
+    they are not rebuilt.
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._paths = OrderedDict()
+        self._layout = None
+        self._grid = None
+
+    def sync(self, board):
+        layout = board.layout_key
+        grid = board.grid
+        previous = self._grid
+        if layout != self._layout:
+            if self._layout is not None:
+                self.invalidations += 1
+            self._layout = layout
+            self._paths.clear()
+            self.epoch += 1
+            previous = None
+        if previous is not None and previous is not grid:
+            # Layout sama: pakai ulang tabel yang sudah dibangun snapshot sebelumnya
+            grid.share_tables(previous)
+        self._grid = grid
+
+    def get(self, start, goal):
+        key = (start["x"], start["y"], goal["x"], goal["y"], self.epoch)
+        path = self._paths.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self._paths.move_to_end(key)
+        self.hits += 1
+        return list(path)
+
+    def put(self, start, goal, path):
+        key = (start["x"], start["y"], goal["x"], goal["y"], self.epoch)
+        self._paths[key] = tuple(path)
+        self._paths.move_to_end(key)
+        if len(self._paths) > self.maxsize:
+            self._paths.popitem(last=False)
+
+    def clear(self):
+        self._paths.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._paths),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "invalidations": self.invalidations,
+            "epoch": self.epoch,
+        }
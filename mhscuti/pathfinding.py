@@ -0,0 +1,150 @@
+import heapq
+
+# Kode arah dipakai sebagai index ke tabel ini
+DIRECTIONS = ("NORTH", "SOUTH", "EAST", "WEST")
+DELTAS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+STOP_EVERY = 256   # sel BFS di antara dua pemanggilan stop()
+
+
+def neighbor_table(grid):
+    """Per-cell tuple of (neighbour index, direction code), walls excluded.
+
+    Built once per grid and cached on it, so every search on the same
+    snapshot reuses the same table.
+    """
+    table = getattr(grid, "_neighbors", None)
+    if table is not None:
+        return table
+
+    width, height, cells = grid.width, grid.height, grid.cells
+    wall = 1  # FLAG_WALL
+    table = []
+    for y in range(height):
+        for x in range(width):
+            entries = []
+            for code, (dx, dy) in enumerate(DELTAS):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    idx = ny * width + nx
+                    if not cells[idx] & wall:
+                        entries.append((idx, code))
+            table.append(tuple(entries))
+    grid._neighbors = table
+    return table
+
+
+def components(grid):
+    """Connected-component label per cell (-1 for walls), cached on the grid."""
+    labels = getattr(grid, "_components", None)
+    if labels is not None:
+        return labels
+
+    table = neighbor_table(grid)
+    cells = grid.cells
+    labels = [-1] * len(cells)
+    label = 0
+    for seed in range(len(cells)):
+        if labels[seed] != -1 or cells[seed] & 1:
+            continue
+        labels[seed] = label
+        stack = [seed]
+        while stack:
+            node = stack.pop()
+            for neighbor, _ in table[node]:
+                if labels[neighbor] == -1:
+                    labels[neighbor] = label
+                    stack.append(neighbor)
+        label += 1
+    grid._components = labels
+    return labels
+
+
+def is_reachable(grid, start, goal, graph=None):
+    """O(1) check (after the first call per grid) that goal can be walked to.
+
+    With a RoutingGraph, regions joined by a teleporter pair count as one.
+    """
+    sx, sy, gx, gy = start["x"], start["y"], goal["x"], goal["y"]
+    if not (grid.in_bounds(sx, sy) and grid.in_bounds(gx, gy)):
+        return False
+    if grid.is_wall(gx, gy):
+        return False
+    labels = graph.components if graph is not None else components(grid)
+    width = grid.width
+    # Start di atas tembok tidak mungkin terjadi di game, anggap saja lolos
+    source_label = labels[sy * width + sx]
+    return source_label == -1 or source_label == labels[gy * width + gx]
+
+
+def find_path(grid, start, goal, graph=None):
+    """A* on integer-encoded cells.
+
+    Returns the list of directions from start to goal, [] when already there,
+    or None when the goal cannot be reached inside the grid. Unreachable goals
+    are rejected before searching, so the search never leaves the board and
+    never floods a sealed-off region.
+
+    Without graph teleporters are walked over like floor. With a
+    RoutingGraph the search runs on its edges, so teleporters are used
+    (and a teleporter goal is reached where stepping on it lands); the
+    heuristic min(Manhattan, via the nearest teleporters) stays
+    admissible, and the reachability check counts regions a teleporter
+    pair joins as one.
+    """
+    if not is_reachable(grid, start, goal, graph):
+        return None
+    tp = graph.teleport_distance if graph is not None else None
+    width = grid.width
+    sx, sy, gx, gy = start["x"], start["y"], goal["x"], goal["y"]
+    source = sy * width + sx
+    target = graph.landing(goal) if tp is not None else gy * width + gx
+    if source == target:
+        return []
+
+    table = graph.table if graph is not None else neighbor_table(grid)
+    size = width * grid.height
+    g_score = [size] * size       # size lebih besar dari panjang path apa pun
+    parent = [-1] * size
+    parent_dir = bytearray(size)
+    closed = bytearray(size)
+
+    # Lewat teleport: jalan ke teleport terdekat, lalu dari teleport terdekat ke goal
+    tp_goal = tp[gy * width + gx] if tp is not None else size
+
+    g_score[source] = 0
+    h = abs(sx - gx) + abs(sy - gy)
+    heap = [(h, h, source)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    while heap:
+        _, h, current = heappop(heap)
+        if closed[current]:
+            continue  # entry basi (lazy deletion)
+        if current == target:
+            return _reconstruct(parent, parent_dir, source, target)
+        closed[current] = 1
+
+        next_g = g_score[current] + 1
+        for neighbor, code in table[current]:
+            if closed[neighbor] or next_g >= g_score[neighbor]:
+                continue
+            g_score[neighbor] = next_g
+            parent[neighbor] = current
+            parent_dir[neighbor] = code
+            ny, nx = divmod(neighbor, width)
+            h = abs(nx - gx) + abs(ny - gy)
+            if h > tp_goal and tp[neighbor] + tp_goal < h:
+                h = tp[neighbor] + tp_goal
+            heappush(heap, (next_g + h, h, neighbor))
+
+    return None
+
+
+def _reconstruct(parent, parent_dir, source, target):
+    path = []
+    node = target
+    while node != source:
+        path.append(DIRECTIONS[parent_dir[node]])
+        node = parent[node]
+    path.reverse()
+    return path
@@ -0,0 +1,123 @@
+from mhscuti.board_state import DIAMOND
+from mhscuti.grid import FLAG_BOT, FLAG_DIAMOND, FLAG_TELEPORT, FLAG_WALL
+from mhscuti.pathfinding import DELTAS, DIRECTIONS
+
+_BLOCKED = FLAG_WALL | FLAG_TELEPORT | FLAG_BOT
+_DELTA = dict(zip(DIRECTIONS, DELTAS))
+
+
+def _points(board, x, y):
+    # Poin diamond di sel (x, y) menurut properties-nya
+    for obj in board.at(x, y):
+        if obj.get("type") == DIAMOND:
+            return (obj.get("properties") or {}).get("points", 1)
+    return 0
+
+
+def pickup_path(board, start, goal, carried=0, capacity=5, base=None, max_cells=4096):
+    """Shortest monotone path to goal that picks up the most diamond points.
+
+    Every step moves toward goal, so the path is exactly the Manhattan
+    distance long; a DP over the bounding box of start and goal chooses,
+    among all such paths, the one collecting the most points, starting
+    with carried of capacity inventory slots used. Pickups follow the
+    server rule: a diamond is taken when its points still fit, otherwise
+    it is walked over, and walking over base (our own base position)
+    deposits the inventory, so a path through it has room again. Walls,
+    teleporters and other bots are never stepped on before goal. Ties
+    keep the horizontal steps first.
+
+    Returns the direction list, or None when no monotone path is open or
+    the box has more than max_cells cells.
+    """
+    grid = board.grid
+    sx, sy, gx, gy = start["x"], start["y"], goal["x"], goal["y"]
+    if not (grid.in_bounds(sx, sy) and grid.in_bounds(gx, gy)):
+        return None
+    nx, ny = abs(gx - sx), abs(gy - sy)
+    if (nx + 1) * (ny + 1) > max_cells:
+        return None
+    dx, dy = (1 if gx > sx else -1), (1 if gy > sy else -1)
+    width, cells = grid.width, grid.cells
+    goal_cell = gy * width + gx
+    base_cell = base["y"] * width + base["x"] if base is not None else -1
+
+    # states[j][i]: slot terpakai -> (poin terkumpul, dari vertikal?, slot di cell
+    # sebelumnya) untuk cell (sx + i*dx, sy + j*dy); dict kosong = tidak terjangkau.
+    # Slot terpakai sama = masa depan sama, jadi cukup simpan poin terbanyak
+    states = []
+    for j in range(ny + 1):
+        row = []
+        y = sy + j * dy
+        for i in range(nx + 1):
+            here = {}
+            if i == 0 and j == 0:
+                here[carried] = (0, None, None)
+                row.append(here)
+                continue
+            x = sx + i * dx
+            cell = y * width + x
+            flag = cells[cell]
+            if flag & _BLOCKED and cell != goal_cell:
+                row.append(here)
+                continue
+            points = _points(board, x, y) if flag & FLAG_DIAMOND else 0
+            # Vertikal dulu: saat seri, langkah vertikal ada di akhir path
+            for vertical, before in ((True, states[j - 1][i] if j else None),
+                                     (False, row[i - 1] if i else None)):
+                if not before:
+                    continue
+                for used, (gained, _, _) in before.items():
+                    after, total = used, gained
+                    if points and used + points <= capacity:
+                        after, total = used + points, gained + points
+                    if cell == base_cell:
+                        after = 0
+                    if after not in here or total > here[after][0]:
+                        here[after] = (total, vertical, used)
+            row.append(here)
+        states.append(row)
+
+    end = states[ny][nx]
+    if not end:
+        return None
+    horizontal, vertical = ("EAST" if dx > 0 else "WEST"), ("SOUTH" if dy > 0 else "NORTH")
+    path = []
+    # Poin terbanyak; kalau seri, yang menyisakan slot terbanyak
+    i, j, used = nx, ny, min(end, key=lambda u: (-end[u][0], u))
+    while i or j:
+        _, from_vertical, used = states[j][i][used]
+        if from_vertical:
+            path.append(vertical)
+            j -= 1
+        else:
+            path.append(horizontal)
+            i -= 1
+    path.reverse()
+    return path
+
+
+def collected(board, start, path, carried=0, capacity=5, base=None):
+    """Points walking path from start picks up, by the same pickup and
+    deposit rules, or None when it steps on a wall, teleporter or other
+    bot before its last cell."""
+    grid = board.grid
+    x, y = start["x"], start["y"]
+    used, gained = carried, 0
+    last = len(path) - 1
+    for i, direction in enumerate(path):
+        dx, dy = _DELTA[direction]
+        x, y = x + dx, y + dy
+        if not grid.in_bounds(x, y):
+            return None
+        flag = grid.cells[y * grid.width + x]
+        if flag & _BLOCKED and i < last:
+            return None
+        if flag & FLAG_DIAMOND:
+            points = _points(board, x, y)
+            if used + points <= capacity:
+                used += points
+                gained += points
+        if base is not None and x == base["x"] and y == base["y"]:
+            used = 0
+    return gained
@@ -0,0 +1,128 @@
+import threading
+import time
+
+
+class PlanPipeline:
+    """Runs a planning function on a background thread, one job at a time.
+
+    The I/O thread submits the inputs of its next decision as soon as it
+    can predict them (typically just before sending the last move of a
+    path) and collects the result with take() once the server has
+    answered. Planning then overlaps the round trip and the cooldown
+    instead of sitting between two moves.
+
+    The handoff is a single condition variable around two slots: the
+    newest job and the newest result. Submitting replaces a job that has
+    not started yet. The caller checks whether its prediction came true
+    and calls discard() when it did not; results for discarded or
+    superseded tickets are never returned.
+
+    With threaded=False take() runs the job inline, which gives the same
+    results without a second thread (useful for debugging).
+    """
+
+    def __init__(self, plan, threaded=True):
+        self.plan = plan
+        self.threaded = threaded
+        self._cond = threading.Condition()
+        self._ticket = 0
+        self._job = None        # (ticket, args) not started yet
+        self._running = None    # ticket being planned right now
+        self._result = None     # (ticket, ok, value)
+        self._closed = False
+
+        self.planned = 0
+        self.used = 0
+        self.stale = 0
+        self.blocked = 0.0      # seconds take() waited for the planner
+
+        self._thread = None
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="planner", daemon=True)
+            self._thread.start()
+
+    def submit(self, *args):
+        """Queue plan(*args); returns the ticket to take() the result with."""
+        with self._cond:
+            self._ticket += 1
+            self._job = (self._ticket, args)
+            self._cond.notify_all()
+            return self._ticket
+
+    def discard(self, ticket):
+        """The prediction behind ticket turned out wrong: drop its plan."""
+        with self._cond:
+            if self._job is not None and self._job[0] == ticket:
+                self._job = None
+            if self._result is not None and self._result[0] == ticket:
+                self._result = None
+            self.stale += 1
+
+    def take(self, ticket):
+        """Plan for ticket, waiting if it is still being computed.
+
+        Returns None when the ticket was superseded or discarded.
+        Exceptions raised by the plan function are re-raised here.
+        """
+        start = time.perf_counter()
+        with self._cond:
+            while True:
+                if self._result is not None and self._result[0] == ticket:
+                    _, ok, value = self._result
+                    self._result = None
+                    break
+                pending = self._job is not None and self._job[0] == ticket
+                if not pending and self._running != ticket:
+                    return None
+                if not self.threaded:
+                    _, args = self._job
+                    self._job = None
+                    _, ok, value = self._execute(ticket, args)
+                    break
+                self._cond.wait()
+        self.blocked += time.perf_counter() - start
+        self.used += 1
+        if not ok:
+            raise value
+        return value
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self):
+        return {
+            "planned": self.planned,
+            "used": self.used,
+            "stale": self.stale,
+            "blocked_ms": self.blocked * 1000,
+        }
+
+    # -- internals -------------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._job is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                ticket, args = self._job
+                self._job = None
+                self._running = ticket
+            result = self._execute(ticket, args)
+            with self._cond:
+                self._running = None
+                if ticket == self._ticket:
+                    self._result = result
+                self._cond.notify_all()
+
+    def _execute(self, ticket, args):
+        self.planned += 1
+        try:
+            return ticket, True, self.plan(*args)
+        except Exception as e:
+            return ticket, False, e
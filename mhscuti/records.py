@@ -0,0 +1,105 @@
+from array import array
+from collections import namedtuple
+from operator import itemgetter
+
+from mhscuti.pathfinding import DELTAS, DIRECTIONS
+
+_x = itemgetter(0)
+_y = itemgetter(1)
+_STEPS = dict(zip(DIRECTIONS, DELTAS))
+
+
+class Position(tuple):
+    """Immutable board cell (x, y).
+
+    Also readable as pos["x"] / pos["y"] and equal to the {"x", "y"} dict
+    of the same cell, so it can be passed anywhere a payload position is
+    expected. Being immutable it never needs to be copied.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, x, y):
+        return tuple.__new__(cls, (x, y))
+
+    @classmethod
+    def of(cls, pos):
+        """Position from a payload dict (or a Position); None stays None."""
+        if pos is None or type(pos) is cls:
+            return pos
+        return tuple.__new__(cls, (pos["x"], pos["y"]))
+
+    x = property(_x)
+    y = property(_y)
+
+    def __getitem__(self, key):
+        if key == "x":
+            return _x(self)
+        if key == "y":
+            return _y(self)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key == "x" or key == "y":
+            return self[key]
+        return default
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return other.get("x") == _x(self) and other.get("y") == _y(self)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self):
+        return f"({_x(self)}, {_y(self)})"
+
+    def step(self, direction):
+        """Cell one move in direction ("NORTH", ...) away, walls ignored."""
+        dx, dy = _STEPS[direction]
+        return tuple.__new__(Position, (_x(self) + dx, _y(self) + dy))
+
+    def cell(self, width):
+        return _y(self) * width + _x(self)
+
+
+class GameObject(namedtuple("GameObject", "id type position properties")):
+    """Immutable view of one payload game object.
+
+    properties is the payload's own dict, shared rather than copied; treat
+    it as read-only.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, obj):
+        return cls(obj.get("id"), obj.get("type"), Position.of(obj.get("position")),
+                   obj.get("properties") or {})
+
+    @property
+    def points(self):
+        return self.properties.get("points", 1)
+
+    @property
+    def pair_id(self):
+        return self.properties.get("pairId")
+
+
+Columns = namedtuple("Columns", "ids xs ys cells points")
+Columns.__doc__ = """Struct-of-arrays view of a list of GameObjects.
+
+Every column is indexed like the list it came from; xs, ys, cells
+(y * width + x) and points are compact int arrays for bulk numeric work.
+"""
+
+
+def columns(records, width):
+    xs = array("l", [r.position[0] for r in records])
+    ys = array("l", [r.position[1] for r in records])
+    cells = array("l", [y * width + x for x, y in zip(xs, ys)])
+    points = array("l", [r.properties.get("points", 1) for r in records])
+    return Columns(tuple(r.id for r in records), xs, ys, cells, points)
@@ -0,0 +1,293 @@
+import heapq
+
+from mhscuti.pathfinding import DELTAS, DIRECTIONS
+
+INF = float("inf")
+BOT = "BotGameObject"
+BOT_LOOKAHEAD = 3   # bot lain sejauh ini di depan route memicu perbaikan
+
+# Hasil PathMonitor.advance()
+ON_PLAN = "on_plan"
+REPAIRED = "repaired"
+ARRIVED = "arrived"
+TARGET_GONE = "target_gone"
+UNREACHABLE = "unreachable"
+
+
+class DStarLite:
+    """Shortest path to a fixed goal that is repaired instead of recomputed.
+
+    D* Lite (Koenig & Likhachev) searches backwards from the goal, so its
+    g-values stay valid when the bot ends up somewhere else: moving the
+    start or blocking a few cells only re-expands the states whose cost
+    actually changed. Runs on a RoutingGraph, so teleporters are ordinary
+    one-move edges; a blocked cell makes every step onto it impassable.
+    Walls stay blocked (block()); cells taken by other bots are replaced
+    as a set every time they move (occupy()).
+    """
+
+    def __init__(self, graph, start, goal, blocked=()):
+        self.graph = graph
+        self.width = graph.width
+        self.table = graph.table
+        self.reverse = graph.reverse_table
+        size = graph.width * graph.height
+        self.goal = self._index(goal)
+        self.start = self._index(start)
+        self._last = self.start
+        self.blocked = set()
+        self._walls = set()
+        self._bots = set()
+        self.g = [INF] * size
+        self.rhs = [INF] * size
+        self.km = 0
+        self.expanded = 0
+        self._heap = []
+        self._open = {}     # cell -> key yang berlaku (entry heap lain sudah basi)
+
+        # Manhattan ke teleporter terdekat: min(md(a, b), tp(a) + tp(b)) tetap
+        # admissible dan memenuhi ketaksamaan segitiga walau ada teleport
+        self._tp = graph.teleport_distance
+
+        for pos in blocked:
+            self.blocked.add(self._index(pos))
+        self._walls.update(self.blocked)
+        self.rhs[self.goal] = 0
+        self._push(self.goal)
+
+    def _index(self, pos):
+        return pos["y"] * self.width + pos["x"]
+
+    def _h(self, a, b):
+        w = self.width
+        md = abs(a % w - b % w) + abs(a // w - b // w)
+        if self._tp is not None:
+            return min(md, self._tp[a] + self._tp[b])
+        return md
+
+    def _key(self, cell):
+        m = min(self.g[cell], self.rhs[cell])
+        return (m + self._h(self.start, cell) + self.km, m)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self._open[cell] = key
+        heapq.heappush(self._heap, (key, cell))
+
+    def _top(self):
+        heap, open_ = self._heap, self._open
+        while heap and open_.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _stepped(self, cell, code):
+        dx, dy = DELTAS[code]
+        return cell + dx + dy * self.width
+
+    def _update(self, cell):
+        if cell != self.goal:
+            best = INF
+            g, blocked = self.g, self.blocked
+            for landing, code in self.table[cell]:
+                if blocked and self._stepped(cell, code) in blocked:
+                    continue
+                cost = 1 + g[landing]
+                if cost < best:
+                    best = cost
+            self.rhs[cell] = best
+        if self.g[cell] != self.rhs[cell]:
+            self._push(cell)
+        else:
+            self._open.pop(cell, None)
+
+    def _compute(self):
+        g, rhs, start = self.g, self.rhs, self.start
+        while True:
+            top = self._top()
+            if top is None:
+                return
+            if not (top[0] < self._key(start) or rhs[start] != g[start]):
+                return
+            key, cell = heapq.heappop(self._heap)
+            del self._open[cell]
+            self.expanded += 1
+            new_key = self._key(cell)
+            if key < new_key:
+                self._push(cell)
+            elif g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+                for origin, _ in self.reverse[cell]:
+                    self._update(origin)
+            else:
+                g[cell] = INF
+                self._update(cell)
+                for origin, _ in self.reverse[cell]:
+                    self._update(origin)
+
+    def move_to(self, pos):
+        """The bot is now at pos (expected or not)."""
+        cell = self._index(pos)
+        self.km += self._h(self._last, cell)
+        self._last = self.start = cell
+
+    def _changed(self, cell):
+        # Langkah ke cell hanya ada dari keempat tetangganya
+        w, h = self.width, self.graph.height
+        x, y = cell % w, cell // w
+        for dx, dy in DELTAS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                self._update(ny * w + nx)
+
+    def block(self, positions):
+        """Cells that can no longer be stepped on; returns True if any were new."""
+        changed = False
+        for pos in positions:
+            cell = self._index(pos)
+            self._walls.add(cell)
+            if cell in self.blocked:
+                continue
+            self.blocked.add(cell)
+            changed = True
+            self._changed(cell)
+        return changed
+
+    def occupy(self, positions):
+        """Cells other bots stand on now, replacing the previous set; returns
+        True if any cell changed."""
+        cells = {self._index(pos) for pos in positions} - self._walls
+        cells.discard(self.goal)
+        left, entered = self._bots - cells, cells - self._bots
+        self._bots = cells
+        for cell in left:
+            self.blocked.discard(cell)
+            self._changed(cell)
+        for cell in entered:
+            self.blocked.add(cell)
+            self._changed(cell)
+        return bool(left or entered)
+
+    def path(self):
+        """Direction list from the current start to the goal, or None."""
+        self._compute()
+        cell, goal = self.start, self.goal
+        if self.rhs[cell] == INF:
+            return None
+        g, blocked = self.g, self.blocked
+        path = []
+        limit = len(g)
+        while cell != goal:
+            best, best_entry = INF, None
+            for landing, code in self.table[cell]:
+                if blocked and self._stepped(cell, code) in blocked:
+                    continue
+                cost = 1 + g[landing]
+                if cost < best:
+                    best, best_entry = cost, (landing, code)
+            if best_entry is None or len(path) >= limit:
+                return None
+            cell = best_entry[0]
+            path.append(DIRECTIONS[best_entry[1]])
+        return path
+
+
+class PathMonitor:
+    """Checks every post-move state against what the plan assumed.
+
+    The plan assumes the goal is still there (for goal_type objects such
+    as diamonds), that each move lands where the routing graph says, and
+    that no wall or other bot is in the way: a new wall anywhere on the
+    rest of the route, or another bot on one of the next BOT_LOOKAHEAD
+    steps. advance() returns TARGET_GONE when the goal disappeared, so
+    the caller can pick a new one instead of walking to an empty cell,
+    and repairs the remaining directions with D* Lite when the bot was
+    displaced or blocked. The repaired route avoids every cell another
+    bot stands on at that moment (the goal excepted); those cells are
+    freed again at the next repair once the bots have moved. The D* Lite
+    tree is built at the first repair and reused for later ones. The goal
+    must be a cell the bot can stop on (not a teleporter).
+    """
+
+    def __init__(self, graph, start, goal, directions, goal_type=None):
+        self.graph = graph
+        self.goal = goal
+        self.goal_type = goal_type
+        self.width = graph.width
+        self.dstar = None
+        self.repairs = 0
+        self.remaining = list(directions)
+        self._expect(start)
+        if not self.consistent:
+            # Mis. path A* tanpa teleport yang melewati sel teleport
+            self._repair(start, ())
+
+    def _expect(self, start):
+        # Sel yang diasumsikan plan setelah tiap langkah, dan sel yang diinjak
+        w = self.width
+        cell = start["y"] * w + start["x"]
+        self.landings, self.stepped = [], []
+        ok = True
+        for direction in self.remaining:
+            code = DIRECTIONS.index(direction)
+            landing = next((nb for nb, c in self.graph.table[cell] if c == code), None)
+            if landing is None:
+                ok = False
+                break
+            dx, dy = DELTAS[code]
+            self.stepped.append(cell + dx + dy * w)
+            self.landings.append(landing)
+            cell = landing
+        self.consistent = ok and cell == self.goal["y"] * w + self.goal["x"]
+
+    def _position(self, cell):
+        return {"x": cell % self.width, "y": cell // self.width}
+
+    def _repair(self, position, blockers, bots=()):
+        if self.dstar is None:
+            self.dstar = DStarLite(self.graph, position, self.goal, blockers)
+        else:
+            self.dstar.move_to(position)
+            self.dstar.block(blockers)
+        self.dstar.occupy(bots)
+        self.repairs += 1
+        path = self.dstar.path()
+        if path is None and self.dstar.occupy(()):
+            # Hanya bot lain yang menutup jalan: lewat saja (tackle) daripada menyerah
+            path = self.dstar.path()
+        self.remaining = path or []
+        self._expect(position)
+        return path is not None
+
+    def next_direction(self):
+        return self.remaining[0] if self.remaining else None
+
+    def advance(self, board, position):
+        """Call after each successful move with the new board and position."""
+        expected = self.landings[0] if self.landings else None
+        self.remaining = self.remaining[1:]
+        self.landings, self.stepped = self.landings[1:], self.stepped[1:]
+        if position is None:
+            return UNREACHABLE
+        if position["x"] == self.goal["x"] and position["y"] == self.goal["y"]:
+            self.remaining = []
+            return ARRIVED
+
+        if self.goal_type is not None:
+            if not any(obj.get("type") == self.goal_type for obj in board.at(self.goal["x"], self.goal["y"])):
+                return TARGET_GONE
+
+        grid = board.grid
+        blockers = [self._position(cell) for cell in self.stepped
+                    if grid.is_wall(cell % self.width, cell // self.width)]
+        # Bot lain (bukan kita sendiri, yang ada di position)
+        bots = [obj["position"] for obj in board.of_type(BOT)
+                if obj["position"]["x"] != position["x"] or obj["position"]["y"] != position["y"]]
+        goal_cell = self.goal["y"] * self.width + self.goal["x"]
+        ahead = {cell for cell in self.stepped[:BOT_LOOKAHEAD] if cell != goal_cell}
+        in_way = any(pos["y"] * self.width + pos["x"] in ahead for pos in bots)
+        cell = position["y"] * self.width + position["x"]
+        if cell != expected or blockers or in_way or not self.remaining:
+            if not self._repair(position, blockers, bots):
+                return UNREACHABLE
+            return REPAIRED
+        return ON_PLAN
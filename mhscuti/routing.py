@@ -0,0 +1,164 @@
+from collections import deque
+
+from mhscuti.pathfinding import DIRECTIONS, components, neighbor_table
+
+
+class RoutingGraph:
+    """Walking graph of one board layout, with teleporters as edges.
+
+    Stepping onto a teleporter moves the bot to its partner for free, so the
+    zero-cost hop is folded into the one-cost step that enters the
+    teleporter: the edge lands on the partner cell directly. Every edge then
+    costs exactly one move, and plain BFS (0-1 BFS with no zero edges left)
+    gives exact shortest routes through any number of pairs and chains.
+
+    No walk ends on the teleporter it stepped on, so a teleporter as a goal
+    is reached at landing(pos), its partner's cell, by a path whose last
+    step enters it.
+    """
+
+    def __init__(self, grid, teleport_pairs=None):
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+        width = grid.width
+
+        # Sel teleport -> sel pasangannya (hanya pasangan lengkap)
+        self.exits = {}
+        for positions in (teleport_pairs or {}).values():
+            if len(positions) != 2:
+                continue
+            a, b = positions
+            if not (grid.in_bounds(a["x"], a["y"]) and grid.in_bounds(b["x"], b["y"])):
+                continue
+            ia, ib = a["y"] * width + a["x"], b["y"] * width + b["x"]
+            if ia != ib:
+                self.exits[ia] = ib
+                self.exits[ib] = ia
+
+        base = neighbor_table(grid)
+        if not self.exits:
+            self.table = base
+        else:
+            exits = self.exits
+            self.table = [tuple((exits.get(nb, nb), code) for nb, code in entries)
+                          for entries in base]
+        self._reverse = None
+        self._teleport_distance = None
+        self._components = None
+
+    @property
+    def reverse_table(self):
+        """Per cell: (cell that lands here, direction it moves in)."""
+        if self._reverse is None:
+            reverse = [[] for _ in self.table]
+            for node, entries in enumerate(self.table):
+                for landing, code in entries:
+                    reverse[landing].append((node, code))
+            self._reverse = [tuple(entries) for entries in reverse]
+        return self._reverse
+
+    @property
+    def teleport_distance(self):
+        """Per cell: Manhattan distance to the nearest teleporter, walls
+        ignored (a lower bound for A* heuristics), or None without any."""
+        if self._teleport_distance is None and self.exits:
+            # Distance transform L1 dua arah: kiri/atas lalu kanan/bawah
+            width, size = self.width, self.width * self.height
+            dist = [size] * size
+            for cell in self.exits:
+                dist[cell] = 0
+            for i in range(size):
+                if i % width and dist[i - 1] + 1 < dist[i]:
+                    dist[i] = dist[i - 1] + 1
+                if i >= width and dist[i - width] + 1 < dist[i]:
+                    dist[i] = dist[i - width] + 1
+            for i in range(size - 1, -1, -1):
+                if (i + 1) % width and dist[i + 1] + 1 < dist[i]:
+                    dist[i] = dist[i + 1] + 1
+                if i + width < size and dist[i + width] + 1 < dist[i]:
+                    dist[i] = dist[i + width] + 1
+            self._teleport_distance = dist
+        return self._teleport_distance
+
+    @property
+    def components(self):
+        """Component labels like pathfinding.components, with the
+        components a teleporter pair joins merged into one."""
+        if self._components is None:
+            labels = components(self.grid)
+            if self.exits:
+                # Union-find di atas label komponen, satu union per pasangan
+                root = list(range(max(labels) + 1))
+
+                def find(label):
+                    while root[label] != label:
+                        root[label] = root[root[label]]
+                        label = root[label]
+                    return label
+
+                for a, b in self.exits.items():
+                    if labels[a] >= 0 and labels[b] >= 0:
+                        root[find(labels[a])] = find(labels[b])
+                labels = [find(label) if label >= 0 else -1 for label in labels]
+            self._components = labels
+        return self._components
+
+    def _index(self, pos):
+        x, y = pos["x"], pos["y"]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    def landing(self, pos):
+        """Cell a step onto pos ends on: the partner for a teleporter, else pos."""
+        idx = self._index(pos)
+        return None if idx is None else self.exits.get(idx, idx)
+
+    def path(self, start, goal):
+        """Shortest direction list from start to goal, or None if unreachable."""
+        source, target = self._index(start), self.landing(goal)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return []
+
+        table = self.table
+        parent = {source: (-1, 0)}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for landing, code in table[node]:
+                if landing in parent:
+                    continue
+                parent[landing] = (node, code)
+                if landing == target:
+                    path = []
+                    while landing != source:
+                        landing, code = parent[landing]
+                        path.append(DIRECTIONS[code])
+                    path.reverse()
+                    return path
+                queue.append(landing)
+        return None
+
+    def distance(self, start, goal):
+        path = self.path(start, goal)
+        return None if path is None else len(path)
+
+
+class Router:
+    """Keeps one RoutingGraph per wall/teleport layout."""
+
+    def __init__(self):
+        self.graph = None
+        self._layout = None
+
+    def sync(self, board):
+        if board.layout_key != self._layout or self.graph is None:
+            self._layout = board.layout_key
+            self.graph = RoutingGraph(board.grid, board.teleport_pairs)
+        return self.graph
+
+    def path(self, start, goal):
+        return self.graph.path(start, goal) if self.graph else None
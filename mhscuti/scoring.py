@@ -0,0 +1,103 @@
+from itertools import repeat
+
+import numpy as np
+
+from mhscuti.board_state import BASE, BUTTON, DIAMOND, TELEPORT
+
+HOME = "HomePosition"   # target buatan riveldo/randy: titik spawn
+
+
+class Preset:
+    """One bot's target formula, split as value = combine(weight, distance).
+
+    The weight is everything that doesn't depend on the distance (points,
+    type, inventory) and is computed for all candidates at once as a
+    float64 array. combine never grows with the distance, so
+    value(max weight, d) bounds every target not reached by depth d,
+    which is what the selection BFS needs to stop early. value() is the
+    scalar version the BFS scores with, one reached target at a time;
+    values() does the same float arithmetic over whole arrays (the batch
+    engine), so both give identical numbers: the same numbers as the
+    bots' original per-target code, or for points_first (originally a
+    tuple key) the same order.
+    """
+
+    def __init__(self, name, weigh, combine, combine_one):
+        self.name = name
+        self._weigh = weigh
+        self._combine = combine
+        self._combine_one = combine_one
+
+    def weights(self, points, kinds=None, **context):
+        return self._weigh(np.asarray(points, dtype=np.float64), kinds, **context)
+
+    def values(self, weights, distances):
+        """Values for all candidates; distance inf means not reached."""
+        return self._combine(weights, distances)
+
+    def value(self, weight, distance):
+        return self._combine_one(weight, distance)
+
+
+# main.py: points / max(distance, 1); tidak terjangkau -> 0
+def _points(points, kinds, **context):
+    return points
+
+
+SCORE_PER_DISTANCE = Preset(
+    "score_per_distance", _points,
+    lambda w, d: w / np.maximum(d, 1),
+    lambda w, d: w / max(d, 1))
+
+
+# oda: poin tertinggi dulu, lalu terdekat. Urutan (poin, -jarak) dikodekan sebagai
+# satu float points * 2**32 - jarak, eksak selama poin < 2**21.
+_SCALE = float(1 << 32)
+_UNREACHED = float(1 << 31)
+
+
+def _points_first_weights(points, kinds, **context):
+    return points * _SCALE
+
+
+POINTS_FIRST = Preset(
+    "points_first", _points_first_weights,
+    # Diamond yang tidak terjangkau tetap di atas diamond dengan poin lebih kecil,
+    # di belakang yang poinnya sama (seperti jarak inf di sort lama)
+    lambda w, d: w - np.minimum(d, _UNREACHED),
+    lambda w, d: w - min(d, _UNREACHED))
+
+
+# riveldo/randy (greedy value, dulu calculate_greedy_value): bobot per type dibagi (jarak + 1).
+# Type dipetakan ke kode kecil sekali jalan (map di level C), lalu bobotnya
+# dibaca dari tabel per kode.
+_KIND_CODES = {DIAMOND: 1, BASE: 2, BUTTON: 3, TELEPORT: 4, HOME: 5}
+
+
+def _greedy_weights(points, kinds, inventory=0, inventory_size=5, has_red_button=False,
+                    diamond_visits=0, **context):
+    codes = np.fromiter(map(_KIND_CODES.get, kinds, repeat(0)), dtype=np.int8, count=len(points))
+    table = np.zeros(len(_KIND_CODES) + 1)
+    if has_red_button:
+        table[_KIND_CODES[BUTTON]] = 7
+    if inventory >= inventory_size:
+        table[_KIND_CODES[BASE]] = 100
+    elif inventory > 0:
+        table[_KIND_CODES[BASE]] = inventory * 3
+    table[_KIND_CODES[TELEPORT]] = 1
+    if diamond_visits >= 5:
+        table[_KIND_CODES[HOME]] = 200
+    weights = table[codes]
+    diamond = codes == _KIND_CODES[DIAMOND]
+    weights[diamond] = np.where(points[diamond] > 1, 10 * points[diamond], 2.0)
+    return weights
+
+
+GREEDY_VALUE = Preset(
+    "greedy_value", _greedy_weights,
+    lambda w, d: w / (d + 1),
+    lambda w, d: w / (d + 1))
+
+
+PRESETS = {preset.name: preset for preset in (SCORE_PER_DISTANCE, POINTS_FIRST, GREEDY_VALUE)}
+
@@ -0,0 +1,218 @@
+# Server pengganti Etimo Diamonds untuk run offline:
+#
+#   python -m mhscuti.server --port 3000 --seed 1 --latency 0.02
+#
+# lalu arahkan base_url bot ke http://localhost:3000/api/bots/<id-apa-saja>.
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mhscuti.simulator import Game, SimError
+
+_BOT_ROUTE = re.compile(r"^/api/bots/([^/]+)(/join|/move)?/?$")
+_BOARD_ROUTE = re.compile(r"^/api/boards(?:/(\d+))?/?$")
+
+
+def handle_request(game, method, path, body=None):
+    """Route one API call to the game; returns (status, JSON-able data)."""
+    path = path.split("?", 1)[0]
+    body = body or {}
+    try:
+        match = _BOARD_ROUTE.match(path)
+        if match and method == "GET":
+            if match.group(1):
+                return 200, game.board_payload(int(match.group(1)))
+            return 200, game.boards_payload()
+
+        match = _BOT_ROUTE.match(path)
+        if match:
+            bot_id, action = match.groups()
+            if action is None and method == "GET":
+                return 200, game.bot_info(bot_id)
+            if action == "/join" and method == "POST":
+                return 200, game.join(bot_id, body.get("preferredBoardId"))
+            if action == "/move" and method == "POST":
+                return 200, game.move(bot_id, body.get("direction"))
+        raise SimError(404, f"Cannot {method} {path}")
+    except SimError as e:
+        return e.status, {"statusCode": e.status, "message": e.message}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MhsCutiStandIn/1.0"
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            super().log_message(*args)
+
+    def _reply(self, status, data):
+        body = json.dumps(data).encode()
+        # Satu write: header + body, supaya tidak kena delay Nagle/ACK
+        self.wfile.write(
+            f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+
+    def _delay(self):
+        # Called before and after handling: each direction gets half the
+        # round trip, so the move is stamped about RTT/2 after it was sent.
+        latency, jitter = self.server.latency, self.server.jitter
+        if latency or jitter:
+            time.sleep(max(0.0, latency + random.uniform(-jitter, jitter)) / 2)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            raise SimError(400, "Invalid JSON body")
+
+    def _dispatch(self, method):
+        self._delay()
+        try:
+            body = self._read_json() if method == "POST" else None
+        except SimError as e:
+            return self._reply(e.status, {"statusCode": e.status, "message": e.message})
+        result = handle_request(self.server.game, method, self.path, body)
+        self._delay()
+        self._reply(*result)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+
+class StandInServer:
+    """Local HTTP server implementing the board/bot endpoints the bots call.
+
+    Runs in a background thread; url is the ".../api" prefix to hand to the
+    clients. latency (+/- jitter) seconds of round trip are added to every
+    request, half before and half after the game handles it.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, game=None, latency=0.0, jitter=0.0,
+                 verbose=False, **game_options):
+        self.game = game or Game(**game_options)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.game = self.game
+        self.httpd.latency = latency
+        self.httpd.jitter = jitter
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def bot_url(self, bot_id):
+        return f"{self.url}/bots/{bot_id}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class LocalResponse:
+    """Response from LocalTransport, shaped like requests.Response."""
+
+    decoded = True      # json() returns the payload without parsing anything
+
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self._data = data
+
+    @property
+    def text(self):
+        return json.dumps(self._data)
+
+    def json(self):
+        return self._data
+
+
+class LocalTransport:
+    """Calls the game directly instead of going over HTTP.
+
+    Any URL containing /api/... is routed, so clients keep their normal
+    base_url. Together with a VirtualClock shared with the game this
+    replays full games without sockets or real sleeps.
+    """
+
+    def __init__(self, game):
+        self.game = game
+
+    def _route(self, method, url, payload=None):
+        path = url[url.index("/api/"):] if "/api/" in url else url
+        return LocalResponse(*handle_request(self.game, method, path, payload))
+
+    def get(self, url, timeout=None):
+        return self._route("GET", url)
+
+    def post(self, url, payload, timeout=None):
+        return self._route("POST", url, payload)
+
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in for the Etimo Diamonds API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--boards", type=int, default=1)
+    parser.add_argument("--width", type=int, default=15)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--diamonds", type=int, default=12)
+    parser.add_argument("--red-ratio", type=float, default=0.2)
+    parser.add_argument("--walls", type=int, default=0)
+    parser.add_argument("--teleports", type=int, default=1, help="number of teleporter pairs")
+    parser.add_argument("--no-button", action="store_true")
+    parser.add_argument("--inventory-size", type=int, default=5)
+    parser.add_argument("--min-delay", type=int, default=100, help="ms between moves")
+    parser.add_argument("--session", type=int, default=60, help="seconds per bot session")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = StandInServer(
+        args.host, args.port, latency=args.latency, jitter=args.jitter, verbose=args.verbose,
+        boards=args.boards, seed=args.seed, width=args.width, height=args.height,
+        diamonds=args.diamonds, red_ratio=args.red_ratio, walls=args.walls,
+        teleport_pairs=args.teleports, button=not args.no_button,
+        inventory_size=args.inventory_size, min_delay_ms=args.min_delay,
+        session_seconds=args.session)
+    print(f"Stand-in server listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import random
+import threading
+import time
+
+DIRECTIONS = {"NORTH": (0, -1), "SOUTH": (0, 1), "EAST": (1, 0), "WEST": (-1, 0)}
+
+
+class SimError(Exception):
+    """Rejected request; status is the HTTP status the server answers with."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SimBot:
+    def __init__(self, bot_id, name):
+        self.id = bot_id
+        self.name = name
+        self.board_id = None
+        self.x = self.y = 0
+        self.base = (0, 0)
+        self.diamonds = 0
+        self.score = 0
+        self.inventory_size = 5
+        self.joined_at = 0.0
+        self.last_move_at = None
+
+
+class SimBoard:
+    """One board with the rules the bots play against.
+
+    Diamonds are worth 1 (blue) or 2 (red) and take that many inventory
+    slots. Stepping on your own base deposits the inventory into score,
+    stepping on a teleporter moves you to its partner, stepping on the
+    diamond button regenerates every diamond, and stepping on another bot
+    tackles it (its diamonds move to you, it goes back to its base).
+    Walls block movement. Moves closer together than min_delay_ms are
+    rejected, and bots leave the board after session_seconds.
+    """
+
+    def __init__(self, board_id=1, width=15, height=15, seed=None, diamonds=12,
+                 red_ratio=0.2, walls=0, teleport_pairs=1, button=True,
+                 inventory_size=5, min_delay_ms=100, session_seconds=60,
+                 clock=time.monotonic):
+        self.id = board_id
+        self.width = width
+        self.height = height
+        self.rng = random.Random(seed)
+        self.diamond_target = diamonds
+        self.red_ratio = red_ratio
+        self.inventory_size = inventory_size
+        self.min_delay_ms = min_delay_ms
+        self.session_seconds = session_seconds
+        self.clock = clock
+
+        self.bots = {}          # bot id -> SimBot
+        self.walls = set()
+        self.diamonds = {}      # (x, y) -> points
+        self.teleports = {}     # (x, y) -> (x, y) pasangannya
+        self.teleport_ids = {}  # (x, y) -> pairId
+        self.button = None
+        self._ids = {}          # (jenis, kunci) -> id objek, tetap selama objeknya ada
+        self._next_id = 1
+
+        for _ in range(walls):
+            self.walls.add(self._free_cell())
+        for pair in range(teleport_pairs):
+            a, b = self._free_cell(), None
+            self.teleports[a] = a   # reservasi sementara supaya b tidak sama
+            b = self._free_cell()
+            self.teleports[a], self.teleports[b] = b, a
+            self.teleport_ids[a] = self.teleport_ids[b] = f"tp{pair + 1}"
+        if button:
+            self.button = self._free_cell()
+        self.regenerate_diamonds()
+
+    # -- generation ------------------------------------------------------
+
+    def _occupied(self):
+        occupied = set(self.walls) | set(self.teleports) | set(self.diamonds)
+        if self.button:
+            occupied.add(self.button)
+        for bot in self.bots.values():
+            occupied.add((bot.x, bot.y))
+            occupied.add(bot.base)
+        return occupied
+
+    def _free_cell(self):
+        occupied = self._occupied()
+        if len(occupied) >= self.width * self.height:
+            raise SimError(409, "Board is full")
+        while True:
+            cell = (self.rng.randrange(self.width), self.rng.randrange(self.height))
+            if cell not in occupied:
+                return cell
+
+    def regenerate_diamonds(self):
+        for cell in self.diamonds:
+            self._ids.pop(("diamond", cell), None)
+        self.diamonds = {}
+        for _ in range(self.diamond_target):
+            self.diamonds[self._free_cell()] = 2 if self.rng.random() < self.red_ratio else 1
+
+    # -- game actions ----------------------------------------------------
+
+    def expire_bots(self):
+        now = self.clock()
+        for bot in list(self.bots.values()):
+            if now - bot.joined_at >= self.session_seconds:
+                self.remove(bot)
+
+    def join(self, bot):
+        if bot.id in self.bots:
+            raise SimError(409, "Bot already on a board")
+        bot.base = self._free_cell()
+        bot.x, bot.y = bot.base
+        bot.diamonds = 0
+        bot.inventory_size = self.inventory_size
+        bot.joined_at = self.clock()
+        bot.last_move_at = None
+        bot.board_id = self.id
+        self.bots[bot.id] = bot
+
+    def remove(self, bot):
+        self.bots.pop(bot.id, None)
+        bot.board_id = None
+
+    def move(self, bot, direction):
+        if direction not in DIRECTIONS:
+            raise SimError(400, f"Invalid direction {direction}")
+        now = self.clock()
+        # Compared in whole milliseconds like the real server, so a client
+        # waiting exactly min_delay is not rejected by float rounding.
+        if bot.last_move_at is not None and round((now - bot.last_move_at) * 1000) < self.min_delay_ms:
+            raise SimError(429, "Move too early")
+
+        dx, dy = DIRECTIONS[direction]
+        x, y = bot.x + dx, bot.y + dy
+        if not (0 <= x < self.width and 0 <= y < self.height) or (x, y) in self.walls:
+            raise SimError(400, "Move not legal")
+        bot.last_move_at = now
+
+        for other in self.bots.values():
+            if other is not bot and (other.x, other.y) == (x, y):
+                taken = min(other.diamonds, bot.inventory_size - bot.diamonds)
+                bot.diamonds += taken
+                other.diamonds = 0
+                other.x, other.y = other.base
+
+        if (x, y) in self.teleports:
+            x, y = self.teleports[(x, y)]
+        bot.x, bot.y = x, y
+
+        points = self.diamonds.get((x, y))
+        if points is not None and bot.diamonds + points <= bot.inventory_size:
+            bot.diamonds += points
+            del self.diamonds[(x, y)]
+            self._ids.pop(("diamond", (x, y)), None)
+        if (x, y) == bot.base:
+            bot.score += bot.diamonds
+            bot.diamonds = 0
+        if (x, y) == self.button:
+            self.button = None
+            self.regenerate_diamonds()
+            self.button = self._free_cell()
+        elif len(self.diamonds) * 5 < self.diamond_target:
+            # Sisa diamond di bawah 20%: isi ulang board seperti server asli
+            self.regenerate_diamonds()
+
+    # -- payload ---------------------------------------------------------
+
+    def _object(self, obj_type, cell, properties, key):
+        # Id stabil per objek seperti server asli: diamond baru dapat id baru,
+        # objek yang hanya berpindah (button) tetap memakai id lamanya
+        obj_id = self._ids.get(key)
+        if obj_id is None:
+            obj_id = self._ids[key] = self._next_id
+            self._next_id += 1
+        return {"id": obj_id, "position": {"x": cell[0], "y": cell[1]},
+                "type": obj_type, "properties": properties}
+
+    def to_payload(self, first_bot=None):
+        """Board JSON in the server's shape; first_bot's object is listed first."""
+        now = self.clock()
+        bots = sorted(self.bots.values(), key=lambda b: b is not first_bot)
+        objects = []
+        for bot in bots:
+            left = max(0, int((self.session_seconds - (now - bot.joined_at)) * 1000))
+            obj = self._object("BotGameObject", (bot.x, bot.y), {
+                "diamonds": bot.diamonds, "score": bot.score, "name": bot.name,
+                "inventorySize": bot.inventory_size, "canTackle": True,
+                "millisecondsLeft": left, "timeJoined": bot.joined_at,
+                "base": {"x": bot.base[0], "y": bot.base[1]},
+            }, ("bot", bot.id))
+            obj["id"] = bot.id
+            objects.append(obj)
+        for bot in bots:
+            objects.append(self._object("BaseGameObject", bot.base, {"name": bot.name, "ownerId": bot.id},
+                                        ("base", bot.id)))
+        for cell, points in self.diamonds.items():
+            objects.append(self._object("DiamondGameObject", cell, {"points": points}, ("diamond", cell)))
+        for cell in self.teleports:
+            objects.append(self._object("TeleportGameObject", cell, {"pairId": self.teleport_ids[cell]},
+                                        ("teleport", cell)))
+        if self.button:
+            objects.append(self._object("DiamondButtonGameObject", self.button, {}, ("button",)))
+        for cell in self.walls:
+            objects.append(self._object("WallGameObject", cell, {}, ("wall", cell)))
+
+        return {
+            "id": self.id,
+            "width": self.width,
+            "height": self.height,
+            "minimumDelayBetweenMoves": self.min_delay_ms,
+            "features": [
+                {"name": "DiamondProvider", "config": {"generationRatio": 0.1, "redRatio": self.red_ratio}},
+                {"name": "TeleportProvider", "config": {"pairs": len(self.teleports) // 2}},
+                {"name": "BaseProvider", "config": {}},
+                {"name": "DiamondButtonProvider", "config": {}},
+            ],
+            "bots": [{"name": b.name, "id": b.id} for b in bots],
+            "gameObjects": objects,
+        }
+
+
+class Game:
+    """Boards plus the bot registry behind the stand-in server (thread-safe)."""
+
+    def __init__(self, boards=1, seed=None, clock=time.monotonic, **board_options):
+        self.clock = clock
+        self.boards = {}
+        for board_id in range(1, boards + 1):
+            board_seed = None if seed is None else seed * 1000 + board_id
+            self.boards[board_id] = SimBoard(board_id, seed=board_seed, clock=clock, **board_options)
+        self.bots = {}
+        self.lock = threading.Lock()
+
+    def register(self, bot_id, name=None):
+        with self.lock:
+            return self._bot(bot_id, name)
+
+    def _bot(self, bot_id, name=None):
+        bot = self.bots.get(bot_id)
+        if bot is None:
+            bot = SimBot(bot_id, name or f"bot-{bot_id[:6]}")
+            self.bots[bot_id] = bot
+        return bot
+
+    def boards_payload(self):
+        with self.lock:
+            for board in self.boards.values():
+                board.expire_bots()
+            return [board.to_payload() for board in self.boards.values()]
+
+    def board_payload(self, board_id):
+        with self.lock:
+            board = self.boards.get(board_id)
+            if board is None:
+                raise SimError(404, "Board not found")
+            board.expire_bots()
+            return board.to_payload()
+
+    def bot_info(self, bot_id):
+        with self.lock:
+            bot = self._bot(bot_id)
+            return {"id": bot.id, "name": bot.name, "email": f"{bot.name}@example.com",
+                    "boardId": bot.board_id}
+
+    def join(self, bot_id, preferred_board_id=None):
+        with self.lock:
+            bot = self._bot(bot_id)
+            board = self.boards.get(preferred_board_id) or next(iter(self.boards.values()))
+            board.expire_bots()
+            board.join(bot)
+            return board.to_payload(first_bot=bot)
+
+    def move(self, bot_id, direction):
+        with self.lock:
+            bot = self.bots.get(bot_id)
+            board = self.boards.get(bot.board_id) if bot else None
+            if board is not None:
+                board.expire_bots()
+            if board is None or bot.id not in board.bots:
+                raise SimError(403, "Bot is not on a board")
+            board.move(bot, direction)
+            return board.to_payload(first_bot=bot)
+
+    def random_walk(self, ticks, rnd, bot_id="bench", others=()):
+        """Joins bot_id and others to the first board and moves them in
+        random directions (rnd: a random.Random). Returns the move
+        response for each of bot_id's first ticks legal moves; used by the
+        benchmarks to replay a game."""
+        for name in (bot_id, *others):
+            self.register(name, name)
+            self.join(name, 1)
+        directions = tuple(DIRECTIONS)
+        payloads = []
+        while len(payloads) < ticks:
+            for name in others:
+                try:
+                    self.move(name, rnd.choice(directions))
+                except SimError:
+                    pass
+            try:
+                payloads.append(self.move(bot_id, rnd.choice(directions)))
+            except SimError:
+                continue
+        return payloads
@@ -0,0 +1,180 @@
+import heapq
+from itertools import count
+
+from mhscuti.board_state import BASE, BOT, DIAMOND, TELEPORT
+from mhscuti.records import GameObject
+
+TYPES = (DIAMOND, TELEPORT, BASE, BOT)
+
+
+class SpatialIndex:
+    """Board objects bucketed into size x size squares, for Manhattan queries.
+
+    nearest() visits buckets in order of their Manhattan lower bound from
+    the query cell and stops as soon as no unvisited bucket can beat the k
+    found so far; within() only opens the buckets overlapping the radius.
+    Both cost roughly the number of objects nearby, not on the board.
+    Ties are broken by insertion order, so results are deterministic.
+
+    Like BoardState, an index is never modified once built: updated()
+    returns a new one that shares every bucket the delta didn't touch.
+    """
+
+    def __init__(self, width, height, size=8, types=TYPES):
+        self.width = width
+        self.height = height
+        self.size = size
+        self.types = tuple(types)
+        self._cols = -(-width // size)
+        self._rows = -(-height // size)
+        self._buckets = {t: {} for t in self.types}  # type -> bucket -> list (seq, record)
+        self._seq = count()
+
+    @classmethod
+    def from_board(cls, board, size=8, types=TYPES):
+        width, height = board.width, board.height
+        if not width or not height:
+            # Payload tanpa ukuran board: pakai jangkauan objek terjauh (seperti grid)
+            width = 1 + max((x for x, _ in board.by_position), default=0)
+            height = 1 + max((y for _, y in board.by_position), default=0)
+        index = cls(width, height, size, types)
+        for obj_type in index.types:
+            buckets = index._buckets[obj_type]
+            for record in board.records(obj_type):
+                key = record.position and index._key(*record.position)
+                if key is not None:
+                    buckets.setdefault(key, []).append((next(index._seq), record))
+        return index
+
+    def _key(self, x, y):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return (y // self.size) * self._cols + x // self.size
+
+    def _bound(self, key, x, y):
+        # Jarak Manhattan minimum dari (x, y) ke cell mana pun di bucket key
+        size = self.size
+        left, top = (key % self._cols) * size, (key // self._cols) * size
+        dx = left - x if x < left else (x - left - size + 1 if x >= left + size else 0)
+        dy = top - y if y < top else (y - top - size + 1 if y >= top + size else 0)
+        return dx + dy
+
+    def updated(self, delta):
+        """New index with delta applied; untouched buckets are shared."""
+        index = SpatialIndex.__new__(SpatialIndex)
+        index.__dict__.update(self.__dict__)
+        index._buckets = dict(self._buckets)
+        copied_types, copied_keys = set(), set()
+
+        def bucket(obj_type, key):
+            if obj_type not in copied_types:
+                copied_types.add(obj_type)
+                index._buckets[obj_type] = dict(index._buckets[obj_type])
+            buckets = index._buckets[obj_type]
+            if (obj_type, key) not in copied_keys:
+                copied_keys.add((obj_type, key))
+                buckets[key] = list(buckets.get(key, ()))
+            return buckets[key]
+
+        def key_of(obj):
+            if obj.get("type") not in index._buckets:
+                return None
+            pos = obj.get("position")
+            return index._key(pos["x"], pos["y"]) if pos else None
+
+        def remove(obj):
+            key = key_of(obj)
+            if key is not None:
+                items = bucket(obj["type"], key)
+                for i, (_, record) in enumerate(items):
+                    if record.id == obj.get("id"):
+                        del items[i]
+                        break
+
+        def add(obj):
+            key = key_of(obj)
+            if key is not None:
+                bucket(obj["type"], key).append((next(index._seq), GameObject.of(obj)))
+
+        for obj in delta.removed:
+            remove(obj)
+        for old, new in delta.moved + delta.changed:
+            remove(old)
+            add(new)
+        for obj in delta.added:
+            add(obj)
+
+        for obj_type, key in copied_keys:
+            if not index._buckets[obj_type][key]:
+                del index._buckets[obj_type][key]
+        return index
+
+    def nearest(self, pos, k=1, types=None, where=None):
+        """Up to k (distance, record) pairs closest to pos, nearest first.
+
+        types limits the object types searched (default: all indexed);
+        where(record) filters candidates, e.g. to skip our own bot.
+        """
+        x, y = pos["x"], pos["y"]
+        maps = [self._buckets[t] for t in (types or self.types) if t in self._buckets]
+        if k <= 0 or not any(maps):
+            return []
+
+        cols, rows = self._cols, self._rows
+        bx = min(max(x // self.size, 0), cols - 1)
+        by = min(max(y // self.size, 0), rows - 1)
+        start = by * cols + bx
+        buckets = [(self._bound(start, x, y), start)]
+        queued = {start}
+        found = []   # max-heap (-jarak, -seq, record) berisi k terbaik sejauh ini
+        while buckets:
+            bound, key = heapq.heappop(buckets)
+            if len(found) >= k and bound > -found[0][0]:
+                break
+            for buckets_of_type in maps:
+                for seq, record in buckets_of_type.get(key, ()):
+                    if where is not None and not where(record):
+                        continue
+                    rx, ry = record.position
+                    item = (-(abs(rx - x) + abs(ry - y)), -seq, record)
+                    if len(found) < k:
+                        heapq.heappush(found, item)
+                    elif item[:2] > found[0][:2]:
+                        heapq.heapreplace(found, item)
+            kx, ky = key % cols, key // cols
+            for nx, ny in ((kx - 1, ky), (kx + 1, ky), (kx, ky - 1), (kx, ky + 1)):
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    nkey = ny * cols + nx
+                    if nkey not in queued:
+                        queued.add(nkey)
+                        heapq.heappush(buckets, (self._bound(nkey, x, y), nkey))
+        found.sort(key=lambda item: item[:2], reverse=True)
+        return [(-item[0], item[2]) for item in found]
+
+    def within(self, pos, radius, types=None, where=None):
+        """(distance, record) pairs within Manhattan radius of pos, nearest first."""
+        x, y = pos["x"], pos["y"]
+        size, cols = self.size, self._cols
+        bx0, bx1 = max(x - radius, 0) // size, min(x + radius, self.width - 1) // size
+        by0, by1 = max(y - radius, 0) // size, min(y + radius, self.height - 1) // size
+        hits = []
+        for obj_type in (types or self.types):
+            buckets = self._buckets.get(obj_type)
+            if not buckets:
+                continue
+            for by in range(by0, by1 + 1):
+                for bx in range(bx0, bx1 + 1):
+                    key = by * cols + bx
+                    items = buckets.get(key)
+                    if not items or self._bound(key, x, y) > radius:
+                        continue
+                    for seq, record in items:
+                        rx, ry = record.position
+                        distance = abs(rx - x) + abs(ry - y)
+                        if distance <= radius and (where is None or where(record)):
+                            hits.append((distance, seq, record))
+        hits.sort(key=lambda item: item[:2])
+        return [(distance, record) for distance, _, record in hits]
+
+    def __len__(self):
+        return sum(len(items) for buckets in self._buckets.values() for items in buckets.values())
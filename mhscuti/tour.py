@@ -0,0 +1,132 @@
+import time
+from collections import namedtuple
+
+from mhscuti.multi_target import MultiTargetBFS
+
+Tour = namedtuple("Tour", "stops points moves rate complete")
+Tour.__doc__ = """An ordered trip: stops (diamond records) in visiting order, then base.
+
+points is what the stops add to the inventory, moves the whole trip
+including the walk to base, rate the points per move delivered at base
+(carried points included). complete is False when the time budget cut
+the search short and the tour is the best found until then.
+"""
+
+
+class TourPlanner:
+    """Chooses the next few diamonds as one trip that ends at base.
+
+    A single-step greedy pick ignores what comes after it: the diamond it
+    picks may leave the bot far from the rest, or a red diamond may not
+    fit the last free slot. This plans whole trips instead: ordered tours
+    of candidate diamonds whose points fit the free inventory (a red
+    diamond takes two slots), scored by delivered points per move, walk
+    to base included. Distances between stops are exact BFS distances on
+    the routing graph, so teleporters count.
+
+    The search is a beam search over partial tours, one diamond added per
+    level. Of the partial tours that end on the same diamond with the
+    same set visited only the shortest is kept (the DP dominance rule), and
+    only the beam_width best by rate go to the next level. budget_ms is
+    checked inside every distance BFS (a far or walled-off candidate can
+    otherwise flood the board) and after every beam level; when it runs
+    out the best tour found so far is returned. The bot only walks to the
+    first stop and plans again from there.
+    """
+
+    def __init__(self, candidates=8, beam_width=8, budget_ms=5.0, clock=time.perf_counter):
+        self.candidates = candidates
+        self.beam_width = beam_width
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self.planned = 0
+        self.cut_short = 0
+
+    def plan(self, grid, graph, start, stops, start_distances, base_distance, free, carried=0, spent=0):
+        """Best Tour from start over stops, or None when no trip is worth making.
+
+        stops are the candidate records (best first); start_distances their
+        walking distances from start (None: not reached). base_distance(pos)
+        is the walking distance from pos to base, or None if unreachable.
+        carried points were collected on this trip in spent moves so far;
+        both count in the rate, so a half-done trip isn't judged as if its
+        points came for free.
+        """
+        deadline = self.clock() + self.budget_ms / 1000.0
+        self.planned += 1
+        complete = True
+
+        # Kandidat: terjangkau dan muat di sisa inventory
+        picks = [(record, d) for record, d in zip(stops, start_distances)
+                 if d is not None and record.points <= free][:self.candidates]
+        records = [record for record, _ in picks]
+        first = [d for _, d in picks]
+        points = [record.points for record in records]
+        to_base = [base_distance(record.position) for record in records]
+
+        # Jarak antar kandidat: satu BFS per kandidat yang berhenti begitu semua
+        # kandidat lain sudah pasti, atau begitu waktu habis (jarak yang belum
+        # pasti = tidak terjangkau). Sisa kandidat lalu dibuang (urutan kandidat =
+        # urutan skor, jadi yang terbaik dihitung duluan)
+        stop = lambda: self.clock() > deadline
+        between = []
+        for record in records:
+            if between and stop():
+                complete = False
+                break
+            reach = MultiTargetBFS(grid, record.position, [r.position for r in records], graph=graph, stop=stop)
+            between.append(reach.distances)
+            if reach.truncated:
+                complete = False
+                break
+        n = len(between)
+
+        home = base_distance(start)
+        best = None
+        if carried > 0 and home:
+            best = Tour([], 0, home, carried / (spent + home), complete)
+
+        # Beam: (moves, poin, slot terpakai, terakhir, mask, urutan)
+        beam = [(0, 0, 0, -1, 0, ())]
+        while beam:
+            children = {}
+            for moves, gained, used, last, mask, order in beam:
+                for j in range(n):
+                    bit = 1 << j
+                    if mask & bit or used + points[j] > free:
+                        continue
+                    leg = first[j] if last < 0 else between[last][j]
+                    if leg is None:
+                        continue
+                    key = (mask | bit, j)
+                    child = (moves + leg, gained + points[j], used + points[j], j, mask | bit, order + (j,))
+                    if key not in children or child[0] < children[key][0]:
+                        children[key] = child
+
+            ranked = []
+            for child in children.values():
+                moves, gained, _, last, _, order = child
+                if to_base[last] is None:
+                    # Tidak bisa pulang dari sini, tapi mungkin lewat diamond lain
+                    ranked.append((-1.0, -moves, child))
+                    continue
+                total = moves + to_base[last]
+                rate = (carried + gained) / max(spent + total, 1)
+                ranked.append((rate, -moves, child))
+                if best is None or rate > best.rate:
+                    best = Tour([records[i] for i in order], gained, total, rate, complete)
+            ranked.sort(key=lambda item: item[:2], reverse=True)
+            beam = [child for _, _, child in ranked[:self.beam_width]]
+
+            if beam and self.clock() > deadline:
+                complete = False
+                break
+
+        if not complete:
+            self.cut_short += 1
+            if best is not None:
+                best = best._replace(complete=False)
+        return best
+
+    def stats(self):
+        return {"planned": self.planned, "cut_short": self.cut_short}
@@ -0,0 +1,54 @@
+DEFAULT_HEADERS = {
+    "accept": "application/json",
+    "Content-Type": "application/json"
+}
+
+
+class HttpTransport:
+    """Keep-alive HTTP transport shared by every bot client.
+
+    One requests.Session per transport, so join/move/board/bot calls reuse
+    pooled TCP (and TLS, for the pinggy tunnels) connections instead of
+    opening a new one per request.
+    """
+
+    def __init__(self, pool_size=4, timeout=5.0, retries=0, headers=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, timeout=None):
+        return self.session.get(url, timeout=timeout or self.timeout)
+
+    def post(self, url, payload, timeout=None):
+        return self.session.post(url, json=payload, timeout=timeout or self.timeout)
+
+    def close(self):
+        self.session.close()
+
+
+_shared = None
+
+
+def shared_transport(**kwargs):
+    """Process-wide transport; kwargs only apply when it is first created."""
+    global _shared
+    if _shared is None:
+        _shared = HttpTransport(**kwargs)
+    return _shared
+
+
+def make_transport(fast=False, **kwargs):
+    """Transport for a bot client: shared requests pool, or the raw socket one."""
+    if fast:
+        from mhscuti.fast_transport import RawHttpTransport
+        return RawHttpTransport(**kwargs)
+    return shared_transport(**kwargs)
@@ -1,13 +1,35 @@
-import requests
 import time
-import json
-import copy
 import os
+import sys
 import random
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.anytime import AnytimePlanner
+from mhscuti.board_state import BASE, BUTTON, DIAMOND, TELEPORT, BoardState
+from mhscuti.candidates import CandidateIndex
+from mhscuti.clock import RealClock
+from mhscuti.decoding import make_decoder
+from mhscuti.distance_field import LandmarkFields
+from mhscuti.pacing import MovePacer
+from mhscuti.records import GameObject, Position
+from mhscuti.replanner import REPAIRED, TARGET_GONE, UNREACHABLE, PathMonitor
+from mhscuti.routing import Router
+from mhscuti.scoring import GREEDY_VALUE, HOME
+from mhscuti.transport import make_transport
+from mhscuti.path_cache import PathCache
+from mhscuti.pathfinding import find_path, is_reachable
+
 class BotClient:
-    def __init__(self, api_base_url, bot_id, move_delay=0.2):
+    # BFS horizons of the anytime planning rounds; None is the full search
+    PLAN_HORIZONS = (8, 16, 32, 64, 128, None)
+
+    def __init__(self, api_base_url, bot_id, move_delay=0.5, transport=None, fast_transport=False, clock=None,
+                 selective_radius=None, candidate_radius=None, plan_deadline_ms=None):
         self.base_url = f"{api_base_url}/bots/{bot_id}"
+        self.clock = clock or RealClock()  # VirtualClock makes the pacing sleeps instant
+        # Pooled keep-alive HTTP; fast_transport uses the raw socket transport instead
+        self.transport = transport or make_transport(fast_transport)
         self.api_base_url = api_base_url
         self.bot_id = bot_id
         self.headers = {
@@ -16,14 +38,31 @@ class BotClient:
         }
         self.bot_position = None
         self.game_objects = []
+        self.board = BoardState()  # Indexed snapshot of the latest response
+        self.board_width = None    # Board size from the join response
+        self.board_height = None
         self.my_name = "randyGG"
         self.log_file_path = "Randy/bot_log.txt"
         self.home_position = None  # Store spawn position
         self.diamond_visits = 0    # Track diamond visits
-        self.move_delay = move_delay  # Configurable move delay
-        self.cache = {}  # For caching pathfinding results
+        self.cache = PathCache()  # LRU of A* results, reset when walls/teleports change
+        self.landmarks = LandmarkFields()  # BFS fields toward base/teleporters/button
+        self.router = Router()  # Teleport-aware routing graph, rebuilt per layout
+        self.candidates = CandidateIndex(GREEDY_VALUE)  # Diamonds + greedy weights, updated from deltas
+        # On very large boards, only score diamonds within this Manhattan radius (None: all)
+        self.candidate_radius = candidate_radius
+        # plan_deadline_ms: pick targets with the anytime planner, which returns the best
+        # ranking found by then instead of the full search (None: always search fully)
+        self.anytime = None
+        if plan_deadline_ms is not None:
+            self.anytime = AnytimePlanner(self.refine_targets, plan_deadline_ms)
         self.diamond_targets_history = set()  # Track diamonds we've targeted
-        self.minimum_server_delay = 0.1  # Will be updated from server
+        self.minimum_server_delay = None  # Seconds, from the board's minimumDelayBetweenMoves
+        # Fires each move at the earliest legal moment; move_delay until the server delay is known
+        self.pacer = MovePacer(fallback_delay=move_delay, clock=self.clock)
+        # orjson/ujson when installed; selective_radius=N re-decodes only changed
+        # diamonds and changed objects within N steps, far ones are left out
+        self.decoder = make_decoder(selective_radius)
         
         os.makedirs("Randy", exist_ok=True)
         with open(self.log_file_path, "a") as log_file:
@@ -35,30 +74,40 @@ class BotClient:
             "preferredBoardId": preferred_board_id,
             "name": self.my_name  # Make sure name is being sent properly
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        try:
+            response = self.transport.post(url, payload)
+        except Exception as e:
+            # Timeout or dropped connection: the join failed
+            print(f"Exception during join: {e}")
+            return False
         print(f"Join response: {response.status_code}")
         
         try:
-            data = response.json()
+            data = self.decoder.decode_response(response, full=True)
             if "statusCode" in data and data["statusCode"] >= 400:
                 print("Error joining game:", data)
                 return False
             
             # Process initial game state
-            print(json.dumps(data, indent=4))
-            self.game_objects = data.get("gameObjects", [])
+            print(f"Joined board {data.get('id')}: {data.get('width')}x{data.get('height')}, "
+                  f"{len(data.get('gameObjects', []))} objects")
+            if data.get("minimumDelayBetweenMoves") is not None:
+                self.minimum_server_delay = data["minimumDelayBetweenMoves"] / 1000
+                self.pacer.set_min_delay(self.minimum_server_delay)
+            self.board_width = data.get("width")
+            self.board_height = data.get("height")
+            self.update_board(data)
             bot_obj = self.find_bot()
             
             # Make sure the bot ID is properly stored from the server response
-            for obj in self.game_objects:
-                if obj.get("type") == "BotGameObject" and obj.get("properties", {}).get("name") == self.my_name:
-                    self.bot_id = obj.get("id")  # Update bot_id from server
-                    print(f"Updated bot ID to: {self.bot_id}")
-                    break
+            obj = self.board.bot_by_name(self.my_name)
+            if obj is not None:
+                self.bot_id = obj.get("id")  # Update bot_id from server
+                print(f"Updated bot ID to: {self.bot_id}")
             
             # Store spawn/home position
             if self.bot_position:
-                self.home_position = copy.deepcopy(self.bot_position)
+                self.home_position = self.bot_position
                 print(f"Home position set to: {self.home_position}")
                 with open(self.log_file_path, "a") as log_file:
                     log_file.write(f"Home position: ({self.home_position['x']}, {self.home_position['y']})\n")
@@ -75,34 +124,37 @@ class BotClient:
                 log_file.write(f"Total diamonds: {total_diamonds} (high value: {high_value_diamonds})\n")
                 
                 # Sort diamonds by value and distance
-                sorted_diamonds = sorted(diamonds, key=lambda d: (-d.get('points', 1), d.get('distance', 999)))
+                distance = lambda d: self.manhattan_distance(self.bot_position, d.position) if self.bot_position else 999
+                sorted_diamonds = sorted(diamonds, key=lambda d: (-d.points, distance(d)))
                 
                 for i, diamond in enumerate(sorted_diamonds):
-                    points = diamond.get('points', 1)
-                    pos = diamond.get('position', {})
-                    distance = diamond.get('distance', 'unknown')
-                    log_file.write(f"Diamond {i+1}: {points} points at ({pos.get('x')},{pos.get('y')}) - distance: {distance}\n")
+                    pos = diamond.position
+                    log_file.write(f"Diamond {i+1}: {diamond.points} points at ({pos.x},{pos.y}) - distance: {distance(diamond)}\n")
             
             # Also display teleporters
             teleporters = self.get_teleporters()
             if teleporters:
                 print(f"Found {len(teleporters)} teleporters")
                 for tp in teleporters:
-                    pos = tp.get('position', {})
-                    pair_id = tp.get('pairId', 'unknown')
-                    print(f"Teleporter with ID {pair_id} at ({pos.get('x')},{pos.get('y')})")
+                    print(f"Teleporter with ID {tp.pair_id} at ({tp.position.x},{tp.position.y})")
                     
             # Check for diamond button
             diamond_button = self.get_diamond_button()
             if diamond_button:
-                pos = diamond_button.get('position', {})
-                print(f"Diamond button found at ({pos.get('x')},{pos.get('y')})")
+                print(f"Diamond button found at ({diamond_button.position.x},{diamond_button.position.y})")
             
             # Find base position
             base_obj = self.get_my_base()
             if base_obj:
-                pos = base_obj.get('position', {})
-                print(f"Base located at ({pos.get('x')},{pos.get('y')})")
+                print(f"Base located at ({base_obj.position.x},{base_obj.position.y})")
+            
+            # Landmarks never move: build their distance fields once up front
+            landmarks = [tp.position for tp in teleporters]
+            if diamond_button:
+                landmarks.append(diamond_button.position)
+            if base_obj:
+                landmarks.append(base_obj.position)
+            self.landmarks.prepare(landmarks)
                 
             return True
         except Exception as e:
@@ -110,31 +162,39 @@ class BotClient:
             print(response.text)
             return False
 
+    def update_board(self, data):
+        # Index the response once (diffed against the previous one, so only changed
+        # objects are re-indexed); every accessor below reads from it
+        self.board = BoardState(data, self.board_width, self.board_height, previous=self.board)
+        self.game_objects = self.board.objects
+        self.cache.sync(self.board)
+        self.candidates.sync(self.board)
+        self.landmarks.sync(self.board, self.router.sync(self.board))
+
     def find_bot(self):
         # Cari bot kita sendiri dan simpan posisi
-        for obj in self.game_objects:
-            if obj.get("type") == "BotGameObject":
-                self.bot_position = obj.get("position")
-                self.my_name = obj.get("properties", {}).get("name", self.my_name)
-                
-                # Log inventory details
-                if "properties" in obj and "inventory" in obj["properties"]:
-                    inventory = obj["properties"]["inventory"]
-                    print(f"Bot inventory: {len(inventory)} items: {inventory}")
-                
-                print(f"Bot found at position: {self.bot_position} with name: {self.my_name}")
-                return obj
+        obj = self.board.first_bot()
+        if obj is not None:
+            self.bot_position = Position.of(obj.get("position"))
+            self.my_name = obj.get("properties", {}).get("name", self.my_name)
+            
+            # Log inventory details
+            if "properties" in obj and "inventory" in obj["properties"]:
+                inventory = obj["properties"]["inventory"]
+                print(f"Bot inventory: {len(inventory)} items: {inventory}")
+            
+            print(f"Bot found at position: {self.bot_position} with name: {self.my_name}")
+            return obj
         print("Bot not found in game objects.")
         self.bot_position = None
         return None
 
     def get_my_base(self):
-        # Cari base bot
-        for obj in self.game_objects:
-            if obj.get("type") == "BaseGameObject" and "properties" in obj:
-                if obj["properties"].get("ownerId") == self.bot_id:
-                    return obj
-        return None
+        # Cari base bot, as its immutable record
+        obj = self.board.base_of(self.bot_id)
+        if obj is None:
+            return None
+        return next((r for r in self.board.records(BASE) if r.id == obj.get("id")), None)
 
     def get_inventory_info(self):
         # Get inventory count and size
@@ -151,141 +211,48 @@ class BotClient:
     def manhattan_distance(p1, p2):
         return abs(p1['x'] - p2['x']) + abs(p1['y'] - p2['y'])
 
+    # Targets are immutable GameObject records (.id, .type, .position, .points),
+    # built once per board snapshot rather than as fresh dicts on every call
     def get_diamonds(self):
-        diamonds = []
-        for obj in self.game_objects:
-            if obj.get("type") == "DiamondGameObject":
-                points = obj.get("properties", {}).get("points", 1)
-                diamonds.append({
-                    "id": obj["id"],
-                    "position": obj["position"],
-                    "points": points,
-                    "distance": self.manhattan_distance(self.bot_position, obj["position"]),
-                    "type": "DiamondGameObject",
-                    "is_red": points > 1
-                })
-        return diamonds
+        return self.board.records(DIAMOND)
+
+    def get_nearby_diamonds(self):
+        # Ids of the diamonds within candidate_radius, from the board's spatial bucket
+        # index (no distance to every diamond); the closest few if none is that near
+        if self.candidate_radius is None or self.bot_position is None:
+            return None
+        spatial = self.board.spatial
+        nearby = (spatial.within(self.bot_position, self.candidate_radius, (DIAMOND,))
+                  or spatial.nearest(self.bot_position, 8, (DIAMOND,)))
+        return [d.id for _, d in nearby]
 
     def get_diamond_button(self):
-        for obj in self.game_objects:
-            if obj.get("type") == "DiamondButtonGameObject":
-                return {
-                    "id": obj["id"],
-                    "position": obj["position"],
-                    "distance": self.manhattan_distance(self.bot_position, obj["position"]),
-                    "type": "DiamondButtonGameObject"
-                }
-        return None
+        buttons = self.board.records(BUTTON)
+        return buttons[0] if buttons else None
 
     def get_teleporters(self):
-        teleporters = []
-        for obj in self.game_objects:
-            if obj.get("type") == "TeleportGameObject":
-                teleporters.append({
-                    "id": obj["id"],
-                    "position": obj["position"],
-                    "pairId": obj.get("properties", {}).get("pairId", ""),
-                    "distance": self.manhattan_distance(self.bot_position, obj["position"]),
-                    "type": "TeleportGameObject"
-                })
-        return teleporters
+        return self.board.records(TELEPORT)
 
     def count_diamonds(self):
-        total = 0
-        high_value = 0
-        for obj in self.game_objects:
-            if obj.get("type") == "DiamondGameObject":
-                total += 1
-                points = obj.get("properties", {}).get("points", 1)
-                if points > 1:
-                    high_value += 1
-        return total, high_value
+        return self.board.diamond_counts
 
     def is_diamond_at_position(self, position):
-        for obj in self.game_objects:
-            if obj.get("type") == "DiamondGameObject" and obj.get("position", {}).get("x") == position["x"] and obj.get("position", {}).get("y") == position["y"]:
-                return True
-        return False
+        return self.board.grid.is_diamond(position["x"], position["y"])
 
     def is_tile_walkable(self, position):
-        for obj in self.game_objects:
-            if obj.get("type") == "WallGameObject" and obj.get("position", {}).get("x") == position["x"] and obj.get("position", {}).get("y") == position["y"]:
-                return False
-        return True
+        return not self.board.grid.is_wall(position["x"], position["y"])
 
     def a_star_path(self, start, goal):
         """A* pathfinding algorithm implementation"""
-        # Priority queue for open nodes
-        open_set = []
-        # Dict to store the cost from start to each node
-        g_score = {f"{start['x']},{start['y']}": 0}
-        # Dict to store estimated total cost from start to goal through node
-        f_score = {f"{start['x']},{start['y']}": self.manhattan_distance(start, goal)}
-        
-        # Add start point to open set with its f_score as priority
-        import heapq
-        heapq.heappush(open_set, (f_score[f"{start['x']},{start['y']}"], f"{start['x']},{start['y']}"))
-        
-        # Dict to store the most efficient previous step
-        came_from = {}
+        path = self.cache.get(start, goal)
+        if path is not None:
+            return path
         
-        while open_set:
-            # Get node with lowest f_score
-            _, current = heapq.heappop(open_set)
-            x, y = map(int, current.split(','))
-            current_pos = {'x': x, 'y': y}
-            
-            # If reached goal, construct the path
-            if x == goal['x'] and y == goal['y']:
-                path = []
-                while current in came_from:
-                    prev = came_from[current]
-                    prev_x, prev_y = map(int, prev.split(','))
-                    
-                    # Determine direction
-                    if prev_x < x:
-                        path.append("EAST")
-                    elif prev_x > x:
-                        path.append("WEST")
-                    elif prev_y < y:
-                        path.append("SOUTH")
-                    elif prev_y > y:
-                        path.append("NORTH")
-                        
-                    current = prev
-                    x, y = prev_x, prev_y
-                
-                # Reverse to get from start to goal
-                path.reverse()
-                return path
-            
-            # Check all valid neighbors
-            neighbors = [
-                ("EAST", {'x': x + 1, 'y': y}),
-                ("WEST", {'x': x - 1, 'y': y}),
-                ("SOUTH", {'x': x, 'y': y + 1}),
-                ("NORTH", {'x': x, 'y': y - 1})
-            ]
-            
-            # Filter out unwalkable tiles
-            neighbors = [n for n in neighbors if self.is_tile_walkable(n[1])]
-            
-            for _, neighbor in neighbors:
-                neighbor_str = f"{neighbor['x']},{neighbor['y']}"
-                
-                # Calculate tentative g_score
-                tentative_g_score = g_score[f"{x},{y}"] + 1
-                
-                # If this path to neighbor is better than previous one
-                if neighbor_str not in g_score or tentative_g_score < g_score[neighbor_str]:
-                    # Record this path
-                    came_from[neighbor_str] = f"{x},{y}"
-                    g_score[neighbor_str] = tentative_g_score
-                    f_score[neighbor_str] = tentative_g_score + self.manhattan_distance(neighbor, goal)
-                    
-                    # Add to open set if not already in
-                    if not any(neighbor_str == item[1] for item in open_set):
-                        heapq.heappush(open_set, (f_score[neighbor_str], neighbor_str))
+        # Routed over the teleport-aware graph, so teleporters are used too
+        path = find_path(self.board.grid, start, goal, self.router.graph)
+        if path is not None:
+            self.cache.put(start, goal, path)
+            return path
         
         # If no path found, return empty list
         print("No path found with A* algorithm")
@@ -293,6 +260,18 @@ class BotClient:
 
     # Replace path_to_target with this improved version
     def path_to_target(self, start, target):
+        # Walled-off or off-board targets fail fast instead of random walking;
+        # regions joined by a teleporter pair count as reachable
+        if not is_reachable(self.board.grid, start, target, self.router.graph):
+            print(f"Target {target} is unreachable")
+            return []
+        
+        # Landmarks (base, teleporters, button) are read off their distance field
+        if self.landmarks.has(target):
+            path = self.landmarks.path(start, target)
+            if path is not None:
+                return path
+        
         # Try A* algorithm first
         path = self.a_star_path(start, target)
         if path:
@@ -304,8 +283,10 @@ class BotClient:
         x, y = start['x'], start['y']
         tx, ty = target['x'], target['y']
         
-        # Simple direction generation that avoids obstacles
-        while x != tx or y != ty:
+        # Simple direction generation that avoids obstacles,
+        # capped at one step per tile so it always terminates
+        max_steps = self.board.grid.width * self.board.grid.height
+        while (x != tx or y != ty) and len(directions) < max_steps:
             possible_moves = []
             
             if x < tx:
@@ -348,23 +329,29 @@ class BotClient:
             
         return directions
 
-    def move(self, direction):
+    def move(self, direction, retries=2):
         url = f"{self.base_url}/move"
         payload = {
             "direction": direction,
             "botId": self.bot_id  # Include your bot ID in every move
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        self.pacer.wait()
+        try:
+            response = self.transport.post(url, payload)
+        except Exception as e:
+            # Timeout or dropped connection: treat it as a failed move
+            print(f"Move failed: {e}")
+            return False
+        self.pacer.record(response.status_code)
+        if response.status_code == 429 and retries > 0:
+            # Too early: the pacer has widened its margin, try again
+            return self.move(direction, retries - 1)
         
         try:
-            data = response.json()
+            data = self.decoder.decode_response(response)
             
             # Check if we're about to step on a diamond
-            expected_pos = copy.deepcopy(self.bot_position)
-            if direction == "NORTH": expected_pos["y"] -= 1
-            elif direction == "SOUTH": expected_pos["y"] += 1
-            elif direction == "EAST": expected_pos["x"] += 1
-            elif direction == "WEST": expected_pos["x"] -= 1
+            expected_pos = self.bot_position.step(direction)
             
             # Track if we're stepping on a diamond
             was_diamond = self.is_diamond_at_position(expected_pos)
@@ -372,7 +359,7 @@ class BotClient:
                 print(f"About to collect diamond at {expected_pos}")
             
             # Important: Update game objects from response first
-            self.game_objects = data.get("gameObjects", [])
+            self.update_board(data)
             # Then find bot to update position AND inventory data
             bot_obj = self.find_bot()
             
@@ -395,48 +382,53 @@ class BotClient:
             print(f"Move failed: {e}")
             return False
 
-    def calculate_greedy_value(self, item, inventory_count, inventory_size, has_red_button=False):
-        distance = self.manhattan_distance(self.bot_position, item['position'])
-        
-        # If we've visited 5 diamonds, prioritize returning home
-        if self.diamond_visits >= 5 and item.get('is_home', False):
-            return 200 / (distance + 1)
-        
-        if item['type'] == 'DiamondGameObject':
-            points = item.get('points', 1)
-            # Prioritize high-value diamonds more strongly
-            if points > 1:
-                return (10 * points) / (distance + 1)
-            return 2.0 / (distance + 1)
-        
-        elif item['type'] == 'DiamondButtonGameObject':
-            if has_red_button:
-                return 7 / (distance + 1)
-            return 0
-        
-        elif item['type'] == 'BaseGameObject':
-            if inventory_count >= inventory_size:
-                return 100 / (distance + 1)
-            elif inventory_count > 0:
-                return (inventory_count * 3) / (distance + 1)
-            return 0
-        
-        elif item['type'] == 'TeleportGameObject':
-            return 1 / (distance + 1)
-        
-        return 0
+    def random_step(self):
+        # Random move to an open neighbour: bumping into a wall gets an error reply
+        # without game objects, which would lose track of the bot's position
+        if self.bot_position is None:
+            return False
+        grid = self.board.grid
+        open_dirs = [d for d in ("NORTH", "SOUTH", "EAST", "WEST")
+                     if grid.in_bounds(*self.bot_position.step(d)) and self.is_tile_walkable(self.bot_position.step(d))]
+        if not open_dirs:
+            return False
+        return self.move(random.choice(open_dirs))
+
+    def refine_targets(self, stop, grid, graph, start, extra, indexed, only):
+        # Anytime rounds: the two best targets within a BFS horizon that doubles each
+        # round, ending with the full search. One BFS resumes across the rounds and
+        # checks stop() as it goes; each ranking is exact for what it reached
+        return self.candidates.refine(grid, start, self.PLAN_HORIZONS, k=2, graph=graph, extra=extra,
+                                      indexed=indexed, only=only, stop=stop)
+
+    def steps_to(self, target, reach=None, index=None):
+        # Reuse the path from this tick's BFS (target number index) when it settled the target
+        if reach is not None and index is not None:
+            path = reach.path(index)
+            if path is not None:
+                return path
+        return self.path_to_target(self.bot_position, target.position)
 
-    def follow_path(self, directions):
-        current_pos = copy.deepcopy(self.bot_position)
-        previous_pos = current_pos
+    def follow_path(self, directions, target=None):
+        # With a target, each post-move state is checked against the plan (target
+        # still there, position as expected, no new wall) and the rest of the
+        # route is repaired with D* Lite instead of being walked blindly.
+        # Teleporters are skipped: stepping on one never leaves the bot there.
+        monitor = None
+        if target is not None and target.type != TELEPORT and \
+           self.router.graph is not None and self.bot_position is not None:
+            goal_type = DIAMOND if target.type == DIAMOND else None
+            monitor = PathMonitor(self.router.graph, self.bot_position, target.position, directions, goal_type)
+            directions = monitor.remaining
+
+        # Positions are immutable, so they are kept as they are instead of copied
+        previous_pos = self.bot_position
         
-        for direction in directions:
+        pending = list(directions)
+        while pending:
+            direction = pending[0]
             # Check if we're about to step on a diamond
-            expected_pos = copy.deepcopy(self.bot_position)
-            if direction == "NORTH": expected_pos["y"] -= 1
-            elif direction == "SOUTH": expected_pos["y"] += 1
-            elif direction == "EAST": expected_pos["x"] += 1
-            elif direction == "WEST": expected_pos["x"] -= 1
+            expected_pos = self.bot_position.step(direction)
             
             if self.is_diamond_at_position(expected_pos):
                 print(f"About to collect diamond at {expected_pos}")
@@ -444,20 +436,30 @@ class BotClient:
             if not self.move(direction):
                 return False
             
-            # Check for teleportation by comparing expected position to actual position
             new_pos = self.bot_position
-            expected_pos = copy.deepcopy(previous_pos)
-            if direction == "NORTH": expected_pos["y"] -= 1
-            elif direction == "SOUTH": expected_pos["y"] += 1
-            elif direction == "EAST": expected_pos["x"] += 1
-            elif direction == "WEST": expected_pos["x"] -= 1
+            if monitor is not None:
+                status = monitor.advance(self.board, new_pos)
+                if status == TARGET_GONE:
+                    print(f"Target at {target.position} was taken - replanning")
+                    return True
+                if status == UNREACHABLE:
+                    print(f"Target at {target.position} is no longer reachable - replanning")
+                    return True
+                if status == REPAIRED:
+                    print(f"Off plan at {new_pos} (from {previous_pos}), repaired route: {len(monitor.remaining)} steps left")
+                pending = monitor.remaining
+                previous_pos = new_pos
+                continue
+            pending = pending[1:]
+
+            # Check for teleportation by comparing expected position to actual position
+            expected_pos = previous_pos.step(direction)
             
             # If actual position is far from expected, we teleported
             if self.manhattan_distance(expected_pos, new_pos) > 1:
                 print(f"Teleportation detected from {previous_pos} to {new_pos}")
             
-            previous_pos = copy.deepcopy(new_pos)
-            time.sleep(0.5)
+            previous_pos = new_pos
         
         return True
 
@@ -472,6 +474,11 @@ class BotClient:
         last_five_targets = []
         
         while game_active:
+            # A failed move (e.g. after the session ended) leaves no bot to plan for
+            if self.bot_position is None:
+                print("Bot is no longer on the board - ending bot run")
+                break
+
             # Check if bot is stuck
             if last_positions and all(self.manhattan_distance(pos, self.bot_position) == 0 for pos in last_positions[-3:]):
                 stuck_counter += 1
@@ -485,18 +492,17 @@ class BotClient:
                     
                     if diamond_button:
                         print("Moving to diamond button to break stuck state")
-                        steps = self.path_to_target(self.bot_position, diamond_button["position"])
+                        steps = self.path_to_target(self.bot_position, diamond_button.position)
                         self.follow_path(steps)
                     elif base_obj and inventory_count > 0:
                         print("Moving to base to break stuck state")
-                        steps = self.path_to_target(self.bot_position, base_obj["position"])
+                        steps = self.path_to_target(self.bot_position, base_obj.position)
                         self.follow_path(steps)
                     else:
                         # Try random movements to break the loop
                         print("Using random movements to break stuck state")
                         for _ in range(3):
-                            random_dir = random.choice(["NORTH", "SOUTH", "EAST", "WEST"])
-                            self.move(random_dir)
+                            self.random_step()
                     
                     stuck_counter = 0
                     last_positions = []
@@ -504,11 +510,10 @@ class BotClient:
             # Update position history
             if len(last_positions) >= 5:
                 last_positions.pop(0)
-            last_positions.append(copy.deepcopy(self.bot_position))
+            last_positions.append(self.bot_position)
             
             # Get current inventory and objects
             inventory_count, inventory_size = self.get_inventory_info()
-            diamonds = self.get_diamonds()
             teleporters = self.get_teleporters()
             diamond_button = self.get_diamond_button()
             base_obj = self.get_my_base()
@@ -517,30 +522,27 @@ class BotClient:
             
             print(f"Current state: Inventory {inventory_count}/{inventory_size}, Diamonds: {total_diamonds} (high value: {high_value_diamonds}), Diamond visits: {self.diamond_visits}/5")
             
-            # Determine potential targets
+            # Determine potential targets; greedy values are kept in a parallel
+            # list since the target records are immutable. Diamonds are not listed:
+            # they stay in self.candidates, which is updated from board deltas
             potential_targets = []
+            values = []
+            diamond_count = 0
             
             # Check if we should return home after visiting 5 diamonds
             if self.diamond_visits >= 5 and self.home_position:
                 print(f"Visited 5 diamonds - returning to home at {self.home_position}")
-                home_target = {
-                    "id": "home",
-                    "position": self.home_position,
-                    "type": "HomePosition",
-                    "is_home": True,
-                    "distance": self.manhattan_distance(self.bot_position, self.home_position),
-                    "greedy_value": 200 / (self.manhattan_distance(self.bot_position, self.home_position) + 1)
-                }
-                potential_targets.append(home_target)
+                potential_targets.append(GameObject("home", HOME, self.home_position, {}))
+                values.append(200 / (self.manhattan_distance(self.bot_position, self.home_position) + 1))
             # Normal targeting logic
             elif inventory_count >= inventory_size and base_obj:
                 print("Inventory full - prioritizing base")
-                base_obj["greedy_value"] = 100
                 potential_targets.append(base_obj)
+                values.append(100)
             else:
-                if inventory_count < inventory_size and diamonds:
-                    print(f"Adding {len(diamonds)} diamonds as potential targets")
-                    potential_targets.extend(diamonds)
+                if inventory_count < inventory_size and self.candidates:
+                    diamond_count = len(self.candidates)
+                    print(f"Adding {diamond_count} diamonds as potential targets")
                 
                 if base_obj and inventory_count > 0:
                     print("Adding base as potential target")
@@ -554,57 +556,89 @@ class BotClient:
                     print(f"Adding {len(teleporters)} teleporters as potential targets")
                     potential_targets.extend(teleporters)
                 
-                if not potential_targets and inventory_count > 0 and base_obj:
+                if not potential_targets and not diamond_count and inventory_count > 0 and base_obj:
                     print("No primary targets - adding base due to having items in inventory")
                     potential_targets.append(base_obj)
                 
-                if not potential_targets and diamond_button:
+                if not potential_targets and not diamond_count and diamond_button:
                     print("No primary targets - adding diamond button as fallback")
                     potential_targets.append(diamond_button)
 
+            # One BFS from the bot gives the true walking distance and path to every
+            # target; it stops once the two best (chosen + alternate) are settled
+            reach = None
+            
             # Calculate value for each target (except for home which is already calculated)
             if not (inventory_count >= inventory_size and base_obj) and not (self.diamond_visits >= 5 and self.home_position):
-                for target in potential_targets:
-                    if not target.get('is_home', False):  # Skip home target
-                        has_red_button = (diamond_button is not None)
-                        target["greedy_value"] = self.calculate_greedy_value(
-                            target, inventory_count, inventory_size, has_red_button
-                        )
-            
-            # Sort targets by value
-            potential_targets.sort(key=lambda t: t.get("greedy_value", 0), reverse=True)
+                has_red_button = (diamond_button is not None)
+                # Every greedy value is weight / (distance + 1) (the "greedy_value" preset).
+                # Diamond weights are cached in the
+                # index; the other targets depend on inventory and button, so they're
+                # weighed here. The BFS scores only what it reaches, and targets it never
+                # reaches are unreachable or can't make the top two: value 0
+                weights = GREEDY_VALUE.weights(
+                    [t.points for t in potential_targets], [t.type for t in potential_targets],
+                    inventory=inventory_count, inventory_size=inventory_size,
+                    has_red_button=has_red_button, diamond_visits=self.diamond_visits)
+                extra = list(zip(potential_targets, weights.tolist()))
+                if self.anytime is not None:
+                    answer = self.anytime.plan(self.board.grid, self.router.graph, self.bot_position,
+                                               extra, diamond_count > 0, self.get_nearby_diamonds())
+                    reach = answer.decision
+                    if answer.stale:
+                        # Nothing finished before the deadline: reuse the last plan's targets
+                        # that are still on the board; its BFS paths start elsewhere
+                        print("Planner missed the deadline - reusing the last plan")
+                        potential_targets, values = [], []
+                        for target, value in zip(reach.targets, reach.values) if reach else ():
+                            obj = self.board.get(target.id)
+                            if obj is not None and Position.of(obj["position"]) == target.position:
+                                potential_targets.append(target)
+                                values.append(value)
+                        reach = None
+                        if not potential_targets:
+                            print("No usable cached plan - using random movement")
+                            self.random_step()
+                            continue
+                else:
+                    reach = self.candidates.select(
+                        self.board.grid, self.bot_position, k=2, graph=self.router.graph,
+                        extra=extra, indexed=diamond_count > 0, only=self.get_nearby_diamonds())
+                # Only the best two targets are kept, best first (ties keep board
+                # order, diamonds first)
+                if reach is not None:
+                    potential_targets, values = reach.targets, reach.values
             
             if not potential_targets:
                 print("No potential targets available - ending bot run")
                 game_active = False
                 break
                 
-            best_target = potential_targets[0]
-            print(f"Selected target: {best_target.get('type')} at position {best_target.get('position')} with value {best_target.get('greedy_value')}")
-            steps = self.path_to_target(self.bot_position, best_target["position"])
+            best = 0
+            best_target = potential_targets[best]
+            print(f"Selected target: {best_target.type} at position {best_target.position} with value {values[best]}")
+            steps = self.steps_to(best_target, reach, best)
             
             if not steps:
                 print("No path to target found - trying another target")
                 if len(potential_targets) > 1:
-                    best_target = potential_targets[1]
-                    print(f"Selected alternate target: {best_target.get('type')}")
-                    steps = self.path_to_target(self.bot_position, best_target["position"])
+                    best = 1
+                    best_target = potential_targets[best]
+                    print(f"Selected alternate target: {best_target.type}")
+                    steps = self.steps_to(best_target, reach, best)
                 else:
                     # No viable paths, try random movement
                     print("No alternate targets - using random movement")
-                    random_dir = random.choice(["NORTH", "SOUTH", "EAST", "WEST"])
-                    self.move(random_dir)
+                    self.random_step()
                     continue
             
-            if not self.follow_path(steps):
+            if not self.follow_path(steps, best_target):
                 print("Failed to follow path - bot might be blocked")
                 game_active = False
                 break
 
             # If we reached home after 5 diamond visits, reset the counter
-            if self.diamond_visits >= 5 and self.home_position and self.bot_position and \
-               self.bot_position.get('x') == self.home_position.get('x') and \
-               self.bot_position.get('y') == self.home_position.get('y'):
+            if self.diamond_visits >= 5 and self.home_position and self.bot_position == self.home_position:
                 print("Reached home after visiting 5 diamonds - resetting counter")
                 self.diamond_visits = 0
 
@@ -617,18 +651,24 @@ class BotClient:
                         print("Bot appears to be in a larger pattern loop - exploring randomly")
                         # Try some random movement to break out
                         for _ in range(3):
-                            random_dir = random.choice(["NORTH", "SOUTH", "EAST", "WEST"])
-                            self.move(random_dir)
+                            self.random_step()
                         global_stuck_counter = 0
                         last_five_targets = []
                 else:
                     global_stuck_counter = 0
             
             if best_target:
-                last_five_targets.append(best_target.get("id", "unknown"))
+                last_five_targets.append(best_target.id)
                 if len(last_five_targets) > 5:
                     last_five_targets.pop(0)
 
+        # Planner and pacing counters, once per game rather than every tick
+        cache_stats = self.cache.stats()
+        print(f"Path cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses, epoch {cache_stats['epoch']}")
+        print(f"Pacing: {self.pacer.summary()}")
+        if self.anytime is not None:
+            print(f"Anytime planner: {self.anytime.summary()}")
+
 def main():
     # Update API URL if needed
     API_BASE_URL = "https://rngjb-182-253-63-43.a.free.pinggy.link/api"
@@ -638,7 +678,7 @@ def main():
     bot = BotClient(API_BASE_URL, BOT_ID)
     
     # Get bot info
-    bot_response = requests.get(f"{API_BASE_URL}/bots/{BOT_ID}", headers=bot.headers)
+    bot_response = bot.transport.get(f"{API_BASE_URL}/bots/{BOT_ID}")
     try:
         bot_data = bot_response.json()
         bot.my_name = bot_data.get("name", "randyGG")
@@ -646,7 +686,7 @@ def main():
         pass
     
     # Get board info
-    boards_response = requests.get(f"{API_BASE_URL}/boards", headers=bot.headers)
+    boards_response = bot.transport.get(f"{API_BASE_URL}/boards")
     board_id = 9
     try:
         boards_data = boards_response.json()
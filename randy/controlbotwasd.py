@@ -1,18 +1,28 @@
-import requests
 import time
 import json
 import os
 import msvcrt  # Windows-specific module for keyboard input
 import sys
 import colorama
+import requests
 from colorama import Fore, Back, Style
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mhscuti.clock import RealClock
+from mhscuti.transport import make_transport
+
 # Initialize colorama for colored console output
 colorama.init()
 
+# Timeouts and dropped connections, from requests or the raw socket transport
+NETWORK_ERRORS = (requests.RequestException, OSError)
+
 class ManualController:
-    def __init__(self, api_base_url, bot_id):
+    def __init__(self, api_base_url, bot_id, transport=None, fast_transport=False, clock=None):
         self.base_url = f"{api_base_url}/bots/{bot_id}"
+        self.clock = clock or RealClock()
+        self.transport = transport or make_transport(fast_transport)  # Pooled keep-alive HTTP
         self.api_base_url = api_base_url
         self.bot_id = bot_id
         self.headers = {
@@ -22,6 +32,8 @@ class ManualController:
         self.bot_position = None
         self.game_objects = []
         self.my_name = "randyGG"
+        self.board_width = 15   # Updated from the join response
+        self.board_height = 15
         self.log_file_path = "Randy/manual_control_log.txt"
         
         os.makedirs("Randy", exist_ok=True)
@@ -34,7 +46,11 @@ class ManualController:
             "preferredBoardId": preferred_board_id,
             "name": self.my_name
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        try:
+            response = self.transport.post(url, payload)
+        except NETWORK_ERRORS as e:
+            print(f"{Fore.RED}Exception during join: {e}{Style.RESET_ALL}")
+            return False
         print(f"{Fore.CYAN}Join response: {response.status_code}{Style.RESET_ALL}")
         
         try:
@@ -48,7 +64,9 @@ class ManualController:
             self.find_bot()
             
             # Print the board
-            self.print_board(data.get("width", 15), data.get("height", 15))
+            self.board_width = data.get("width", 15)
+            self.board_height = data.get("height", 15)
+            self.print_board()
             
             print(f"{Fore.GREEN}Successfully joined the game!{Style.RESET_ALL}")
             print(f"{Fore.CYAN}Board ID: {preferred_board_id}{Style.RESET_ALL}")
@@ -81,7 +99,11 @@ class ManualController:
 
     def update_game_state(self):
         url = f"{self.base_url}"
-        response = requests.get(url, headers=self.headers)
+        try:
+            response = self.transport.get(url)
+        except NETWORK_ERRORS as e:
+            print(f"{Fore.RED}Error updating game state: {e}{Style.RESET_ALL}")
+            return False
         
         try:
             data = response.json()
@@ -95,7 +117,11 @@ class ManualController:
     def move(self, direction):
         url = f"{self.base_url}/move"
         payload = {"direction": direction}
-        response = requests.post(url, json=payload, headers=self.headers)
+        try:
+            response = self.transport.post(url, payload)
+        except NETWORK_ERRORS as e:
+            print(f"{Fore.RED}Move failed: {e}{Style.RESET_ALL}")
+            return False
         
         try:
             data = response.json()
@@ -110,8 +136,10 @@ class ManualController:
             print(f"{Fore.RED}Move failed: {e}{Style.RESET_ALL}")
             return False
 
-    def print_board(self, width=15, height=15):
+    def print_board(self, width=None, height=None):
         """Print the current state of the board"""
+        width = width or self.board_width
+        height = height or self.board_height
         # Create an empty board
         board = [[' ' for _ in range(width)] for _ in range(height)]
         
@@ -214,7 +242,7 @@ class ManualController:
                     return
                 
                 # Small delay to avoid spamming the API
-                time.sleep(0.1)
+                self.clock.sleep(0.1)
 
 def main():
     # Use the same API URL and bot ID as botrandy.py
@@ -229,10 +257,9 @@ def main():
     controller = ManualController(API_BASE_URL, BOT_ID)
     
     # Get board info
-    boards_response = requests.get(f"{API_BASE_URL}/boards", headers=controller.headers)
     board_id = 9
     try:
-        boards_data = boards_response.json()
+        boards_data = controller.transport.get(f"{API_BASE_URL}/boards").json()
         if boards_data and len(boards_data) > 0:
             print(f"\nAvailable boards:")
             for i, board in enumerate(boards_data):